@@ -10,14 +10,28 @@ PulseUI - Reactライクなコンポーネントとユーティリティファ
 - クロスプラットフォーム対応（Windows、macOS、Linux）
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .core.application import Application
 from .core.window import Window
 from .core.component import Component
 from .core.renderer import Renderer
 from .components.basic import Button, Text, Input, Container
 from .styling.styles import Style, Theme
-from .animation.animator import Animator
-from .visualization.charts import Chart, LineChart, BarChart
+
+if TYPE_CHECKING:
+    from .animation.animator import Animator
+    from .visualization.charts import Chart, LineChart, BarChart
+
+# Animation and visualization exports, imported on first access so apps that
+# don't use them don't pay for loading them
+_LAZY_EXPORTS = {
+    "Animator": ".animation.animator",
+    "Chart": ".visualization.charts",
+    "LineChart": ".visualization.charts",
+    "BarChart": ".visualization.charts",
+}
 
 __version__ = "1.0.0"
 __author__ = "tikisan"
@@ -38,4 +52,14 @@ __all__ = [
     "Chart",
     "LineChart",
     "BarChart"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import a lazy export the first time it is looked up"""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
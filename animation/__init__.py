@@ -2,13 +2,16 @@
 Animation system for PulseUI
 """
 
-from .animator import Animator, Animation
-from .easing import Easing
+from .animator import Animator, Animation, MultiPropertyAnimation, KeyframeAnimation
+from .easing import Easing, EasingID
 from .transitions import Transition
 
 __all__ = [
     "Animator",
     "Animation",
+    "MultiPropertyAnimation",
+    "KeyframeAnimation",
     "Easing",
+    "EasingID",
     "Transition"
 ]
\ No newline at end of file
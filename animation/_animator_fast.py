@@ -0,0 +1,27 @@
+"""
+Compiled per-frame tick for the Animator (requires Numba)
+"""
+try:
+    from numba import njit
+except ImportError:  # Numba is an optional accelerator
+    njit = None
+
+# The Animator falls back to its NumPy path while this is None
+tick = None
+
+if njit is not None:
+    from .easing import _apply_easing
+
+    @njit(cache=True, fastmath=True)
+    def tick(start_values, end_values, durations, start_times, easing_ids, n, now, values, done):
+        """Compute progress, easing and interpolated values for the first n animations in one pass"""
+        for i in range(n):
+            progress = (now - start_times[i]) / durations[i]
+            if progress >= 1.0:
+                progress = 1.0
+                done[i] = True
+            else:
+                done[i] = False
+
+            eased = _apply_easing(easing_ids[i], progress)
+            values[i] = start_values[i] + (end_values[i] - start_values[i]) * eased
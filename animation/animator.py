@@ -2,13 +2,27 @@
 Animator - Handles animations and transitions
 """
 import time
-from typing import Dict, List, Callable, Any, Optional
+import bisect
+import functools
+import numpy as np
+from typing import Dict, List, Callable, Any, Optional, Sequence, Tuple, Union
 from .easing import Easing
 
+from ._animator_fast import tick as _fast_tick  # None without Numba
+
 
 class Animation:
     """Represents a single animation"""
     
+    __slots__ = (
+        'target', 'property_name', 'start_value', 'end_value', 'duration',
+        'easing', 'easing_id', 'on_complete', 'start_time', 'is_complete', '_easing_fn',
+        'precision', '_setter'
+    )
+    
+    # Default progress step is one frame at this rate
+    PRECISION_FPS = 60
+    
     def __init__(self, 
                  target: Any,
                  property_name: str,
@@ -16,7 +30,8 @@ class Animation:
                  end_value: float,
                  duration: float,
                  easing: str = 'ease_in_out',
-                 on_complete: Optional[Callable] = None):
+                 on_complete: Optional[Callable] = None,
+                 precision: Optional[float] = None):
         self.target = target
         self.property_name = property_name
         self.start_value = start_value
@@ -24,28 +39,47 @@ class Animation:
         self.duration = duration
         self.easing = easing
         self.on_complete = on_complete
+        self.easing_id = Easing.get_id(easing)
+        self._easing_fn = Easing.TABLE[self.easing_id]
+        self._setter = self._bind_setter(target, property_name)
         
-        self.start_time = time.time()
+        # Smallest progress change (0..1) the Animator schedules a write for
+        if precision is None:
+            precision = 1.0 / max(1, int(duration * self.PRECISION_FPS))
+        self.precision = precision
+        
+        self.start_time = time.monotonic()
         self.is_complete = False
         
-    def update(self) -> bool:
+    @staticmethod
+    def _bind_setter(target: Any, property_name: str) -> Optional[Callable[[Any], None]]:
+        """Bind a setter for the target property, or None if the target lacks it"""
+        if not hasattr(target, property_name):
+            return None
+            
+        # Call data descriptors (properties, slots) directly
+        descriptor = getattr(type(target), property_name, None)
+        if hasattr(descriptor, '__set__'):
+            return functools.partial(descriptor.__set__, target)
+        return functools.partial(setattr, target, property_name)
+        
+    def update(self, now: Optional[float] = None) -> bool:
         """Update the animation and return True if still running"""
         if self.is_complete:
             return False
             
-        current_time = time.time()
+        current_time = time.monotonic() if now is None else now
         elapsed = current_time - self.start_time
         progress = min(elapsed / self.duration, 1.0)
         
         # Apply easing
-        eased_progress = Easing.apply(self.easing, progress)
+        eased_progress = self._easing_fn(progress)
         
         # Calculate current value
         current_value = self.start_value + (self.end_value - self.start_value) * eased_progress
         
         # Set the property value
-        if hasattr(self.target, self.property_name):
-            setattr(self.target, self.property_name, current_value)
+        self.apply(current_value)
         
         # Check if animation is complete
         if progress >= 1.0:
@@ -54,22 +88,225 @@ class Animation:
                 self.on_complete()
                 
         return not self.is_complete
+        
+    def apply(self, value: float, damage: Optional[Dict[int, Tuple[Any, Dict[str, Tuple[Callable, float]]]]] = None):
+        """Write an interpolated value to the target property, or stage it in a damage set"""
+        if self._setter is not None:
+            if damage is None:
+                self._setter(value)
+            else:
+                self._stage(damage, self.property_name, self._setter, value)
+                
+    def _stage(self, damage: Dict[int, Tuple[Any, Dict[str, Tuple[Callable, float]]]], property_name: str,
+               setter: Callable[[Any], None], value: float):
+        """Record a property write and its bound setter for the target in a damage set"""
+        entry = damage.get(id(self.target))
+        if entry is None:
+            damage[id(self.target)] = (self.target, {property_name: (setter, value)})
+        else:
+            entry[1][property_name] = (setter, value)
+            
+    def animates(self, property_name: str) -> bool:
+        """Check if this animation writes the given property"""
+        return self.property_name == property_name
+
+
+class MultiPropertyAnimation(Animation):
+    """Animates several properties of one target with a shared timeline and easing
+    
+    The animation is stored as a 0..1 eased timeline; each property is
+    interpolated from that single value when it is applied.
+    """
+    
+    __slots__ = ('property_names', 'start_values', 'end_values', '_tracks')
+    
+    def __init__(self,
+                 target: Any,
+                 property_names: Sequence[str],
+                 start_values: Sequence[float],
+                 end_values: Sequence[float],
+                 duration: float,
+                 easing: str = 'ease_in_out',
+                 on_complete: Optional[Callable] = None,
+                 precision: Optional[float] = None):
+        super().__init__(target, property_names[0], 0.0, 1.0, duration, easing, on_complete, precision)
+        self.property_names = tuple(property_names)
+        self.start_values = tuple(start_values)
+        self.end_values = tuple(end_values)
+        
+        # (name, setter, start, delta) per writable property, resolved once
+        tracks = []
+        for name, start, end in zip(self.property_names, self.start_values, self.end_values):
+            setter = self._bind_setter(target, name)
+            if setter is not None:
+                tracks.append((name, setter, start, end - start))
+        self._tracks = tuple(tracks)
+        
+    def apply(self, value: float, damage: Optional[Dict[int, Tuple[Any, Dict[str, Tuple[Callable, float]]]]] = None):
+        """Write every property interpolated at eased timeline position 'value'"""
+        for name, setter, start, delta in self._tracks:
+            current_value = start + delta * value
+            if damage is None:
+                setter(current_value)
+            else:
+                self._stage(damage, name, setter, current_value)
+                
+    def animates(self, property_name: str) -> bool:
+        """Check if this animation writes the given property"""
+        return property_name in self.property_names
+
+
+class KeyframeAnimation(Animation):
+    """Animates a property through (time_fraction, value) keyframes on a single timeline
+    
+    The timeline itself is linear; the easing is applied within each segment
+    between two keyframes. 'easing' is one name for every segment or a
+    sequence with one name per segment.
+    """
+    
+    __slots__ = ('keyframes', 'segment_easing', '_times', '_values', '_segment_easing_fns')
+    
+    def __init__(self,
+                 target: Any,
+                 property_name: str,
+                 keyframes: List[Tuple[float, float]],
+                 duration: float,
+                 easing: Union[str, Sequence[str]] = 'ease_in_out',
+                 on_complete: Optional[Callable] = None,
+                 precision: Optional[float] = None):
+        super().__init__(target, property_name, 0.0, 1.0, duration, 'linear', on_complete, precision)
+        self.keyframes = keyframes
+        self.segment_easing = easing
+        self._times = [t for t, _ in keyframes]
+        self._values = [v for _, v in keyframes]
+        segment_easings = [easing] * (len(keyframes) - 1) if isinstance(easing, str) else easing
+        self._segment_easing_fns = tuple(Easing.get_function(name) for name in segment_easings)
+        
+    def apply(self, value: float, damage: Optional[Dict[int, Tuple[Any, Dict[str, Tuple[Callable, float]]]]] = None):
+        """Interpolate the keyframes at timeline position 'value' and write the result"""
+        times = self._times
+        values = self._values
+        
+        # Find the active segment
+        i = min(max(bisect.bisect_right(times, value) - 1, 0), len(times) - 2)
+        t0 = times[i]
+        t1 = times[i + 1]
+        local = min(max((value - t0) / (t1 - t0), 0.0), 1.0) if t1 > t0 else 1.0
+        k = self._segment_easing_fns[i](local)
+        
+        super().apply((1 - k) * values[i] + k * values[i + 1], damage)
+
+
+# Shared scale-back target; animate_multiple() never mutates its properties dict
+_UNIT_SCALE = {'scale_x': 1.0, 'scale_y': 1.0}
+
+
+class _ScaleBack:
+    """Completion callback that animates a target's scale back to 1.0"""
+    
+    __slots__ = ('animator', 'target', 'duration', 'on_complete')
+    
+    def __init__(self, animator: 'Animator', target: Any, duration: float, on_complete: Optional[Callable] = None):
+        self.animator = animator
+        self.target = target
+        self.duration = duration
+        self.on_complete = on_complete
+        
+    def __call__(self):
+        self.animator.animate_multiple(self.target, _UNIT_SCALE, self.duration, 'ease_out', self.on_complete)
 
 
 class Animator:
     """Manages multiple animations and provides animation utilities"""
     
-    def __init__(self):
+    INITIAL_CAPACITY = 16
+    _COLUMNS = ('_start_values', '_end_values', '_durations', '_start_times', '_easing_ids',
+                '_steps', '_next_times')
+    
+    def __init__(self, fps: float = 60.0):
         self.animations: List[Animation] = []
         self.running = True
         
+        # Frame-rate throttle
+        self._target_fps = fps
+        self._min_dt = 1.0 / fps if fps > 0 else 0.0
+        self._last_tick = time.monotonic()
+        
+        # Structure-of-arrays storage, one slot per entry in self.animations
+        self._capacity = self.INITIAL_CAPACITY
+        self._start_values = np.empty((self._capacity,), dtype=np.float64)
+        self._end_values = np.empty((self._capacity,), dtype=np.float64)
+        self._durations = np.empty((self._capacity,), dtype=np.float64)
+        self._start_times = np.empty((self._capacity,), dtype=np.float64)
+        self._easing_ids = np.empty((self._capacity,), dtype=np.int8)
+        
+        # Per-animation time between visible steps, and when the next one is due
+        self._steps = np.empty((self._capacity,), dtype=np.float64)
+        self._next_times = np.empty((self._capacity,), dtype=np.float64)
+        
+    def _add(self, animation: Animation):
+        """Append an animation to the list and the array storage"""
+        n = len(self.animations)
+        if n == self._capacity:
+            self._grow()
+            
+        self._start_values[n] = animation.start_value
+        self._end_values[n] = animation.end_value
+        self._durations[n] = animation.duration if animation.duration > 0 else 1e-9
+        self._start_times[n] = animation.start_time
+        self._easing_ids[n] = animation.easing_id
+        self._steps[n] = animation.precision * self._durations[n]
+        self._next_times[n] = animation.start_time
+        self.animations.append(animation)
+        
+        # Keep the target's window redrawing while the animation runs
+        context = getattr(animation.target, 'context', None)
+        if context is not None:
+            context.register_animation(animation)
+            
+    @staticmethod
+    def _release(animations: List[Animation]):
+        """Let the targets' windows stop redrawing for finished or stopped animations"""
+        for animation in animations:
+            context = getattr(animation.target, 'context', None)
+            if context is not None:
+                context.unregister_animation(animation)
+        
+    def _grow(self):
+        """Double the capacity of the array storage"""
+        n = len(self.animations)
+        self._capacity *= 2
+        for name in self._COLUMNS:
+            old = getattr(self, name)
+            new = np.empty((self._capacity,), dtype=old.dtype)
+            new[:n] = old[:n]
+            setattr(self, name, new)
+            
+    def _compact(self, keep: np.ndarray):
+        """Keep only the animations selected by a boolean mask"""
+        animations = self.animations
+        n = len(animations)
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            kept = np.compress(keep, column[:n])
+            column[:len(kept)] = kept
+            
+        # Compact the handle list in place rather than rebuilding it
+        w = 0
+        for anim, k in zip(animations, keep.tolist()):
+            if k:
+                animations[w] = anim
+                w += 1
+        del animations[w:]
+        
     def animate(self,
                 target: Any,
                 property_name: str,
                 to_value: float,
                 duration: float = 1.0,
                 easing: str = 'ease_in_out',
-                on_complete: Optional[Callable] = None) -> Animation:
+                on_complete: Optional[Callable] = None,
+                precision: Optional[float] = None) -> Animation:
         """Start an animation"""
         # Get current value
         current_value = getattr(target, property_name, 0.0)
@@ -77,10 +314,27 @@ class Animator:
         # Create animation
         animation = Animation(
             target, property_name, current_value, to_value,
-            duration, easing, on_complete
+            duration, easing, on_complete, precision
         )
         
-        self.animations.append(animation)
+        self._add(animation)
+        return animation
+        
+    def animate_keyframes(self,
+                          target: Any,
+                          property_name: str,
+                          keyframes: List[Tuple[float, float]],
+                          duration: float = 1.0,
+                          easing: Union[str, Sequence[str]] = 'ease_in_out',
+                          on_complete: Optional[Callable] = None,
+                          precision: Optional[float] = None) -> KeyframeAnimation:
+        """Start a keyframe animation; keyframes are (time_fraction, value) pairs from 0.0 to 1.0"""
+        animation = KeyframeAnimation(
+            target, property_name, keyframes,
+            duration, easing, on_complete, precision
+        )
+        
+        self._add(animation)
         return animation
         
     def animate_multiple(self,
@@ -88,19 +342,22 @@ class Animator:
                         properties: Dict[str, float],
                         duration: float = 1.0,
                         easing: str = 'ease_in_out',
-                        on_complete: Optional[Callable] = None) -> List[Animation]:
+                        on_complete: Optional[Callable] = None,
+                        precision: Optional[float] = None) -> List[Animation]:
         """Animate multiple properties simultaneously"""
-        animations = []
-        
-        for prop_name, to_value in properties.items():
-            animation = self.animate(target, prop_name, to_value, duration, easing)
-            animations.append(animation)
+        if not properties:
+            return []
             
-        # Set callback on last animation
-        if animations and on_complete:
-            animations[-1].on_complete = on_complete
-            
-        return animations
+        # Read every start value in one pass; one animation drives all properties
+        property_names = tuple(properties)
+        start_values = tuple([getattr(target, name, 0.0) for name in property_names])
+        animation = MultiPropertyAnimation(
+            target, property_names, start_values, tuple(properties.values()),
+            duration, easing, on_complete, precision
+        )
+        
+        self._add(animation)
+        return [animation]
         
     def fade_in(self, target: Any, duration: float = 0.5) -> Animation:
         """Fade in animation"""
@@ -136,26 +393,91 @@ class Animator:
         
     def pulse(self, target: Any, scale: float = 1.1, duration: float = 0.5) -> List[Animation]:
         """Pulse animation"""
-        def pulse_back():
-            self.animate_multiple(target, {'scale_x': 1.0, 'scale_y': 1.0}, duration * 0.5, 'ease_out')
-            
+        pulse_back = _ScaleBack(self, target, duration * 0.5)
         return self.animate_multiple(target, {'scale_x': scale, 'scale_y': scale}, duration * 0.5, 'ease_in', pulse_back)
         
+    def set_fps(self, fps: float):
+        """Set the maximum update rate (0 disables throttling)"""
+        self._target_fps = fps
+        self._min_dt = 1.0 / fps if fps > 0 else 0.0
+        
+    def get_fps(self) -> float:
+        """Get the maximum update rate"""
+        return self._target_fps
+        
     def update(self):
         """Update all active animations"""
-        if not self.running:
+        if not self.running or not self.animations:
             return
             
-        # Update animations and remove completed ones
-        self.animations = [anim for anim in self.animations if anim.update()]
+        # Skip ticks that arrive faster than the target frame rate
+        now = time.monotonic()
+        if now - self._last_tick < self._min_dt:
+            return
+        self._last_tick = now
+        
+        n = len(self.animations)
+        
+        # Compute progress, easing and interpolated values for all animations at once
+        if _fast_tick is not None:
+            values = np.empty((n,), dtype=np.float64)
+            done = np.empty((n,), dtype=np.bool_)
+            _fast_tick(self._start_values, self._end_values, self._durations,
+                       self._start_times, self._easing_ids, n, now, values, done)
+        else:
+            elapsed = now - self._start_times[:n]
+            progress = np.minimum(elapsed / self._durations[:n], 1.0)
+            eased = Easing.apply_array(self._easing_ids[:n], progress)
+            start_values = self._start_values[:n]
+            values = start_values + (self._end_values[:n] - start_values) * eased
+            done = progress >= 1.0
         
+        # Only animations that advanced a visible step (or finished) are applied
+        due = np.flatnonzero(done | (self._next_times[:n] <= now))
+        self._next_times[due] = now + self._steps[due]
+        
+        # Stage values per target, then write them back to the (heterogeneous) targets
+        animations = self.animations
+        damage = {}
+        for i, value in zip(due.tolist(), values[due].tolist()):
+            animations[i].apply(value, damage)
+        self._flush(damage)
+            
+        # Remove completed animations, then fire their callbacks
+        if done.any():
+            completed = [anim for anim, d in zip(animations, done) if d]
+            self._compact(~done)
+            self._release(completed)
+            for anim in completed:
+                anim.is_complete = True
+                if anim.on_complete:
+                    anim.on_complete()
+        
+    @staticmethod
+    def _flush(damage: Dict[int, Tuple[Any, Dict[str, Tuple[Callable, float]]]]):
+        """Apply staged property writes through their bound setters, once per target"""
+        for target, props in damage.values():
+            for setter, value in props.values():
+                setter(value)
+            # Plain attribute writes don't reach the redraw gate on their own
+            context = getattr(target, 'context', None)
+            if context is not None:
+                context.dirty = True
+                
     def stop_all(self):
         """Stop all animations"""
+        self._release(self.animations)
         self.animations.clear()
         
     def stop_animations_for_target(self, target: Any):
         """Stop all animations for a specific target"""
-        self.animations = [anim for anim in self.animations if anim.target != target]
+        keep = np.array([anim.target != target for anim in self.animations], dtype=bool)
+        self._release([anim for anim, k in zip(self.animations, keep.tolist()) if not k])
+        self._compact(keep)
+        
+    def any_running(self) -> bool:
+        """Check if update() has any work to do, so idle loops can skip it"""
+        return self.running and bool(self.animations)
         
     def get_active_animation_count(self) -> int:
         """Get the number of active animations"""
@@ -165,7 +487,7 @@ class Animator:
         """Check if target or specific property is being animated"""
         for anim in self.animations:
             if anim.target == target:
-                if property_name is None or anim.property_name == property_name:
+                if property_name is None or anim.animates(property_name):
                     return True
         return False
         
@@ -177,7 +499,9 @@ class Animator:
         """Resume all animations"""
         self.running = True
         # Adjust start times to account for pause
-        current_time = time.time()
-        for anim in self.animations:
+        current_time = time.monotonic()
+        for i, anim in enumerate(self.animations):
             elapsed = current_time - anim.start_time
-            anim.start_time = current_time - min(elapsed, anim.duration)
\ No newline at end of file
+            anim.start_time = current_time - min(elapsed, anim.duration)
+            self._start_times[i] = anim.start_time
+        self._next_times[:len(self.animations)] = current_time
\ No newline at end of file
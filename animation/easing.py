@@ -2,183 +2,344 @@
 Easing functions for animations
 """
 import math
-from typing import Callable
+from enum import IntEnum
+from typing import Callable, Dict, Union
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is an optional accelerator
+    njit = None
+
+
+# Back easing overshoot constants
+_BACK_C1 = 1.70158
+_BACK_C2 = _BACK_C1 * 1.525
+_BACK_C3 = _BACK_C1 + 1
+
+# Bounce segments indexed by int(t * 5.5): segment boundaries at t * 2.75 = 1, 2, 2.5
+_BOUNCE_OFFSETS = (0.0, 0.0, 1.5 / 2.75, 1.5 / 2.75, 2.25 / 2.75, 2.625 / 2.75)
+_BOUNCE_BIASES = (0.0, 0.0, 0.75, 0.75, 0.9375, 0.984375)
+_BOUNCE_OFFSETS_ARRAY = np.array(_BOUNCE_OFFSETS)
+_BOUNCE_BIASES_ARRAY = np.array(_BOUNCE_BIASES)
+
+
+class EasingID(IntEnum):
+    """Integer IDs of the distinct easing functions"""
+    LINEAR = 0
+    EASE_IN_SINE = 1
+    EASE_OUT_SINE = 2
+    EASE_IN_OUT_SINE = 3
+    EASE_IN_QUAD = 4
+    EASE_OUT_QUAD = 5
+    EASE_IN_OUT_QUAD = 6
+    EASE_IN_CUBIC = 7
+    EASE_OUT_CUBIC = 8
+    EASE_IN_OUT_CUBIC = 9
+    EASE_IN_QUART = 10
+    EASE_OUT_QUART = 11
+    EASE_IN_OUT_QUART = 12
+    EASE_IN_EXPO = 13
+    EASE_OUT_EXPO = 14
+    EASE_IN_OUT_EXPO = 15
+    EASE_IN_BACK = 16
+    EASE_OUT_BACK = 17
+    EASE_IN_OUT_BACK = 18
+    BOUNCE_OUT = 19
+    BOUNCE_IN = 20
+    BOUNCE_IN_OUT = 21
+
+
+def _linear(t: float) -> float:
+    """Linear easing function"""
+    return t
+
+
+def _ease_in_sine(t: float) -> float:
+    """Sine ease-in"""
+    return 1 - math.cos((t * math.pi) / 2)
+
+
+def _ease_out_sine(t: float) -> float:
+    """Sine ease-out"""
+    return math.sin((t * math.pi) / 2)
+
+
+def _ease_in_out_sine(t: float) -> float:
+    """Sine ease-in-out"""
+    return -(math.cos(math.pi * t) - 1) / 2
+
+
+def _ease_in_quad(t: float) -> float:
+    """Quadratic ease-in"""
+    return t * t
+
+
+def _ease_out_quad(t: float) -> float:
+    """Quadratic ease-out"""
+    return 1 - (1 - t) * (1 - t)
+
+
+def _ease_in_out_quad(t: float) -> float:
+    """Quadratic ease-in-out"""
+    if t < 0.5:
+        return 2 * t * t
+    u = -2 * t + 2
+    return 1 - u * u / 2
+
+
+def _ease_in_cubic(t: float) -> float:
+    """Cubic ease-in"""
+    return t * t * t
+
+
+def _ease_out_cubic(t: float) -> float:
+    """Cubic ease-out"""
+    u = 1 - t
+    return 1 - u * u * u
+
+
+def _ease_in_out_cubic(t: float) -> float:
+    """Cubic ease-in-out"""
+    if t < 0.5:
+        return 4 * t * t * t
+    u = -2 * t + 2
+    return 1 - u * u * u / 2
+
+
+def _ease_in_quart(t: float) -> float:
+    """Quartic ease-in"""
+    return t * t * t * t
+
+
+def _ease_out_quart(t: float) -> float:
+    """Quartic ease-out"""
+    u = 1 - t
+    u2 = u * u
+    return 1 - u2 * u2
+
+
+def _ease_in_out_quart(t: float) -> float:
+    """Quartic ease-in-out"""
+    if t < 0.5:
+        t2 = t * t
+        return 8 * t2 * t2
+    u = -2 * t + 2
+    u2 = u * u
+    return 1 - u2 * u2 / 2
+
+
+def _ease_in_expo(t: float) -> float:
+    """Exponential ease-in"""
+    return 0 if t == 0 else pow(2, 10 * (t - 1))
+
+
+def _ease_out_expo(t: float) -> float:
+    """Exponential ease-out"""
+    return 1 if t == 1 else 1 - pow(2, -10 * t)
+
+
+def _ease_in_out_expo(t: float) -> float:
+    """Exponential ease-in-out"""
+    if t == 0:
+        return 0
+    elif t == 1:
+        return 1
+    elif t < 0.5:
+        return pow(2, 20 * t - 10) / 2
+    else:
+        return (2 - pow(2, -20 * t + 10)) / 2
+
+
+def _ease_in_back(t: float) -> float:
+    """Back ease-in"""
+    return _BACK_C3 * t * t * t - _BACK_C1 * t * t
+
+
+def _ease_out_back(t: float) -> float:
+    """Back ease-out"""
+    u = t - 1
+    return 1 + _BACK_C3 * u * u * u + _BACK_C1 * u * u
+
+
+def _ease_in_out_back(t: float) -> float:
+    """Back ease-in-out"""
+    if t < 0.5:
+        u = 2 * t
+        return (u * u * ((_BACK_C2 + 1) * u - _BACK_C2)) / 2
+    else:
+        u = 2 * t - 2
+        return (u * u * ((_BACK_C2 + 1) * u + _BACK_C2) + 2) / 2
+
+
+def _bounce_out(t: float) -> float:
+    """Bounce ease-out"""
+    i = min(int(t * 5.5), 5)
+    u = t - _BOUNCE_OFFSETS[i]
+    return 7.5625 * u * u + _BOUNCE_BIASES[i]
+
+
+def _bounce_in(t: float) -> float:
+    """Bounce ease-in"""
+    return 1 - _bounce_out(1 - t)
+
+
+def _bounce_in_out(t: float) -> float:
+    """Bounce ease-in-out"""
+    if t < 0.5:
+        return (1 - _bounce_out(1 - 2 * t)) / 2
+    else:
+        return (1 + _bounce_out(2 * t - 1)) / 2
 
 
 class Easing:
     """Collection of easing functions for smooth animations"""
     
-    @staticmethod
-    def linear(t: float) -> float:
-        """Linear easing function"""
-        return t
-        
-    @staticmethod
-    def ease_in_sine(t: float) -> float:
-        """Sine ease-in"""
-        return 1 - math.cos((t * math.pi) / 2)
-        
-    @staticmethod
-    def ease_out_sine(t: float) -> float:
-        """Sine ease-out"""
-        return math.sin((t * math.pi) / 2)
-        
-    @staticmethod
-    def ease_in_out_sine(t: float) -> float:
-        """Sine ease-in-out"""
-        return -(math.cos(math.pi * t) - 1) / 2
-        
-    @staticmethod
-    def ease_in_quad(t: float) -> float:
-        """Quadratic ease-in"""
-        return t * t
-        
-    @staticmethod
-    def ease_out_quad(t: float) -> float:
-        """Quadratic ease-out"""
-        return 1 - (1 - t) * (1 - t)
-        
-    @staticmethod
-    def ease_in_out_quad(t: float) -> float:
-        """Quadratic ease-in-out"""
-        return 2 * t * t if t < 0.5 else 1 - pow(-2 * t + 2, 2) / 2
-        
-    @staticmethod
-    def ease_in_cubic(t: float) -> float:
-        """Cubic ease-in"""
-        return t * t * t
-        
-    @staticmethod
-    def ease_out_cubic(t: float) -> float:
-        """Cubic ease-out"""
-        return 1 - pow(1 - t, 3)
-        
-    @staticmethod
-    def ease_in_out_cubic(t: float) -> float:
-        """Cubic ease-in-out"""
-        return 4 * t * t * t if t < 0.5 else 1 - pow(-2 * t + 2, 3) / 2
-        
-    @staticmethod
-    def ease_in_quart(t: float) -> float:
-        """Quartic ease-in"""
-        return t * t * t * t
-        
-    @staticmethod
-    def ease_out_quart(t: float) -> float:
-        """Quartic ease-out"""
-        return 1 - pow(1 - t, 4)
-        
-    @staticmethod
-    def ease_in_out_quart(t: float) -> float:
-        """Quartic ease-in-out"""
-        return 8 * t * t * t * t if t < 0.5 else 1 - pow(-2 * t + 2, 4) / 2
-        
-    @staticmethod
-    def ease_in_expo(t: float) -> float:
-        """Exponential ease-in"""
-        return 0 if t == 0 else pow(2, 10 * (t - 1))
-        
-    @staticmethod
-    def ease_out_expo(t: float) -> float:
-        """Exponential ease-out"""
-        return 1 if t == 1 else 1 - pow(2, -10 * t)
-        
-    @staticmethod
-    def ease_in_out_expo(t: float) -> float:
-        """Exponential ease-in-out"""
-        if t == 0:
-            return 0
-        elif t == 1:
-            return 1
-        elif t < 0.5:
-            return pow(2, 20 * t - 10) / 2
-        else:
-            return (2 - pow(2, -20 * t + 10)) / 2
-            
-    @staticmethod
-    def ease_in_back(t: float) -> float:
-        """Back ease-in"""
-        c1 = 1.70158
-        c3 = c1 + 1
-        return c3 * t * t * t - c1 * t * t
-        
-    @staticmethod
-    def ease_out_back(t: float) -> float:
-        """Back ease-out"""
-        c1 = 1.70158
-        c3 = c1 + 1
-        return 1 + c3 * pow(t - 1, 3) + c1 * pow(t - 1, 2)
-        
-    @staticmethod
-    def ease_in_out_back(t: float) -> float:
-        """Back ease-in-out"""
-        c1 = 1.70158
-        c2 = c1 * 1.525
-        
-        if t < 0.5:
-            return (pow(2 * t, 2) * ((c2 + 1) * 2 * t - c2)) / 2
-        else:
-            return (pow(2 * t - 2, 2) * ((c2 + 1) * (t * 2 - 2) + c2) + 2) / 2
-            
-    @staticmethod
-    def bounce_out(t: float) -> float:
-        """Bounce ease-out"""
-        n1 = 7.5625
-        d1 = 2.75
-        
-        if t < 1 / d1:
-            return n1 * t * t
-        elif t < 2 / d1:
-            t -= 1.5 / d1
-            return n1 * t * t + 0.75
-        elif t < 2.5 / d1:
-            t -= 2.25 / d1
-            return n1 * t * t + 0.9375
-        else:
-            t -= 2.625 / d1
-            return n1 * t * t + 0.984375
-            
-    @staticmethod
-    def bounce_in(t: float) -> float:
-        """Bounce ease-in"""
-        return 1 - Easing.bounce_out(1 - t)
-        
-    @staticmethod
-    def bounce_in_out(t: float) -> float:
-        """Bounce ease-in-out"""
-        if t < 0.5:
-            return (1 - Easing.bounce_out(1 - 2 * t)) / 2
-        else:
-            return (1 + Easing.bounce_out(2 * t - 1)) / 2
-            
+    linear = staticmethod(_linear)
+    ease_in_sine = staticmethod(_ease_in_sine)
+    ease_out_sine = staticmethod(_ease_out_sine)
+    ease_in_out_sine = staticmethod(_ease_in_out_sine)
+    ease_in_quad = staticmethod(_ease_in_quad)
+    ease_out_quad = staticmethod(_ease_out_quad)
+    ease_in_out_quad = staticmethod(_ease_in_out_quad)
+    ease_in_cubic = staticmethod(_ease_in_cubic)
+    ease_out_cubic = staticmethod(_ease_out_cubic)
+    ease_in_out_cubic = staticmethod(_ease_in_out_cubic)
+    ease_in_quart = staticmethod(_ease_in_quart)
+    ease_out_quart = staticmethod(_ease_out_quart)
+    ease_in_out_quart = staticmethod(_ease_in_out_quart)
+    ease_in_expo = staticmethod(_ease_in_expo)
+    ease_out_expo = staticmethod(_ease_out_expo)
+    ease_in_out_expo = staticmethod(_ease_in_out_expo)
+    ease_in_back = staticmethod(_ease_in_back)
+    ease_out_back = staticmethod(_ease_out_back)
+    ease_in_out_back = staticmethod(_ease_in_out_back)
+    bounce_out = staticmethod(_bounce_out)
+    bounce_in = staticmethod(_bounce_in)
+    bounce_in_out = staticmethod(_bounce_in_out)
+    
     # Mapping of easing names to functions
     FUNCTIONS = {
-        'linear': linear.__func__,
-        'ease_in': ease_in_cubic.__func__,
-        'ease_out': ease_out_cubic.__func__,
-        'ease_in_out': ease_in_out_cubic.__func__,
-        'ease_in_sine': ease_in_sine.__func__,
-        'ease_out_sine': ease_out_sine.__func__,
-        'ease_in_out_sine': ease_in_out_sine.__func__,
-        'ease_in_quad': ease_in_quad.__func__,
-        'ease_out_quad': ease_out_quad.__func__,
-        'ease_in_out_quad': ease_in_out_quad.__func__,
-        'ease_in_cubic': ease_in_cubic.__func__,
-        'ease_out_cubic': ease_out_cubic.__func__,
-        'ease_in_out_cubic': ease_in_out_cubic.__func__,
-        'ease_in_quart': ease_in_quart.__func__,
-        'ease_out_quart': ease_out_quart.__func__,
-        'ease_in_out_quart': ease_in_out_quart.__func__,
-        'ease_in_expo': ease_in_expo.__func__,
-        'ease_out_expo': ease_out_expo.__func__,
-        'ease_in_out_expo': ease_in_out_expo.__func__,
-        'ease_in_back': ease_in_back.__func__,
-        'ease_out_back': ease_out_back.__func__,
-        'ease_in_out_back': ease_in_out_back.__func__,
-        'bounce': bounce_out.__func__,
-        'bounce_in': bounce_in.__func__,
-        'bounce_out': bounce_out.__func__,
-        'bounce_in_out': bounce_in_out.__func__
+        'linear': _linear,
+        'ease_in': _ease_in_cubic,
+        'ease_out': _ease_out_cubic,
+        'ease_in_out': _ease_in_out_cubic,
+        'ease_in_sine': _ease_in_sine,
+        'ease_out_sine': _ease_out_sine,
+        'ease_in_out_sine': _ease_in_out_sine,
+        'ease_in_quad': _ease_in_quad,
+        'ease_out_quad': _ease_out_quad,
+        'ease_in_out_quad': _ease_in_out_quad,
+        'ease_in_cubic': _ease_in_cubic,
+        'ease_out_cubic': _ease_out_cubic,
+        'ease_in_out_cubic': _ease_in_out_cubic,
+        'ease_in_quart': _ease_in_quart,
+        'ease_out_quart': _ease_out_quart,
+        'ease_in_out_quart': _ease_in_out_quart,
+        'ease_in_expo': _ease_in_expo,
+        'ease_out_expo': _ease_out_expo,
+        'ease_in_out_expo': _ease_in_out_expo,
+        'ease_in_back': _ease_in_back,
+        'ease_out_back': _ease_out_back,
+        'ease_in_out_back': _ease_in_out_back,
+        'bounce': _bounce_out,
+        'bounce_in': _bounce_in,
+        'bounce_out': _bounce_out,
+        'bounce_in_out': _bounce_in_out
+    }
+    
+    # Vectorized counterparts, indexed by easing ID (aliases share an ID)
+    ARRAY_FUNCTIONS = (
+        lambda t: t,                                                          # linear
+        lambda t: 1 - np.cos((t * np.pi) / 2),                                # ease_in_sine
+        lambda t: np.sin((t * np.pi) / 2),                                    # ease_out_sine
+        lambda t: -(np.cos(np.pi * t) - 1) / 2,                               # ease_in_out_sine
+        lambda t: t * t,                                                      # ease_in_quad
+        lambda t: 1 - (1 - t) * (1 - t),                                      # ease_out_quad
+        lambda t: np.where(t < 0.5, 2 * t * t, 1 - (-2 * t + 2) ** 2 / 2),    # ease_in_out_quad
+        lambda t: t * t * t,                                                  # ease_in_cubic
+        lambda t: t * (3 + t * (t - 3)),                                      # ease_out_cubic
+        lambda t: _ease_in_out_cubic_horner(2 * t - 1),                       # ease_in_out_cubic
+        lambda t: t * t * t * t,                                              # ease_in_quart
+        lambda t: 1 - (1 - t) ** 4,                                           # ease_out_quart
+        lambda t: np.where(t < 0.5, 8 * t * t * t * t, 1 - (-2 * t + 2) ** 4 / 2),  # ease_in_out_quart
+        lambda t: np.where(t == 0, 0.0, 2.0 ** (10 * (t - 1))),               # ease_in_expo
+        lambda t: np.where(t == 1, 1.0, 1 - 2.0 ** (-10 * t)),                # ease_out_expo
+        lambda t: np.select(                                                  # ease_in_out_expo
+            [t == 0, t == 1, t < 0.5],
+            [0.0, 1.0, 2.0 ** (20 * t - 10) / 2],
+            (2 - 2.0 ** (-20 * t + 10)) / 2
+        ),
+        lambda t: _BACK_C3 * t * t * t - _BACK_C1 * t * t,                    # ease_in_back
+        lambda t: 1 + _BACK_C3 * (t - 1) ** 3 + _BACK_C1 * (t - 1) ** 2,      # ease_out_back
+        lambda t: np.where(                                                   # ease_in_out_back
+            t < 0.5,
+            ((2 * t) ** 2 * ((_BACK_C2 + 1) * 2 * t - _BACK_C2)) / 2,
+            ((2 * t - 2) ** 2 * ((_BACK_C2 + 1) * (t * 2 - 2) + _BACK_C2) + 2) / 2
+        ),
+        lambda t: _bounce_out_array(t),                                       # bounce_out
+        lambda t: 1 - _bounce_out_array(1 - t),                               # bounce_in
+        lambda t: np.where(                                                   # bounce_in_out
+            t < 0.5,
+            (1 - _bounce_out_array(1 - 2 * t)) / 2,
+            (1 + _bounce_out_array(2 * t - 1)) / 2
+        ),
+    )
+    
+    # Scalar functions indexed by easing ID
+    TABLE = (
+        _linear,
+        _ease_in_sine,
+        _ease_out_sine,
+        _ease_in_out_sine,
+        _ease_in_quad,
+        _ease_out_quad,
+        _ease_in_out_quad,
+        _ease_in_cubic,
+        _ease_out_cubic,
+        _ease_in_out_cubic,
+        _ease_in_quart,
+        _ease_out_quart,
+        _ease_in_out_quart,
+        _ease_in_expo,
+        _ease_out_expo,
+        _ease_in_out_expo,
+        _ease_in_back,
+        _ease_out_back,
+        _ease_in_out_back,
+        _bounce_out,
+        _bounce_in,
+        _bounce_in_out
+    )
+    
+    # Mapping of easing names to IDs
+    IDS: Dict[str, EasingID] = {
+        'linear': EasingID.LINEAR,
+        'ease_in': EasingID.EASE_IN_CUBIC,
+        'ease_out': EasingID.EASE_OUT_CUBIC,
+        'ease_in_out': EasingID.EASE_IN_OUT_CUBIC,
+        'ease_in_sine': EasingID.EASE_IN_SINE,
+        'ease_out_sine': EasingID.EASE_OUT_SINE,
+        'ease_in_out_sine': EasingID.EASE_IN_OUT_SINE,
+        'ease_in_quad': EasingID.EASE_IN_QUAD,
+        'ease_out_quad': EasingID.EASE_OUT_QUAD,
+        'ease_in_out_quad': EasingID.EASE_IN_OUT_QUAD,
+        'ease_in_cubic': EasingID.EASE_IN_CUBIC,
+        'ease_out_cubic': EasingID.EASE_OUT_CUBIC,
+        'ease_in_out_cubic': EasingID.EASE_IN_OUT_CUBIC,
+        'ease_in_quart': EasingID.EASE_IN_QUART,
+        'ease_out_quart': EasingID.EASE_OUT_QUART,
+        'ease_in_out_quart': EasingID.EASE_IN_OUT_QUART,
+        'ease_in_expo': EasingID.EASE_IN_EXPO,
+        'ease_out_expo': EasingID.EASE_OUT_EXPO,
+        'ease_in_out_expo': EasingID.EASE_IN_OUT_EXPO,
+        'ease_in_back': EasingID.EASE_IN_BACK,
+        'ease_out_back': EasingID.EASE_OUT_BACK,
+        'ease_in_out_back': EasingID.EASE_IN_OUT_BACK,
+        'bounce': EasingID.BOUNCE_OUT,
+        'bounce_in': EasingID.BOUNCE_IN,
+        'bounce_out': EasingID.BOUNCE_OUT,
+        'bounce_in_out': EasingID.BOUNCE_IN_OUT
     }
     
     @classmethod
@@ -188,6 +349,119 @@ class Easing:
         return easing_func(t)
         
     @classmethod
-    def get_function(cls, easing_name: str) -> Callable[[float], float]:
-        """Get an easing function by name"""
-        return cls.FUNCTIONS.get(easing_name, cls.linear)
\ No newline at end of file
+    def get_function(cls, easing_name: Union[str, EasingID]) -> Callable[[float], float]:
+        """Get an easing function by name or ID"""
+        if isinstance(easing_name, int):
+            return cls.TABLE[easing_name]
+        return cls.FUNCTIONS.get(easing_name, cls.linear)
+        
+    @classmethod
+    def get_id(cls, easing_name: Union[str, EasingID]) -> EasingID:
+        """Get the easing ID for a name or ID (unknown names fall back to linear)"""
+        if isinstance(easing_name, int):
+            return EasingID(easing_name)
+        return cls.IDS.get(easing_name, EasingID.LINEAR)
+        
+    @classmethod
+    def apply_array(cls, easing_ids: np.ndarray, t: np.ndarray) -> np.ndarray:
+        """Apply easing functions to an array of progress values, one ID per element"""
+        eased = np.empty_like(t)
+        if njit is not None:
+            _apply_easing_array(easing_ids, t, eased)
+            return eased
+            
+        for easing_id in np.unique(easing_ids):
+            mask = easing_ids == easing_id
+            eased[mask] = cls.ARRAY_FUNCTIONS[easing_id](t[mask])
+        return eased
+
+
+def _ease_in_out_cubic_horner(u: np.ndarray) -> np.ndarray:
+    """Branchless cubic ease-in-out in Horner form, with u = 2t - 1"""
+    a = np.abs(u)
+    return 0.5 + 0.5 * u * (3 + a * (a - 3))
+
+
+def _bounce_out_array(t: np.ndarray) -> np.ndarray:
+    """Vectorized bounce ease-out"""
+    i = np.minimum((t * 5.5).astype(np.int8), 5)
+    u = t - np.take(_BOUNCE_OFFSETS_ARRAY, i)
+    return 7.5625 * u * u + np.take(_BOUNCE_BIASES_ARRAY, i)
+
+
+if njit is not None:
+    # The scalar functions are plain module-level functions, so Numba can compile them as they are
+    _bounce_out_jit = njit(cache=True, fastmath=True)(_bounce_out)
+    
+    @njit(cache=True, fastmath=True)
+    def _apply_easing(easing_id, t):
+        """Compiled easing dispatch over EasingID values"""
+        if easing_id == 0:
+            return t
+        elif easing_id == 1:
+            return 1 - math.cos((t * math.pi) / 2)
+        elif easing_id == 2:
+            return math.sin((t * math.pi) / 2)
+        elif easing_id == 3:
+            return -(math.cos(math.pi * t) - 1) / 2
+        elif easing_id == 4:
+            return t * t
+        elif easing_id == 5:
+            return 1 - (1 - t) * (1 - t)
+        elif easing_id == 6:
+            return 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2
+        elif easing_id == 7:
+            return t * t * t
+        elif easing_id == 8:
+            return t * (3 + t * (t - 3))
+        elif easing_id == 9:
+            u = 2 * t - 1
+            a = abs(u)
+            return 0.5 + 0.5 * u * (3 + a * (a - 3))
+        elif easing_id == 10:
+            return t * t * t * t
+        elif easing_id == 11:
+            return 1 - (1 - t) ** 4
+        elif easing_id == 12:
+            return 8 * t * t * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 4 / 2
+        elif easing_id == 13:
+            return 0.0 if t == 0 else 2.0 ** (10 * (t - 1))
+        elif easing_id == 14:
+            return 1.0 if t == 1 else 1 - 2.0 ** (-10 * t)
+        elif easing_id == 15:
+            if t == 0:
+                return 0.0
+            elif t == 1:
+                return 1.0
+            elif t < 0.5:
+                return 2.0 ** (20 * t - 10) / 2
+            else:
+                return (2 - 2.0 ** (-20 * t + 10)) / 2
+        elif easing_id == 16:
+            return _BACK_C3 * t * t * t - _BACK_C1 * t * t
+        elif easing_id == 17:
+            u = t - 1
+            return 1 + _BACK_C3 * u * u * u + _BACK_C1 * u * u
+        elif easing_id == 18:
+            if t < 0.5:
+                u = 2 * t
+                return (u * u * ((_BACK_C2 + 1) * u - _BACK_C2)) / 2
+            else:
+                u = 2 * t - 2
+                return (u * u * ((_BACK_C2 + 1) * u + _BACK_C2) + 2) / 2
+        elif easing_id == 19:
+            return _bounce_out_jit(t)
+        elif easing_id == 20:
+            return 1 - _bounce_out_jit(1 - t)
+        elif easing_id == 21:
+            if t < 0.5:
+                return (1 - _bounce_out_jit(1 - 2 * t)) / 2
+            else:
+                return (1 + _bounce_out_jit(2 * t - 1)) / 2
+        return t
+        
+    @njit(cache=True, fastmath=True)
+    def _apply_easing_array(easing_ids, t, out):
+        """Compiled element-wise easing over matching ID/progress arrays"""
+        for i in range(t.shape[0]):
+            out[i] = _apply_easing(easing_ids[i], t[i])
@@ -1,8 +1,31 @@
 """
 Pre-defined transitions for common UI animations
 """
-from typing import Any, Callable, Optional, List
-from .animator import Animator
+from typing import Any, Callable, Optional
+from .animator import Animator, _ScaleBack
+
+
+# Shake runs for a fixed time; each move eases in and out, the return to center eases out
+_SHAKE_DURATION = 0.4
+_SHAKE_EASINGS = ('ease_in_out', 'ease_in_out', 'ease_in_out', 'ease_out')
+
+# Rubber band stretches ease in and out, and the final settle eases out
+_RUBBER_BAND_EASINGS = ('ease_in_out', 'ease_in_out', 'ease_in_out', 'ease_out')
+
+
+class _FadeIn:
+    """Completion callback that fades a target in"""
+    
+    __slots__ = ('animator', 'target', 'duration', 'on_complete')
+    
+    def __init__(self, animator: Animator, target: Any, duration: float, on_complete: Optional[Callable] = None):
+        self.animator = animator
+        self.target = target
+        self.duration = duration
+        self.on_complete = on_complete
+        
+    def __call__(self):
+        self.animator.animate(self.target, 'opacity', 1.0, self.duration, 'ease_out', self.on_complete)
 
 
 class Transition:
@@ -89,16 +112,13 @@ class Transition:
         setattr(target, 'scale_y', 0.0)
         setattr(target, 'opacity', 0.0)
         
-        # First animate scale with bounce
-        def fade_in_after_scale():
-            self.animator.animate(target, 'opacity', 1.0, 0.1, 'ease_out', on_complete)
-            
+        # First animate scale with bounce, then fade in
         animations = self.animator.animate_multiple(
             target,
             {'scale_x': 1.0, 'scale_y': 1.0},
             duration,
             'bounce_out',
-            fade_in_after_scale
+            _FadeIn(self.animator, target, 0.1, on_complete)
         )
         return animations
         
@@ -118,67 +138,46 @@ class Transition:
         return self.animator.animate(target, 'rotation', 0.0, duration, 'ease_out', on_complete)
         
     def shake(self, target: Any, intensity: float = 10.0, duration: float = 0.5, on_complete: Optional[Callable] = None):
-        """Shake animation"""
+        """Shake animation
+        
+        Four 0.1 s moves (right, hold, left, back to center), as the step-by-step
+        version ran them; 'duration' is accepted for API compatibility only.
+        """
         original_x = getattr(target, 'x', 0)
+        keyframes = [
+            (0.0, original_x),
+            (0.25, original_x + intensity),
+            (0.5, original_x + intensity),
+            (0.75, original_x - intensity),
+            (1.0, original_x)
+        ]
         
-        def shake_right():
-            def shake_left():
-                def shake_center():
-                    self.animator.animate(target, 'x', original_x, 0.1, 'ease_out', on_complete)
-                self.animator.animate(target, 'x', original_x - intensity, 0.1, 'ease_in_out', shake_center)
-            self.animator.animate(target, 'x', original_x + intensity, 0.1, 'ease_in_out', shake_left)
-            
-        return self.animator.animate(target, 'x', original_x + intensity, 0.1, 'ease_in_out', shake_right)
+        return self.animator.animate_keyframes(target, 'x', keyframes, _SHAKE_DURATION, _SHAKE_EASINGS, on_complete)
         
     def pulse(self, target: Any, scale: float = 1.2, duration: float = 0.6, on_complete: Optional[Callable] = None):
         """Pulse animation"""
-        def scale_back():
-            self.animator.animate_multiple(
-                target,
-                {'scale_x': 1.0, 'scale_y': 1.0},
-                duration * 0.5,
-                'ease_out',
-                on_complete
-            )
-            
         return self.animator.animate_multiple(
             target,
             {'scale_x': scale, 'scale_y': scale},
             duration * 0.5,
             'ease_in',
-            scale_back
+            _ScaleBack(self.animator, target, duration * 0.5, on_complete)
         )
         
     def rubber_band(self, target: Any, duration: float = 1.0, on_complete: Optional[Callable] = None):
-        """Rubber band animation"""
-        def step2():
-            def step3():
-                def step4():
-                    self.animator.animate_multiple(
-                        target,
-                        {'scale_x': 1.0, 'scale_y': 1.0},
-                        duration * 0.1,
-                        'ease_out',
-                        on_complete
-                    )
-                self.animator.animate_multiple(
-                    target,
-                    {'scale_x': 1.05, 'scale_y': 0.95},
-                    duration * 0.1,
-                    'ease_in_out',
-                    step4
-                )
-            self.animator.animate_multiple(
-                target,
-                {'scale_x': 0.95, 'scale_y': 1.05},
-                duration * 0.2,
-                'ease_in_out',
-                step3
-            )
-        self.animator.animate_multiple(
-            target,
-            {'scale_x': 1.25, 'scale_y': 0.75},
-            duration * 0.3,
-            'ease_in_out',
-            step2
-        )
\ No newline at end of file
+        """Rubber band animation
+        
+        Stretches over 0.3, 0.2, 0.1 and 0.1 of 'duration', so the whole
+        animation takes 0.7 * duration.
+        """
+        scale_x = getattr(target, 'scale_x', 1.0)
+        scale_y = getattr(target, 'scale_y', 1.0)
+        
+        x_keyframes = [(0.0, scale_x), (3 / 7, 1.25), (5 / 7, 0.95), (6 / 7, 1.05), (1.0, 1.0)]
+        y_keyframes = [(0.0, scale_y), (3 / 7, 0.75), (5 / 7, 1.05), (6 / 7, 0.95), (1.0, 1.0)]
+        total = duration * 0.7
+        
+        return [
+            self.animator.animate_keyframes(target, 'scale_x', x_keyframes, total, _RUBBER_BAND_EASINGS),
+            self.animator.animate_keyframes(target, 'scale_y', y_keyframes, total, _RUBBER_BAND_EASINGS, on_complete)
+        ]
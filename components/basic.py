@@ -3,20 +3,34 @@ Basic UI components - Container, Button, Text, Input
 """
 from typing import Optional, Callable
 from ..core.component import Component
-from ..styling.parser import StyleParser
+from ..core.colors import pack_color
+from ..styling.parser import DEFAULT_PARSER
+
+
+# Text style fields keyed by (parser type, class string), None where the classes leave a field unset;
+# repeated labels resolve their classes once rather than once per instance
+_TEXT_STYLES = {}
+_TEXT_STYLES_SIZE = 1024
 
 
 class Container(Component):
     """A basic container component that can hold other components"""
     
+    __slots__ = (
+        'background_color', 'border_color', 'border_width', 'padding', 'margin',
+        '_render_key', '_background_args', '_border_args'
+    )
+    
+    style_parser = DEFAULT_PARSER
+    
     def __init__(self, **props):
         super().__init__(**props)
-        self.style_parser = StyleParser()
         self.background_color = (0.0, 0.0, 0.0, 0.0)  # Transparent by default
         self.border_color = (0.0, 0.0, 0.0, 0.0)
         self.border_width = 0
         self.padding = 0
         self.margin = 0
+        self._render_key = None
         
     def component_did_mount(self):
         """Apply styling when component mounts"""
@@ -25,44 +39,67 @@ class Container(Component):
     def apply_styles(self):
         """Apply TailwindCSS-like styles"""
         if self.classes:
-            styles = self.style_parser.parse_classes(self.classes)
+            styles = self.style_parser.resolve_classes(self.classes)
             self.background_color = styles.get('background_color', self.background_color)
             self.border_color = styles.get('border_color', self.border_color)
             self.border_width = styles.get('border_width', self.border_width)
             self.padding = styles.get('padding', self.padding)
             self.margin = styles.get('margin', self.margin)
             
-    def render(self, renderer):
-        """Render the container"""
+    def _resolve_render(self):
+        """Pre-resolve the draw calls, redoing it only when the style or geometry changed
+        
+        Keyed on the inputs rather than invalidated by setters, so plain attribute
+        writes (including animations) are picked up too.
+        """
+        key = (self.x, self.y, self.width, self.height, self.margin,
+               self.background_color, self.border_color, self.border_width)
+        if key == self._render_key:
+            return
+        self._render_key = key
+        
         # Apply margin
         x = self.x + self.margin
         y = self.y + self.margin
         w = self.width - 2 * self.margin
         h = self.height - 2 * self.margin
         
+        # Background only if not transparent, border only if it has a width; colors are
+        # packed here so rendering hands the renderer ready-made RGBA8 values
+        self._background_args = (x, y, w, h, pack_color(self.background_color)) if self.background_color[3] > 0 else None
+        self._border_args = (x, y, w, h, self.border_width, pack_color(self.border_color)) if self.border_width > 0 else None
+        
+    def fingerprint(self) -> tuple:
+        """Summarize the pre-resolved draw calls"""
+        self._resolve_render()
+        return (self._background_args, self._border_args)
+        
+    def render(self, renderer):
+        """Render the container"""
+        self._resolve_render()
+        
         # Render background
-        if self.background_color[3] > 0:  # Only render if not transparent
-            renderer.render_rectangle(x, y, w, h, self.background_color)
+        if self._background_args is not None:
+            renderer.push_quad(*self._background_args)
             
         # Render border
-        if self.border_width > 0:
-            # Top border
-            renderer.render_rectangle(x, y, w, self.border_width, self.border_color)
-            # Bottom border
-            renderer.render_rectangle(x, y + h - self.border_width, w, self.border_width, self.border_color)
-            # Left border
-            renderer.render_rectangle(x, y, self.border_width, h, self.border_color)
-            # Right border
-            renderer.render_rectangle(x + w - self.border_width, y, self.border_width, h, self.border_color)
+        if self._border_args is not None:
+            renderer.render_border(*self._border_args)
 
 
 class Button(Component):
     """A clickable button component"""
     
+    __slots__ = (
+        'text', '_background_color', '_pressed_color', '_hover_color',
+        'text_color', 'border_radius', 'padding', 'is_hovered', 'is_pressed', 'on_click'
+    )
+    
+    style_parser = DEFAULT_PARSER
+    
     def __init__(self, text: str = "", **props):
         super().__init__(**props)
         self.text = text
-        self.style_parser = StyleParser()
         self.background_color = (0.2, 0.6, 1.0, 1.0)  # Blue by default
         self.text_color = (1.0, 1.0, 1.0, 1.0)  # White text
         self.border_radius = 4
@@ -80,12 +117,26 @@ class Button(Component):
     def apply_styles(self):
         """Apply TailwindCSS-like styles"""
         if self.classes:
-            styles = self.style_parser.parse_classes(self.classes)
+            styles = self.style_parser.resolve_classes(self.classes)
             self.background_color = styles.get('background_color', self.background_color)
             self.text_color = styles.get('text_color', self.text_color)
             self.border_radius = styles.get('border_radius', self.border_radius)
             self.padding = styles.get('padding', self.padding)
+            # An explicit hover: background replaces the derived hover color
+            self._hover_color = styles.get('hover:background_color', self._hover_color)
             
+    @property
+    def background_color(self):
+        """Background color"""
+        return self._background_color
+        
+    @background_color.setter
+    def background_color(self, color):
+        # Derive the state colors once instead of on every render
+        self._background_color = color
+        self._pressed_color = tuple(c * 0.8 for c in color)  # Darker when pressed
+        self._hover_color = tuple(c * 1.1 for c in color)  # Lighter when hovered
+        
     def handle_mouse_event(self, event_type: str, event_data):
         """Handle mouse events"""
         if event_type == 'mouse_down':
@@ -98,18 +149,30 @@ class Button(Component):
             self.is_hovered = True
         elif event_type == 'mouse_leave':
             self.is_hovered = False
+        else:
+            return
+            
+        # Pressed and hovered buttons draw in another color
+        if self.context:
+            self.context.dirty = True
             
+    def fingerprint(self) -> tuple:
+        """Summarize what render() draws"""
+        return (self.x, self.y, self.width, self.height, self._background_color, self.is_pressed,
+                self.is_hovered, self.text, self.text_color, self.padding)
+        
     def render(self, renderer):
         """Render the button"""
         # Adjust color based on state
-        color = self.background_color
         if self.is_pressed:
-            color = tuple(c * 0.8 for c in color)  # Darker when pressed
+            color = self._pressed_color
         elif self.is_hovered:
-            color = tuple(c * 1.1 for c in color)  # Lighter when hovered
+            color = self._hover_color
+        else:
+            color = self._background_color
             
         # Render background
-        renderer.render_rectangle(self.x, self.y, self.width, self.height, color)
+        renderer.push_quad(self.x, self.y, self.width, self.height, color)
         
         # Render text (basic implementation)
         # In a full implementation, you would use proper text rendering
@@ -121,10 +184,13 @@ class Button(Component):
 class Text(Component):
     """A text display component"""
     
+    __slots__ = ('text', 'color', 'font_size', 'font_weight')
+    
+    style_parser = DEFAULT_PARSER
+    
     def __init__(self, text: str = "", **props):
         super().__init__(**props)
         self.text = text
-        self.style_parser = StyleParser()
         self.color = (1.0, 1.0, 1.0, 1.0)  # White by default
         self.font_size = 16
         self.font_weight = 'normal'
@@ -136,11 +202,25 @@ class Text(Component):
     def apply_styles(self):
         """Apply TailwindCSS-like styles"""
         if self.classes:
-            styles = self.style_parser.parse_classes(self.classes)
-            self.color = styles.get('text_color', self.color)
-            self.font_size = styles.get('font_size', self.font_size)
-            self.font_weight = styles.get('font_weight', self.font_weight)
+            key = (type(self.style_parser), self.classes)
+            resolved = _TEXT_STYLES.get(key)
+            if resolved is None:
+                styles = self.style_parser.resolve_classes(self.classes)
+                resolved = (styles.get('text_color'), styles.get('font_size'), styles.get('font_weight'))
+                if len(_TEXT_STYLES) < _TEXT_STYLES_SIZE:
+                    _TEXT_STYLES[key] = resolved
+            color, font_size, font_weight = resolved
+            if color is not None:
+                self.color = color
+            if font_size is not None:
+                self.font_size = font_size
+            if font_weight is not None:
+                self.font_weight = font_weight
             
+    def fingerprint(self) -> tuple:
+        """Summarize what render() draws"""
+        return (self.x, self.y, self.text, self.color, self.font_size, self.font_weight)
+        
     def render(self, renderer):
         """Render the text"""
         # Basic text rendering
@@ -151,11 +231,17 @@ class Text(Component):
 class Input(Component):
     """A text input component"""
     
+    __slots__ = (
+        'placeholder', '_value_buf', '_value', '_value_dirty', 'background_color', 'text_color',
+        'border_color', 'border_width', 'padding', 'is_focused'
+    )
+    
+    style_parser = DEFAULT_PARSER
+    
     def __init__(self, placeholder: str = "", **props):
         super().__init__(**props)
         self.placeholder = placeholder
         self.value = ""
-        self.style_parser = StyleParser()
         self.background_color = (0.2, 0.2, 0.2, 1.0)
         self.text_color = (1.0, 1.0, 1.0, 1.0)
         self.border_color = (0.5, 0.5, 0.5, 1.0)
@@ -170,25 +256,57 @@ class Input(Component):
     def apply_styles(self):
         """Apply TailwindCSS-like styles"""
         if self.classes:
-            styles = self.style_parser.parse_classes(self.classes)
+            styles = self.style_parser.resolve_classes(self.classes)
             self.background_color = styles.get('background_color', self.background_color)
             self.text_color = styles.get('text_color', self.text_color)
             self.border_color = styles.get('border_color', self.border_color)
             self.border_width = styles.get('border_width', self.border_width)
             self.padding = styles.get('padding', self.padding)
             
+    @property
+    def value(self) -> str:
+        """Current text, joined from the edit buffer only when it has changed"""
+        if self._value_dirty:
+            self._value = ''.join(self._value_buf)
+            self._value_dirty = False
+        return self._value
+        
+    @value.setter
+    def value(self, text: str):
+        self._value_buf = list(text)
+        self._value = text
+        self._value_dirty = False
+        
+    def clone(self) -> 'Input':
+        """Copy the input, giving the clone its own edit buffer"""
+        clone = super().clone()
+        clone._value_buf = list(self._value_buf)
+        return clone
+        
     def handle_key_event(self, event_type: str, event_data):
         """Handle keyboard events"""
         if event_type == 'key_down':
+            # Edit the character buffer in place instead of copying the string per keystroke
             if event_data.key == 8:  # Backspace
-                self.value = self.value[:-1]
+                if self._value_buf:
+                    del self._value_buf[-1]
+                    self._value_dirty = True
             elif event_data.unicode:
-                self.value += event_data.unicode
+                self._value_buf.extend(event_data.unicode)
+                self._value_dirty = True
+            if self._value_dirty and self.context:
+                self.context.dirty = True
                 
+    def fingerprint(self) -> tuple:
+        """Summarize what render() draws"""
+        return (self.x, self.y, self.width, self.height, self.background_color, self.border_width,
+                self.border_color, self.is_focused, self.value, self.placeholder, self.text_color,
+                self.padding)
+        
     def render(self, renderer):
         """Render the input field"""
         # Render background
-        renderer.render_rectangle(self.x, self.y, self.width, self.height, self.background_color)
+        renderer.push_quad(self.x, self.y, self.width, self.height, self.background_color)
         
         # Render border
         if self.border_width > 0:
@@ -197,10 +315,7 @@ class Input(Component):
                 border_color = (0.2, 0.6, 1.0, 1.0)  # Blue when focused
                 
             # Render border
-            renderer.render_rectangle(self.x, self.y, self.width, self.border_width, border_color)
-            renderer.render_rectangle(self.x, self.y + self.height - self.border_width, self.width, self.border_width, border_color)
-            renderer.render_rectangle(self.x, self.y, self.border_width, self.height, border_color)
-            renderer.render_rectangle(self.x + self.width - self.border_width, self.y, self.border_width, self.height, border_color)
+            renderer.render_border(self.x, self.y, self.width, self.height, self.border_width, border_color)
             
         # Render text
         display_text = self.value if self.value else self.placeholder
@@ -1,14 +1,18 @@
 """
 Display components - Image, Icon, Divider for visual elements
 """
-from typing import Optional, Tuple
+from typing import Tuple
 from ..core.component import Component
-from ..styling.parser import StyleParser
 
 
 class Image(Component):
     """Image display component"""
     
+    __slots__ = (
+        'src', 'alt', 'fit', 'border_radius', 'image_data', 'image_width', 'image_height',
+        'background_color', '_display_cache_key', '_display_cache_val'
+    )
+    
     def __init__(self, src: str = "", **props):
         super().__init__(**props)
         self.src = src
@@ -24,6 +28,10 @@ class Image(Component):
         # Style properties
         self.background_color = (0.3, 0.3, 0.3, 1.0)  # Gray placeholder
         
+        # Last calculate_display_size() inputs and result
+        self._display_cache_key = None
+        self._display_cache_val = None
+        
     def load_image(self, src: str):
         """Load image from source"""
         self.src = src
@@ -31,6 +39,7 @@ class Image(Component):
         # For now, just set placeholder dimensions
         self.image_width = 200
         self.image_height = 150
+        self._display_cache_key = None
         
     def component_did_mount(self):
         """Load image when component mounts"""
@@ -39,6 +48,17 @@ class Image(Component):
             
     def calculate_display_size(self) -> Tuple[int, int, int, int]:
         """Calculate image display size based on fit mode"""
+        # Reuse the last result while the geometry and fit mode are unchanged
+        key = (self.x, self.y, self.width, self.height, self.image_width, self.image_height, self.fit)
+        if key == self._display_cache_key:
+            return self._display_cache_val
+            
+        self._display_cache_val = self._calculate_display_size()
+        self._display_cache_key = key
+        return self._display_cache_val
+        
+    def _calculate_display_size(self) -> Tuple[int, int, int, int]:
+        """Calculate image display size without consulting the cache"""
         if not self.image_width or not self.image_height:
             return self.x, self.y, self.width, self.height
             
@@ -91,10 +111,15 @@ class Image(Component):
             display_y = self.y + (self.height - self.image_height) // 2
             return display_x, display_y, self.image_width, self.image_height
             
+    def fingerprint(self) -> tuple:
+        """Summarize what render() draws"""
+        return (self.x, self.y, self.width, self.height, self.background_color, self.image_data,
+                self.alt, self.fit, self.image_width, self.image_height)
+        
     def render(self, renderer):
         """Render the image"""
         # Render background/placeholder
-        renderer.render_rectangle(self.x, self.y, self.width, self.height, self.background_color)
+        renderer.push_quad(self.x, self.y, self.width, self.height, self.background_color)
         
         if self.image_data:
             # In a full implementation, render the actual image
@@ -108,39 +133,60 @@ class Image(Component):
                 # renderer.render_text(self.alt, text_x, text_y, (1.0, 1.0, 1.0, 1.0))
 
 
+# Icon library (simplified - in full implementation use icon fonts or SVG)
+_ICON_TABLE = {
+    'home': '🏠',
+    'user': '👤',
+    'settings': '⚙️',
+    'search': '🔍',
+    'heart': '❤️',
+    'star': '⭐',
+    'check': '✓',
+    'close': '✕',
+    'arrow_up': '↑',
+    'arrow_down': '↓',
+    'arrow_left': '←',
+    'arrow_right': '→',
+    'menu': '☰',
+    'info': 'ℹ️',
+    'warning': '⚠️',
+    'error': '❌',
+    'success': '✅'
+}
+
+
 class Icon(Component):
     """Icon display component"""
     
+    __slots__ = ('_name', '_icon_char', 'size', 'color')
+    
+    # Shared by all icons
+    icons = _ICON_TABLE
+    
     def __init__(self, name: str = "", **props):
         super().__init__(**props)
         self.name = name
         self.size = props.get('size', 24)
         self.color = props.get('color', (1.0, 1.0, 1.0, 1.0))
         
-        # Icon library (simplified - in full implementation use icon fonts or SVG)
-        self.icons = {
-            'home': '🏠',
-            'user': '👤',
-            'settings': '⚙️',
-            'search': '🔍',
-            'heart': '❤️',
-            'star': '⭐',
-            'check': '✓',
-            'close': '✕',
-            'arrow_up': '↑',
-            'arrow_down': '↓',
-            'arrow_left': '←',
-            'arrow_right': '→',
-            'menu': '☰',
-            'info': 'ℹ️',
-            'warning': '⚠️',
-            'error': '❌',
-            'success': '✅'
-        }
+    @property
+    def name(self) -> str:
+        """Icon name"""
+        return self._name
+        
+    @name.setter
+    def name(self, value: str):
+        # Resolve the glyph once instead of on every render
+        self._name = value
+        self._icon_char = self.icons.get(value, '?')
+        
+    def fingerprint(self) -> tuple:
+        """Summarize what render() draws"""
+        return (self.x, self.y, self.width, self.height, self._icon_char, self.size, self.color)
         
     def render(self, renderer):
         """Render the icon"""
-        icon_char = self.icons.get(self.name, '?')
+        icon_char = self._icon_char
         
         # Center the icon
         text_x = self.x + (self.width - self.size) // 2
@@ -154,6 +200,8 @@ class Icon(Component):
 class Divider(Component):
     """Divider component for visual separation"""
     
+    __slots__ = ('orientation', 'thickness', 'color', 'margin')
+    
     def __init__(self, **props):
         super().__init__(**props)
         self.orientation = props.get('orientation', 'horizontal')  # horizontal or vertical
@@ -161,6 +209,11 @@ class Divider(Component):
         self.color = props.get('color', (0.5, 0.5, 0.5, 1.0))
         self.margin = props.get('margin', 0)
         
+    def fingerprint(self) -> tuple:
+        """Summarize what render() draws"""
+        return (self.x, self.y, self.width, self.height, self.orientation, self.thickness,
+                self.color, self.margin)
+        
     def render(self, renderer):
         """Render the divider"""
         if self.orientation == 'horizontal':
@@ -176,12 +229,14 @@ class Divider(Component):
             divider_width = self.thickness
             divider_height = self.height - 2 * self.margin
             
-        renderer.render_rectangle(divider_x, divider_y, divider_width, divider_height, self.color)
+        renderer.push_quad(divider_x, divider_y, divider_width, divider_height, self.color)
 
 
 class Card(Component):
     """Card component with shadow and rounded corners"""
     
+    __slots__ = ('background_color', 'border_radius', 'shadow_color', 'shadow_offset', 'shadow_blur', 'padding')
+    
     def __init__(self, **props):
         super().__init__(**props)
         self.background_color = props.get('background_color', (0.2, 0.2, 0.2, 1.0))
@@ -191,22 +246,29 @@ class Card(Component):
         self.shadow_blur = props.get('shadow_blur', 4)
         self.padding = props.get('padding', 16)
         
+    def fingerprint(self) -> tuple:
+        """Summarize what render() draws"""
+        return (self.x, self.y, self.width, self.height, self.background_color, self.shadow_color,
+                self.shadow_offset, self.shadow_blur)
+        
     def render(self, renderer):
         """Render the card"""
-        # Render shadow
+        # Render shadow, softened in the same batch as the solid quads
         shadow_x = self.x + self.shadow_offset[0]
         shadow_y = self.y + self.shadow_offset[1]
-        renderer.render_rectangle(shadow_x, shadow_y, self.width, self.height, self.shadow_color)
+        renderer.push_quad(shadow_x, shadow_y, self.width, self.height, self.shadow_color, self.shadow_blur)
         
         # Render card background
-        renderer.render_rectangle(self.x, self.y, self.width, self.height, self.background_color)
+        renderer.push_quad(self.x, self.y, self.width, self.height, self.background_color)
         
-        # In a full implementation, apply border radius and blur effects
+        # In a full implementation, apply border radius
 
 
 class Badge(Component):
     """Badge component for notifications and labels"""
     
+    __slots__ = ('text', 'background_color', 'text_color', 'border_radius', 'padding')
+    
     def __init__(self, text: str = "", **props):
         super().__init__(**props)
         self.text = text
@@ -215,10 +277,15 @@ class Badge(Component):
         self.border_radius = props.get('border_radius', 12)
         self.padding = props.get('padding', 4)
         
+    def fingerprint(self) -> tuple:
+        """Summarize what render() draws"""
+        return (self.x, self.y, self.width, self.height, self.background_color, self.text,
+                self.text_color, self.padding)
+        
     def render(self, renderer):
         """Render the badge"""
         # Render background
-        renderer.render_rectangle(self.x, self.y, self.width, self.height, self.background_color)
+        renderer.push_quad(self.x, self.y, self.width, self.height, self.background_color)
         
         # Render text
         text_x = self.x + self.padding
@@ -229,6 +296,11 @@ class Badge(Component):
 class Progress(Component):
     """Progress bar component"""
     
+    __slots__ = (
+        'value', 'max_value', 'background_color', 'fill_color', 'border_radius', 'show_text',
+        '_cached_value', '_cached_max', '_cached_width', '_cached_fill_width', '_cached_text'
+    )
+    
     def __init__(self, **props):
         super().__init__(**props)
         self.value = props.get('value', 0)  # 0-100
@@ -238,22 +310,41 @@ class Progress(Component):
         self.border_radius = props.get('border_radius', 4)
         self.show_text = props.get('show_text', False)
         
+        # Fill width and label for the last rendered value
+        self._cached_value = None
+        self._cached_max = None
+        self._cached_width = None
+        self._cached_fill_width = 0
+        self._cached_text = ""
+        
+    def fingerprint(self) -> tuple:
+        """Summarize what render() draws"""
+        return (self.x, self.y, self.width, self.height, self.value, self.max_value,
+                self.background_color, self.fill_color, self.show_text)
+        
     def render(self, renderer):
         """Render the progress bar"""
         # Render background
-        renderer.render_rectangle(self.x, self.y, self.width, self.height, self.background_color)
+        renderer.push_quad(self.x, self.y, self.width, self.height, self.background_color)
         
-        # Calculate fill width
-        progress_ratio = min(max(self.value / self.max_value, 0), 1)
-        fill_width = int(self.width * progress_ratio)
+        # Calculate fill width and label only when the inputs changed
+        if (self.value != self._cached_value or self.max_value != self._cached_max or
+                self.width != self._cached_width):
+            progress_ratio = min(max(self.value / self.max_value, 0), 1)
+            self._cached_fill_width = int(self.width * progress_ratio)
+            self._cached_text = f"{int(progress_ratio * 100)}%"
+            self._cached_value = self.value
+            self._cached_max = self.max_value
+            self._cached_width = self.width
+        fill_width = self._cached_fill_width
         
         # Render fill
         if fill_width > 0:
-            renderer.render_rectangle(self.x, self.y, fill_width, self.height, self.fill_color)
+            renderer.push_quad(self.x, self.y, fill_width, self.height, self.fill_color)
             
         # Render text if enabled
         if self.show_text:
-            progress_text = f"{int(progress_ratio * 100)}%"
+            progress_text = self._cached_text
             text_x = self.x + self.width // 2 - len(progress_text) * 4
             text_y = self.y + self.height // 2 - 8
             # renderer.render_text(progress_text, text_x, text_y, (1.0, 1.0, 1.0, 1.0))
\ No newline at end of file
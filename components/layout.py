@@ -1,172 +1,302 @@
 """
 Layout components - Row, Column, Stack, Grid for organizing UI elements
 """
-from typing import List, Dict, Any, Optional
+import numpy as np
+from typing import List, Optional
 from ..core.component import Component
-from ..styling.parser import StyleParser
 
+try:
+    from numba import njit
+except ImportError:  # Numba is an optional accelerator
+    njit = None
 
-class Row(Component):
+
+def _main_axis_offsets(sizes: np.ndarray, gap: float) -> np.ndarray:
+    """Offset of each child along the main axis when packed with 'gap' between them"""
+    steps = sizes + gap
+    return np.cumsum(steps) - steps
+
+
+def _space_between(free: float, gap: float, count: int):
+    """Spread the free space evenly between children"""
+    return 0, (free / (count - 1) if count > 1 else gap)
+
+
+# justify_content -> f(free space, gap, child count) returning (start offset, gap size)
+_JUSTIFY = {
+    'start': lambda free, gap, count: (0, gap),
+    'center': lambda free, gap, count: (free // 2, gap),
+    'end': lambda free, gap, count: (free, gap),
+    'space-between': _space_between,
+}
+
+
+def _cross_axis_offsets(sizes: np.ndarray, extent: float, align: str) -> np.ndarray:
+    """Offset of each child across the main axis for the given alignment"""
+    if align == 'center':
+        return (extent - sizes) // 2
+    elif align == 'end':
+        return extent - sizes
+    return np.zeros_like(sizes)
+
+
+def _child_sizes(children: List[Component]):
+    """Gather child sizes into (widths, heights) arrays"""
+    return (np.array([child.width for child in children]),
+            np.array([child.height for child in children]))
+
+
+def _grid_fill(columns: int, x: float, y: float, column_stride: float, row_stride: float,
+               xs: np.ndarray, ys: np.ndarray):
+    """Fill xs/ys with the cell origins of a row-major grid"""
+    # Repeat one row of column offsets and one offset per row; no per-cell division
+    count = len(xs)
+    rows = -(-count // columns)
+    xs[:] = np.resize(x + np.arange(columns) * column_stride, count)
+    ys[:] = np.repeat(y + np.arange(rows) * row_stride, columns)[:count]
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _grid_fill(columns, x, y, column_stride, row_stride, xs, ys):
+        col = 0
+        row_y = y
+        for i in range(xs.shape[0]):
+            xs[i] = x + col * column_stride
+            ys[i] = row_y
+            col += 1
+            if col == columns:
+                col = 0
+                row_y += row_stride
+
+
+# Cell offsets from the grid origin keyed by (count, columns, column stride, row stride);
+# a static grid hits the same entry on every pass. Bounded so resizing can't grow it forever
+_GRID_OFFSETS = {}
+_GRID_OFFSETS_SIZE = 256
+
+
+def _grid_offsets(count: int, columns: int, column_stride, row_stride):
+    """Read-only (dx, dy) cell offset arrays for a row-major grid, built once per shape"""
+    key = (count, columns, column_stride, row_stride)
+    offsets = _GRID_OFFSETS.get(key)
+    if offsets is None:
+        dtype = np.result_type(column_stride, row_stride)
+        dx = np.empty(count, dtype=dtype)
+        dy = np.empty(count, dtype=dtype)
+        _grid_fill(columns, 0, 0, column_stride, row_stride, dx, dy)
+        dx.flags.writeable = False
+        dy.flags.writeable = False
+        offsets = (dx, dy)
+        if len(_GRID_OFFSETS) < _GRID_OFFSETS_SIZE:
+            _GRID_OFFSETS[key] = offsets
+    return offsets
+
+
+def _grid_positions(count: int, columns: int, x, y, cell_width, cell_height, column_gap, row_gap):
+    """Cell (x, y, width, height) arrays for 'count' children in a row-major grid"""
+    dtype = np.result_type(x, y, cell_width, cell_height, column_gap, row_gap)
+    dx, dy = _grid_offsets(count, columns, cell_width + column_gap, cell_height + row_gap)
+    xs = np.add(dx, x, dtype=dtype)
+    ys = np.add(dy, y, dtype=dtype)
+    return xs, ys, np.full(count, cell_width, dtype=dtype), np.full(count, cell_height, dtype=dtype)
+
+
+def _empty_store():
+    """Empty (x, y, width, height) child geometry arrays"""
+    return tuple(np.zeros(0, dtype=np.int64) for _ in range(4))
+
+
+class LayoutContainer(Component):
+    """Base class for components that position their children
+    
+    Layout runs at the start of update() and only when the container's
+    geometry or children have changed since the last pass.
+    """
+    
+    __slots__ = ('_layout_dirty', '_child_x', '_child_y', '_child_w', '_child_h')
+    
+    def __init__(self, **props):
+        super().__init__(**props)
+        self._layout_dirty = True
+        
+    def mark_layout_dirty(self):
+        """Request a layout pass on the next update"""
+        self._layout_dirty = True
+        
+    def relayout_if_dirty(self):
+        """Layout children if anything affecting layout changed"""
+        # Inside batch_updates() the pass waits for the outermost block to exit
+        if self._layout_dirty and not self.in_batch():
+            self.layout_children()
+            # Cleared afterwards so resizes made by the pass itself don't re-dirty it
+            self._layout_dirty = False
+            
+    def layout_children(self):
+        """Position the children - override in subclasses"""
+        pass
+        
+    def update(self):
+        """Re-layout if needed, then update the component and its children"""
+        self.relayout_if_dirty()
+        super().update()
+        
+    def component_did_mount(self):
+        """Layout children when component mounts"""
+        self.relayout_if_dirty()
+        
+    def set_position(self, x: int, y: int):
+        """Set the position and re-layout children if it moved"""
+        if x != self.x or y != self.y:
+            self._layout_dirty = True
+        super().set_position(x, y)
+        
+    def set_size(self, width: int, height: int):
+        """Set the size and re-layout children if it changed"""
+        if width != self.width or height != self.height:
+            self._layout_dirty = True
+        super().set_size(width, height)
+        
+    def set_geometry(self, x: Optional[int] = None, y: Optional[int] = None,
+                     width: Optional[int] = None, height: Optional[int] = None):
+        """Set position and size together and re-layout children if either changed"""
+        if ((x is not None and x != self.x) or (y is not None and y != self.y) or
+                (width is not None and width != self.width) or
+                (height is not None and height != self.height)):
+            self._layout_dirty = True
+        super().set_geometry(x, y, width, height)
+        
+    def add_child(self, child: Component):
+        """Add a child component and re-layout"""
+        super().add_child(child)
+        self._layout_dirty = True
+        
+    def add_children(self, children: List[Component]):
+        """Add several child components and re-layout once"""
+        super().add_children(children)
+        self._layout_dirty = True
+        
+    def remove_child(self, child: Component):
+        """Remove a child component and re-layout"""
+        super().remove_child(child)
+        self._layout_dirty = True
+        
+    def child_resized(self, child: Component):
+        """A child's size changed, so positions may need updating"""
+        self._layout_dirty = True
+        
+    def children_visible(self, viewport: tuple) -> bool:
+        """Children are laid out inside the container, so skip them all when it is off-screen"""
+        return self.is_visible(viewport)
+        
+    def fingerprint(self) -> tuple:
+        """Layout containers draw nothing themselves"""
+        return ()
+
+
+class Row(LayoutContainer):
     """Horizontal layout component"""
     
+    __slots__ = ('gap', 'align_items', 'justify_content')
+    
     def __init__(self, **props):
         super().__init__(**props)
         self.gap = props.get('gap', 0)
         self.align_items = props.get('align_items', 'start')  # start, center, end, stretch
         self.justify_content = props.get('justify_content', 'start')  # start, center, end, space-between, space-around
         
-    def component_did_mount(self):
-        """Layout children when component mounts"""
-        self.layout_children()
+        # Child geometry from the last layout pass, one entry per child
+        self._child_x, self._child_y, self._child_w, self._child_h = _empty_store()
         
     def layout_children(self):
         """Layout children horizontally"""
-        if not self.children:
+        children = self.children
+        if not children:
             return
             
-        available_width = self.width - (len(self.children) - 1) * self.gap
-        
-        # Calculate child widths based on justify_content
-        if self.justify_content == 'start':
-            child_x = self.x
-            for child in self.children:
-                child.set_position(child_x, self.calculate_child_y(child))
-                child_x += child.width + self.gap
-                
-        elif self.justify_content == 'center':
-            total_child_width = sum(child.width for child in self.children)
-            start_x = self.x + (available_width - total_child_width) // 2
-            child_x = start_x
-            for child in self.children:
-                child.set_position(child_x, self.calculate_child_y(child))
-                child_x += child.width + self.gap
-                
-        elif self.justify_content == 'end':
-            total_child_width = sum(child.width for child in self.children)
-            start_x = self.x + available_width - total_child_width
-            child_x = start_x
-            for child in self.children:
-                child.set_position(child_x, self.calculate_child_y(child))
-                child_x += child.width + self.gap
-                
-        elif self.justify_content == 'space-between':
-            if len(self.children) == 1:
-                self.children[0].set_position(self.x, self.calculate_child_y(self.children[0]))
-            else:
-                total_child_width = sum(child.width for child in self.children)
-                remaining_space = available_width - total_child_width
-                gap_size = remaining_space / (len(self.children) - 1)
-                
-                child_x = self.x
-                for child in self.children:
-                    child.set_position(child_x, self.calculate_child_y(child))
-                    child_x += child.width + gap_size
-                    
-    def calculate_child_y(self, child):
-        """Calculate Y position based on align_items"""
-        if self.align_items == 'start':
-            return self.y
-        elif self.align_items == 'center':
-            return self.y + (self.height - child.height) // 2
-        elif self.align_items == 'end':
-            return self.y + self.height - child.height
-        elif self.align_items == 'stretch':
-            child.set_size(child.width, self.height)
-            return self.y
-        else:
-            return self.y
+        count = len(children)
+        available_width = self.width - (count - 1) * self.gap
+        self._child_w, self._child_h = _child_sizes(children)
+        total_child_width = self._child_w.sum()
+        
+        # Look up the first child's offset and the spacing for justify_content
+        justify = _JUSTIFY.get(self.justify_content)
+        if justify is None:
+            return
+        start_offset, gap_size = justify(available_width - total_child_width, self.gap, count)
+        start_x = self.x + start_offset
+            
+        # Compute every position at once, then write them back to the children
+        if self.align_items == 'stretch':
+            self._child_h[:] = self.height
+            for child in children:
+                child.set_size(child.width, self.height)
+        self._child_x = start_x + _main_axis_offsets(self._child_w, gap_size)
+        self._child_y = self.y + _cross_axis_offsets(self._child_h, self.height, self.align_items)
+        for child, child_x, child_y in zip(children, self._child_x.tolist(), self._child_y.tolist()):
+            child.set_position(child_x, child_y)
             
     def render(self, renderer):
         """Render the row (layout only, no visual representation)"""
         pass
 
 
-class Column(Component):
+class Column(LayoutContainer):
     """Vertical layout component"""
     
+    __slots__ = ('gap', 'align_items', 'justify_content')
+    
     def __init__(self, **props):
         super().__init__(**props)
         self.gap = props.get('gap', 0)
         self.align_items = props.get('align_items', 'start')  # start, center, end, stretch
         self.justify_content = props.get('justify_content', 'start')  # start, center, end, space-between, space-around
         
-    def component_did_mount(self):
-        """Layout children when component mounts"""
-        self.layout_children()
+        # Child geometry from the last layout pass, one entry per child
+        self._child_x, self._child_y, self._child_w, self._child_h = _empty_store()
         
     def layout_children(self):
         """Layout children vertically"""
-        if not self.children:
+        children = self.children
+        if not children:
             return
             
-        available_height = self.height - (len(self.children) - 1) * self.gap
-        
-        # Calculate child positions based on justify_content
-        if self.justify_content == 'start':
-            child_y = self.y
-            for child in self.children:
-                child.set_position(self.calculate_child_x(child), child_y)
-                child_y += child.height + self.gap
-                
-        elif self.justify_content == 'center':
-            total_child_height = sum(child.height for child in self.children)
-            start_y = self.y + (available_height - total_child_height) // 2
-            child_y = start_y
-            for child in self.children:
-                child.set_position(self.calculate_child_x(child), child_y)
-                child_y += child.height + self.gap
-                
-        elif self.justify_content == 'end':
-            total_child_height = sum(child.height for child in self.children)
-            start_y = self.y + available_height - total_child_height
-            child_y = start_y
-            for child in self.children:
-                child.set_position(self.calculate_child_x(child), child_y)
-                child_y += child.height + self.gap
-                
-        elif self.justify_content == 'space-between':
-            if len(self.children) == 1:
-                self.children[0].set_position(self.calculate_child_x(self.children[0]), self.y)
-            else:
-                total_child_height = sum(child.height for child in self.children)
-                remaining_space = available_height - total_child_height
-                gap_size = remaining_space / (len(self.children) - 1)
-                
-                child_y = self.y
-                for child in self.children:
-                    child.set_position(self.calculate_child_x(child), child_y)
-                    child_y += child.height + gap_size
-                    
-    def calculate_child_x(self, child):
-        """Calculate X position based on align_items"""
-        if self.align_items == 'start':
-            return self.x
-        elif self.align_items == 'center':
-            return self.x + (self.width - child.width) // 2
-        elif self.align_items == 'end':
-            return self.x + self.width - child.width
-        elif self.align_items == 'stretch':
-            child.set_size(self.width, child.height)
-            return self.x
-        else:
-            return self.x
+        count = len(children)
+        available_height = self.height - (count - 1) * self.gap
+        self._child_w, self._child_h = _child_sizes(children)
+        total_child_height = self._child_h.sum()
+        
+        # Look up the first child's offset and the spacing for justify_content
+        justify = _JUSTIFY.get(self.justify_content)
+        if justify is None:
+            return
+        start_offset, gap_size = justify(available_height - total_child_height, self.gap, count)
+        start_y = self.y + start_offset
+            
+        # Compute every position at once, then write them back to the children
+        if self.align_items == 'stretch':
+            self._child_w[:] = self.width
+            for child in children:
+                child.set_size(self.width, child.height)
+        self._child_x = self.x + _cross_axis_offsets(self._child_w, self.width, self.align_items)
+        self._child_y = start_y + _main_axis_offsets(self._child_h, gap_size)
+        for child, child_x, child_y in zip(children, self._child_x.tolist(), self._child_y.tolist()):
+            child.set_position(child_x, child_y)
             
     def render(self, renderer):
         """Render the column (layout only, no visual representation)"""
         pass
 
 
-class Stack(Component):
+class Stack(LayoutContainer):
     """Stack layout component (children stacked on top of each other)"""
     
+    __slots__ = ('align_items',)
+    
     def __init__(self, **props):
         super().__init__(**props)
         self.align_items = props.get('align_items', 'center')  # start, center, end, stretch
         
-    def component_did_mount(self):
-        """Layout children when component mounts"""
-        self.layout_children()
-        
     def layout_children(self):
         """Stack children on top of each other"""
         for child in self.children:
@@ -189,9 +319,11 @@ class Stack(Component):
         pass
 
 
-class Grid(Component):
+class Grid(LayoutContainer):
     """Grid layout component"""
     
+    __slots__ = ('columns', 'rows', 'gap', 'column_gap', 'row_gap')
+    
     def __init__(self, **props):
         super().__init__(**props)
         self.columns = props.get('columns', 2)
@@ -200,9 +332,8 @@ class Grid(Component):
         self.column_gap = props.get('column_gap', self.gap)
         self.row_gap = props.get('row_gap', self.gap)
         
-    def component_did_mount(self):
-        """Layout children when component mounts"""
-        self.layout_children()
+        # Child geometry from the last layout pass, one entry per child
+        self._child_x, self._child_y, self._child_w, self._child_h = _empty_store()
         
     def layout_children(self):
         """Layout children in a grid"""
@@ -220,16 +351,14 @@ class Grid(Component):
         cell_width = available_width // total_columns
         cell_height = available_height // total_rows
         
-        # Position children
-        for i, child in enumerate(self.children):
-            col = i % total_columns
-            row = i // total_columns
-            
-            child_x = self.x + col * (cell_width + self.column_gap)
-            child_y = self.y + row * (cell_height + self.row_gap)
-            
-            child.set_position(child_x, child_y)
-            child.set_size(cell_width, cell_height)
+        # Offset the cached cell pattern to the grid's origin, then write it back to the children
+        self._child_x, self._child_y, self._child_w, self._child_h = _grid_positions(
+            len(self.children), total_columns, self.x, self.y,
+            cell_width, cell_height, self.column_gap, self.row_gap
+        )
+        
+        for child, child_x, child_y in zip(self.children, self._child_x.tolist(), self._child_y.tolist()):
+            child.set_geometry(child_x, child_y, cell_width, cell_height)
             
     def render(self, renderer):
         """Render the grid (layout only, no visual representation)"""
@@ -6,7 +6,7 @@ from .application import Application
 from .window import Window
 from .component import Component
 from .renderer import Renderer
-from .events import EventManager
+from .events import EventManager, EventData
 from .context import Context
 
 __all__ = [
@@ -15,5 +15,6 @@ __all__ = [
     "Component", 
     "Renderer",
     "EventManager",
+    "EventData",
     "Context"
 ]
\ No newline at end of file
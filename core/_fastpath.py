@@ -0,0 +1,33 @@
+"""
+Fast paths - Numeric kernels for the renderer, compiled with Numba when it is installed
+"""
+
+try:
+    from numba import njit
+except ImportError:  # Numba is an optional accelerator
+    njit = None
+
+
+def fill_circle(verts, colors, x, y, r, color, ccos, csin):
+    """Fill a circle's triangle-fan vertices: the center, then one per table entry
+    
+    'verts' holds float32 positions in columns 0-1 and 'colors' is a uint32
+    view of its packed color column.
+    """
+    verts[0, 0] = x
+    verts[0, 1] = y
+    verts[1:, 0] = x + r * ccos
+    verts[1:, 1] = y + r * csin
+    colors[:] = color
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def fill_circle(verts, colors, x, y, r, color, ccos, csin):
+        verts[0, 0] = x
+        verts[0, 1] = y
+        colors[0] = color
+        for i in range(ccos.shape[0]):
+            verts[i + 1, 0] = x + r * ccos[i]
+            verts[i + 1, 1] = y + r * csin[i]
+            colors[i + 1] = color
@@ -3,6 +3,7 @@ Application - The main application class that manages the entire GUI lifecycle
 """
 import pygame
 import sys
+import time
 from typing import Optional
 from .window import Window
 from .events import EventManager
@@ -12,6 +13,9 @@ from .context import Context
 class Application:
     """Main application class that manages the GUI lifecycle"""
     
+    # Event types dropped before they reach the queue
+    NOISY_EVENTS = [pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION]
+    
     def __init__(self, name: str = "ModernGUI App"):
         self.name = name
         self.running = False
@@ -30,6 +34,7 @@ class Application:
     def create_window(self, title: str = "ModernGUI Window", width: int = 800, height: int = 600) -> Window:
         """Create the main application window"""
         self.window = Window(title, width, height, self.context)
+        self.event_manager.window = self.window
         return self.window
         
     def run(self):
@@ -40,28 +45,50 @@ class Application:
         self.running = True
         clock = pygame.time.Clock()
         
+        # Keep high-rate input nothing handles out of the queue; everything else,
+        # including user and window events, still gets through
+        pygame.event.set_blocked(self.NOISY_EVENTS)
+        
+        last_tick = time.perf_counter()
         while self.running:
-            # Handle events
+            # Handle events, collapsing each run of mouse motion into its last event
+            last_motion = None
             for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                else:
-                    self.event_manager.handle_event(event)
+                if event.type == pygame.MOUSEMOTION:
+                    last_motion = event
+                    continue
+                if last_motion is not None:
+                    self._handle_event(last_motion)
+                    last_motion = None
+                self._handle_event(event)
+            if last_motion is not None:
+                self._handle_event(last_motion)
                     
-            # Update window
-            self.window.update()
+            # Tick animated components, then walk the tree only if something changed
+            now = time.perf_counter()
+            self.context.tick(now - last_tick)
+            last_tick = now
+            if self.context.dirty:
+                self.window.update()
             
-            # Render window
-            self.window.render()
-            
-            # Swap buffers
-            pygame.display.flip()
+            # Render window, and only swap buffers if a new frame was drawn
+            if self.window.render():
+                pygame.display.flip()
             
             # Control frame rate
             clock.tick(60)
             
         self.quit()
         
+    def _handle_event(self, event):
+        """Dispatch one pygame event"""
+        if event.type == pygame.QUIT:
+            self.running = False
+        else:
+            self.event_manager.handle_event(event)
+            # Input may change hover/press/focus state
+            self.context.mark_dirty()
+            
     def quit(self):
         """Clean up and quit the application"""
         self.running = False
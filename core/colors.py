@@ -0,0 +1,30 @@
+"""
+Color packing shared by the renderer and the components that pre-resolve draw calls
+"""
+from typing import Tuple, Union
+
+
+# Packed RGBA8 value of each color seen so far, bounded so ad-hoc colors can't grow it forever
+_PACKED_COLORS = {}
+_PACKED_COLORS_SIZE = 4096
+
+
+def pack_color(color: Union[Tuple[float, float, float, float], int]) -> int:
+    """Pack an (r, g, b, a) color with 0-1 channels into RGBA8 as one uint32
+    
+    Red is the low byte, so on little-endian hosts the bytes are laid out as
+    the normalized ubyte4 vertex attribute expects. An int is taken to be a
+    color this function already packed and is returned as is, so callers can
+    pack constant colors once instead of every frame.
+    """
+    if type(color) is int:
+        return color
+    if type(color) is not tuple:
+        color = tuple(color)
+    packed = _PACKED_COLORS.get(color)
+    if packed is None:
+        r, g, b, a = (min(max(int(round(c * 255)), 0), 255) for c in color)
+        packed = r | g << 8 | b << 16 | a << 24
+        if len(_PACKED_COLORS) < _PACKED_COLORS_SIZE:
+            _PACKED_COLORS[color] = packed
+    return packed
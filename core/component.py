@@ -1,6 +1,8 @@
 """
 Component - Base class for all UI components with React-like architecture
 """
+import copy
+from contextlib import contextmanager
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any, Callable
 from .context import Context
@@ -9,6 +11,13 @@ from .context import Context
 class Component(ABC):
     """Base class for all UI components with React-like architecture"""
     
+    __slots__ = (
+        'props', 'state', 'children', 'parent', 'context',
+        'x', 'y', 'width', 'height', 'opacity', 'scale_x', 'scale_y',
+        'rotation', 'rotation_x', 'rotation_y', 'classes', 'style',
+        'event_handlers', 'mounted', 'needs_update', '_batch_depth', '__weakref__'
+    )
+    
     def __init__(self, **props):
         self.props = props
         self.state = {}
@@ -22,6 +31,14 @@ class Component(ABC):
         self.width = 0
         self.height = 0
         
+        # Transform properties animated by Animator and Transition
+        self.opacity = 1.0
+        self.scale_x = 1.0
+        self.scale_y = 1.0
+        self.rotation = 0.0
+        self.rotation_x = 0.0
+        self.rotation_y = 0.0
+        
         # Style properties
         self.classes = props.get('classes', '')
         self.style = props.get('style', {})
@@ -33,6 +50,10 @@ class Component(ABC):
         self.mounted = False
         self.needs_update = True
         
+        # Number of batch_updates() blocks open on this component; layout passes in
+        # its subtree wait while it or any ancestor has one open
+        self._batch_depth = 0
+        
         # Call constructor hook
         self.constructor()
         
@@ -57,14 +78,97 @@ class Component(ABC):
             child.set_context(self.context)
         self.children.append(child)
         self.needs_update = True
+        if self.context:
+            self.context.invalidate_tree()
         
+    def add_children(self, children: List['Component']):
+        """Add several child components, invalidating the tree once"""
+        children = list(children)
+        for child in children:
+            child.set_parent(self)
+            if self.context:
+                child.set_context(self.context)
+        self.children.extend(children)
+        self.needs_update = True
+        if self.context:
+            self.context.invalidate_tree()
+            
     def remove_child(self, child: 'Component'):
         """Remove a child component"""
         if child in self.children:
             child.set_parent(None)
             self.children.remove(child)
             self.needs_update = True
+            if self.context:
+                self.context.invalidate_tree()
+                
+            # Unmount the removed subtree so adding it back mounts it, and registers its tickers, again
+            for component in child.flatten()[0]:
+                if component.mounted:
+                    component.component_will_unmount()
+                    component.mounted = False
+                if self.context:
+                    self.context.remove_ticker(component)
             
+    @contextmanager
+    def batch_updates(self):
+        """Defer layout passes while building or rearranging this subtree
+        
+        Layout containers keep collecting invalidations inside the block, and
+        the subtree is laid out once when the outermost block exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+        if not self.in_batch():
+            # Depth-first order lays out parents before the children they resize
+            for component in self.flatten()[0]:
+                component.relayout_if_dirty()
+            if self.context:
+                self.context.mark_dirty()
+                
+    def in_batch(self) -> bool:
+        """Check if this component or an ancestor has a batch_updates() block open"""
+        component = self
+        while component is not None:
+            if component._batch_depth:
+                return True
+            component = component.parent
+        return False
+        
+    def relayout_if_dirty(self):
+        """Run a pending layout pass - override in layout components"""
+        pass
+        
+    def clone(self) -> 'Component':
+        """Copy this component and its subtree, detached from any parent or context
+        
+        Attributes are copied shallowly; props, state, style and event handler
+        containers get their own copies so the clone can be changed independently.
+        """
+        clone = copy.copy(self)
+        clone.props = dict(self.props)
+        clone.state = dict(self.state)
+        clone.style = dict(self.style)
+        clone.event_handlers = {name: list(handlers) for name, handlers in self.event_handlers.items()}
+        clone.parent = None
+        clone.context = None
+        clone.mounted = False
+        clone.needs_update = True
+        clone._batch_depth = 0
+        clone.children = []
+        clone.add_children([child.clone() for child in self.children])
+        return clone
+        
+    def patch(self, **attributes) -> 'Component':
+        """Set several attributes at once and return the component"""
+        for name, value in attributes.items():
+            setattr(self, name, value)
+        self.needs_update = True
+        return self
+        
     def get_state(self, key: str, default: Any = None) -> Any:
         """Get a value from component state"""
         return self.state.get(key, default)
@@ -73,6 +177,8 @@ class Component(ABC):
         """Set a value in component state and trigger update"""
         self.state[key] = value
         self.needs_update = True
+        if self.context:
+            self.context.dirty = True
         
     def get_prop(self, key: str, default: Any = None) -> Any:
         """Get a property value"""
@@ -82,6 +188,8 @@ class Component(ABC):
         """Set a property value"""
         self.props[key] = value
         self.needs_update = True
+        if self.context:
+            self.context.dirty = True
         
     def add_event_handler(self, event_type: str, handler: Callable):
         """Add an event handler"""
@@ -112,6 +220,10 @@ class Component(ABC):
         """Called after component is updated"""
         pass
         
+    def on_tick(self, dt: float):
+        """Called every frame with the seconds since the last one - override for animation"""
+        pass
+        
     def should_component_update(self) -> bool:
         """Determine if component should update"""
         return self.needs_update
@@ -121,6 +233,9 @@ class Component(ABC):
         if not self.mounted:
             self.component_did_mount()
             self.mounted = True
+            # Components that override on_tick() get per-frame ticks from the context
+            if self.context and type(self).on_tick is not Component.on_tick:
+                self.context.add_ticker(self)
             
         if self.should_component_update():
             self.component_did_update()
@@ -132,18 +247,100 @@ class Component(ABC):
             
     def set_position(self, x: int, y: int):
         """Set the position of the component"""
+        if x == self.x and y == self.y:
+            return
         self.x = x
         self.y = y
+        if self.context:
+            self.context.dirty = True
+            self.context.geometry_version += 1
         
     def set_size(self, width: int, height: int):
         """Set the size of the component"""
+        if width == self.width and height == self.height:
+            return
         self.width = width
         self.height = height
+        if self.context:
+            self.context.dirty = True
+            self.context.geometry_version += 1
+            
+        # Let the parent re-layout around the new size
+        if self.parent is not None:
+            self.parent.child_resized(self)
+            
+    def set_geometry(self, x: Optional[int] = None, y: Optional[int] = None,
+                     width: Optional[int] = None, height: Optional[int] = None):
+        """Set position and size together, invalidating once; None keeps a field as is"""
+        x = self.x if x is None else x
+        y = self.y if y is None else y
+        width = self.width if width is None else width
+        height = self.height if height is None else height
+        
+        resized = width != self.width or height != self.height
+        if not resized and x == self.x and y == self.y:
+            return
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        if self.context:
+            self.context.dirty = True
+            self.context.geometry_version += 1
+            
+        # Let the parent re-layout around the new size
+        if resized and self.parent is not None:
+            self.parent.child_resized(self)
+            
+    def child_resized(self, child: 'Component'):
+        """Called when a child's size changes - override in layout components"""
+        pass
         
     def get_bounds(self) -> tuple:
         """Get the bounding box of the component"""
         return (self.x, self.y, self.width, self.height)
         
+    def is_visible(self, viewport: tuple) -> bool:
+        """Check if the component's bounds intersect a (x, y, width, height) viewport"""
+        vx, vy, vw, vh = viewport
+        return not (self.x + self.width < vx or self.x > vx + vw or
+                    self.y + self.height < vy or self.y > vy + vh)
+                    
+    def children_visible(self, viewport: tuple) -> bool:
+        """Check if any children may need rendering in the viewport"""
+        # Children are not required to lie inside their parent's bounds
+        return True
+        
+    def fingerprint(self) -> Optional[tuple]:
+        """Summarize everything render() draws, or None if it can't be summarized
+        
+        The renderer reuses the previous frame's vertices when no visible
+        component's fingerprint has changed. Subclasses that override this must
+        include every attribute their render() reads.
+        """
+        return None
+        
+    def flatten(self) -> tuple:
+        """Get this component and its descendants in depth-first order
+        
+        Returns (components, ends) where ends[i] is the index just past the
+        subtree rooted at components[i].
+        """
+        components = []
+        ends = []
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, int):
+                # Close the subtree opened at this index
+                ends[item] = len(components)
+                continue
+            ends.append(0)
+            stack.append(len(components))
+            components.append(item)
+            stack.extend(reversed(item.children))
+        return components, ends
+        
     def contains_point(self, x: int, y: int) -> bool:
         """Check if a point is within the component's bounds"""
         return (self.x <= x <= self.x + self.width and 
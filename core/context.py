@@ -1,7 +1,13 @@
 """
 Context - Provides context data that can be shared across components
 """
-from typing import Dict, Any
+from typing import Dict, List, Any
+
+
+# Fallbacks for tokens missing from the current theme
+_WHITE = (1.0, 1.0, 1.0, 1.0)
+_DEFAULT_SPACING = 8
+_DEFAULT_BORDER_RADIUS = 4
 
 
 class Context:
@@ -11,6 +17,29 @@ class Context:
         self.data: Dict[str, Any] = {}
         self.themes: Dict[str, Any] = {}
         self.fonts: Dict[str, Any] = {}
+        self.current_theme = 'default'
+        
+        # Current theme's tokens, flattened so lookups are a single dict access
+        self._flat_colors: Dict[str, tuple] = {}
+        self._flat_spacing: Dict[str, int] = {}
+        self._flat_border_radius: Dict[str, int] = {}
+        
+        # Color names interned to stable indices into _color_table
+        self._color_index: Dict[str, int] = {}
+        self._color_table: List[tuple] = []
+        
+        # Bumped whenever components are added or removed anywhere in the tree
+        self.tree_version = 0
+        
+        # Bumped whenever any component moves or resizes
+        self.geometry_version = 0
+        
+        # Set when anything visible changed since the last rendered frame
+        self.dirty = True
+        self._animations = set()
+        
+        # Components with an on_tick() hook, called once per frame
+        self._tickers: List[Any] = []
         
         # Default theme
         self.set_theme('default', {
@@ -39,7 +68,42 @@ class Context:
             }
         })
         
-        self.current_theme = 'default'
+    def invalidate_tree(self):
+        """Record that the component tree structure changed"""
+        self.tree_version += 1
+        self.dirty = True
+        
+    def mark_dirty(self):
+        """Request a redraw on the next frame"""
+        self.dirty = True
+        
+    def register_animation(self, animation: Any):
+        """Keep redrawing every frame while 'animation' is registered"""
+        self._animations.add(animation)
+        
+    def unregister_animation(self, animation: Any):
+        """Stop redrawing every frame on behalf of 'animation'"""
+        self._animations.discard(animation)
+        self.dirty = True
+        
+    def needs_redraw(self) -> bool:
+        """Check if the next frame has to be rendered"""
+        return self.dirty or bool(self._animations) or bool(self._tickers)
+        
+    def add_ticker(self, component: Any):
+        """Call component.on_tick(dt) every frame"""
+        if component not in self._tickers:
+            self._tickers.append(component)
+            
+    def remove_ticker(self, component: Any):
+        """Stop calling component.on_tick(dt)"""
+        if component in self._tickers:
+            self._tickers.remove(component)
+            
+    def tick(self, dt: float):
+        """Advance every ticking component by 'dt' seconds"""
+        for component in self._tickers:
+            component.on_tick(dt)
         
     def set_data(self, key: str, value: Any):
         """Set a value in the context"""
@@ -52,6 +116,8 @@ class Context:
     def set_theme(self, name: str, theme: Dict[str, Any]):
         """Set a theme"""
         self.themes[name] = theme
+        if name == self.current_theme:
+            self._flatten_theme()
         
     def get_theme(self, name: str = None) -> Dict[str, Any]:
         """Get a theme"""
@@ -63,21 +129,41 @@ class Context:
         """Set the current theme"""
         if name in self.themes:
             self.current_theme = name
+            self._flatten_theme()
+            
+    def _flatten_theme(self):
+        """Rebuild the flat token lookups from the current theme"""
+        theme = self.get_theme()
+        self._flat_colors = dict(theme.get('colors', {}))
+        self._flat_spacing = dict(theme.get('spacing', {}))
+        self._flat_border_radius = dict(theme.get('border_radius', {}))
+        
+        # Interned indices stay valid; only the colors they point at change
+        flat_colors = self._flat_colors
+        for color_name, index in self._color_index.items():
+            self._color_table[index] = flat_colors.get(color_name, _WHITE)
             
+    def intern_color(self, color_name: str) -> int:
+        """Resolve a theme color name to an index for color_at()"""
+        index = self._color_index.get(color_name)
+        if index is None:
+            index = len(self._color_table)
+            self._color_index[color_name] = index
+            self._color_table.append(self._flat_colors.get(color_name, _WHITE))
+        return index
+        
+    def color_at(self, index: int) -> tuple:
+        """Get the current theme color for an index from intern_color()"""
+        return self._color_table[index]
+        
     def get_theme_color(self, color_name: str) -> tuple:
         """Get a color from the current theme"""
-        theme = self.get_theme()
-        colors = theme.get('colors', {})
-        return colors.get(color_name, (1.0, 1.0, 1.0, 1.0))
+        return self._flat_colors.get(color_name, _WHITE)
         
     def get_theme_spacing(self, spacing_name: str) -> int:
         """Get a spacing value from the current theme"""
-        theme = self.get_theme()
-        spacing = theme.get('spacing', {})
-        return spacing.get(spacing_name, 8)
+        return self._flat_spacing.get(spacing_name, _DEFAULT_SPACING)
         
     def get_theme_border_radius(self, radius_name: str) -> int:
         """Get a border radius value from the current theme"""
-        theme = self.get_theme()
-        border_radius = theme.get('border_radius', {})
-        return border_radius.get(radius_name, 4)
\ No newline at end of file
+        return self._flat_border_radius.get(radius_name, _DEFAULT_BORDER_RADIUS)
\ No newline at end of file
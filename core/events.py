@@ -2,18 +2,88 @@
 EventManager - Handles all input events and routing
 """
 import pygame
-from typing import Dict, List, Callable, Any
+import numpy as np
+from typing import Dict, List, Callable
+
+
+# pygame event type -> framework event name, built once at import
+_EVENT_NAMES = {
+    pygame.MOUSEBUTTONDOWN: 'mouse_down',
+    pygame.MOUSEBUTTONUP: 'mouse_up',
+    pygame.MOUSEMOTION: 'mouse_move',
+    pygame.MOUSEWHEEL: 'mouse_wheel',
+    pygame.KEYDOWN: 'key_down',
+    pygame.KEYUP: 'key_up',
+    pygame.QUIT: 'quit',
+    pygame.VIDEORESIZE: 'resize'
+}
+
+
+class EventData:
+    """Reusable snapshot of an input event handed to callbacks
+    
+    Instances come from EventManager's pool and are overwritten once the pool
+    wraps around, so callbacks should copy out any fields they want to keep.
+    """
+    
+    __slots__ = ('type', 'x', 'y', 'pos', 'button', 'key', 'unicode', 'data')
+    
+    def __init__(self):
+        self.type = ''
+        self.x = 0
+        self.y = 0
+        self.pos = (0, 0)
+        self.button = 0
+        self.key = 0
+        self.unicode = ''
+        self.data = None
+        
+    def fill(self, event_type: str, event):
+        """Copy the fields of a pygame event into this slot"""
+        self.type = event_type
+        self.pos = getattr(event, 'pos', (0, 0))
+        # Mouse wheel events carry their scroll amounts in x/y, like pygame's
+        self.x = getattr(event, 'x', self.pos[0])
+        self.y = getattr(event, 'y', self.pos[1])
+        self.button = getattr(event, 'button', 0)
+        self.key = getattr(event, 'key', 0)
+        self.unicode = getattr(event, 'unicode', '')
+        self.data = event
+        return self
 
 
 class EventManager:
     """Manages all input events and routing"""
     
+    # Key codes below this are tracked in the key state table
+    KEY_TABLE_SIZE = 512
+    
+    # Number of EventData slots recycled between events
+    POOL_SIZE = 64
+    
     def __init__(self):
         self.callbacks: Dict[str, List[Callable]] = {}
+        
+        # pygame event type -> (event name, callback list), sharing the lists in
+        # self.callbacks so dispatch needs a single lookup
+        self._dispatch: Dict[int, tuple] = {
+            pygame_type: (name, self.callbacks.setdefault(name, []))
+            for pygame_type, name in _EVENT_NAMES.items()
+        }
+        
+        self._pool = [EventData() for _ in range(self.POOL_SIZE)]
+        self._pool_idx = 0
         self.mouse_position = (0, 0)
         self.mouse_buttons = [False, False, False]
         self.keys_pressed = set()
         
+        # One byte per key code, for lookups without hashing
+        self._key_bits = bytearray(self.KEY_TABLE_SIZE)
+        
+        # Window used to find the component under the mouse, set by Application
+        self.window = None
+        self.hovered_component = None
+        
     def register_callback(self, event_type: str, callback: Callable):
         """Register a callback for a specific event type"""
         if event_type not in self.callbacks:
@@ -27,34 +97,36 @@ class EventManager:
             
     def handle_event(self, event):
         """Handle a pygame event"""
-        event_type = self._get_event_type(event)
+        entry = self._dispatch.get(event.type)
         
-        if event_type:
+        if entry is not None:
+            event_type, callbacks = entry
+            
             # Update internal state
             self._update_state(event)
             
-            # Call registered callbacks
-            if event_type in self.callbacks:
-                for callback in self.callbacks[event_type]:
-                    callback(event)
+            # Call registered callbacks with a recycled EventData slot
+            if callbacks:
+                event_data = self._acquire_event_data().fill(event_type, event)
+                for callback in callbacks:
+                    callback(event_data)
                     
+    def _acquire_event_data(self) -> EventData:
+        """Hand out the next pooled EventData slot"""
+        event_data = self._pool[self._pool_idx]
+        self._pool_idx = (self._pool_idx + 1) % self.POOL_SIZE
+        return event_data
+        
     def _get_event_type(self, event) -> str:
         """Convert pygame event to string type"""
-        event_map = {
-            pygame.MOUSEBUTTONDOWN: 'mouse_down',
-            pygame.MOUSEBUTTONUP: 'mouse_up',
-            pygame.MOUSEMOTION: 'mouse_move',
-            pygame.KEYDOWN: 'key_down',
-            pygame.KEYUP: 'key_up',
-            pygame.QUIT: 'quit',
-            pygame.VIDEORESIZE: 'resize'
-        }
-        return event_map.get(event.type, '')
+        return _EVENT_NAMES.get(event.type, '')
         
     def _update_state(self, event):
         """Update internal state based on event"""
         if event.type == pygame.MOUSEMOTION:
             self.mouse_position = event.pos
+            if self.window is not None:
+                self.hovered_component = self.window.hit_test(event.pos)
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button <= 3:
                 self.mouse_buttons[event.button - 1] = True
@@ -63,13 +135,27 @@ class EventManager:
                 self.mouse_buttons[event.button - 1] = False
         elif event.type == pygame.KEYDOWN:
             self.keys_pressed.add(event.key)
+            if 0 <= event.key < self.KEY_TABLE_SIZE:
+                self._key_bits[event.key] = 1
         elif event.type == pygame.KEYUP:
             self.keys_pressed.discard(event.key)
+            if 0 <= event.key < self.KEY_TABLE_SIZE:
+                self._key_bits[event.key] = 0
             
     def is_key_pressed(self, key: int) -> bool:
         """Check if a key is currently pressed"""
+        if 0 <= key < self.KEY_TABLE_SIZE:
+            return self._key_bits[key] == 1
         return key in self.keys_pressed
         
+    def key_mask(self) -> np.ndarray:
+        """Get a uint8 view of the key state table, 1 for each pressed key code"""
+        return np.frombuffer(self._key_bits, dtype=np.uint8)
+        
+    def get_hovered_component(self):
+        """Get the topmost component under the mouse, if any"""
+        return self.hovered_component
+        
     def get_mouse_position(self) -> tuple:
         """Get current mouse position"""
         return self.mouse_position
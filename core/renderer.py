@@ -3,37 +3,79 @@ Renderer - GPU-accelerated rendering engine using OpenGL
 """
 import moderngl
 import numpy as np
-from typing import Tuple, List
+from typing import Dict, Tuple, List, Optional
 from .component import Component
+from ._fastpath import fill_circle
+from .colors import pack_color
 
 
 class Renderer:
     """GPU-accelerated rendering engine using OpenGL"""
     
+    # Number of quads a batch holds before it is flushed
+    BATCH_CAPACITY = 1024
+    
+    # Immediate-mode vertices written per frame before the buffer is orphaned
+    IMMEDIATE_VERTICES = 4096
+    
+    # Bytes per immediate-mode vertex (2 float32 position + packed RGBA8 color)
+    _IMMEDIATE_STRIDE = 3 * 4
+    
+    # Slices one pie draw call colors; larger pies take several calls
+    PIE_MAX_SLICES = 32
+    
+    # Blur value that makes a batched quad draw as its inscribed disc
+    _DISC = -1.0
+    
+    # Corner pattern of a quad's 4 vertices (top-left, top-right, bottom-left, bottom-right)
+    _CORNER_X = np.array([0.0, 1.0, 0.0, 1.0], dtype=np.float32)
+    _CORNER_Y = np.array([0.0, 0.0, 1.0, 1.0], dtype=np.float32)
+    
+    # Linked programs keyed by (GL context id, vertex source, fragment source), each
+    # stored as [program, renderer count] so renderers on one context compile once
+    _program_cache: Dict[tuple, list] = {}
+    
     def __init__(self, gl_context: moderngl.Context, width: int, height: int):
         self.ctx = gl_context
         self.width = width
         self.height = height
         
+        # Projection matrix storage, filled in place on every resize
+        self._proj_buf = np.zeros((4, 4), dtype=np.float32)
+        self._proj_buf[0, 3] = -1.0
+        self._proj_buf[1, 3] = 1.0
+        self._proj_buf[2, 2] = -1.0
+        self._proj_buf[3, 3] = 1.0
+        
         # Create shaders
         self.create_shaders()
         
         # Create buffers
         self.create_buffers()
         
+        # Unit-circle cos/sin tables, keyed by segment count
+        self._circle_tables = {}
+        self._circle_table(32)
+        
     def create_shaders(self):
         """Create basic shaders for rendering"""
         # Basic vertex shader
         vertex_shader = '''
         #version 330 core
-        in vec2 position;
-        in vec4 color;
+        layout(location = 0) in vec2 position;
+        layout(location = 1) in vec4 color;
+        layout(location = 2) in vec4 edges;
+        layout(location = 3) in float blur;
         out vec4 fragColor;
+        out vec4 fragEdges;
+        out float fragBlur;
         uniform mat4 projection;
         
         void main() {
             gl_Position = projection * vec4(position, 0.0, 1.0);
             fragColor = color;
+            fragEdges = edges;
+            fragBlur = blur;
         }
         '''
         
@@ -41,98 +83,575 @@ class Renderer:
         fragment_shader = '''
         #version 330 core
         in vec4 fragColor;
+        in vec4 fragEdges;
+        in float fragBlur;
         out vec4 color;
         
         void main() {
             color = fragColor;
+            
+            // Blurred quads (shadows) fade out over 'blur' pixels from their edges
+            if (fragBlur > 0.0) {
+                float edge = min(min(fragEdges.x, fragEdges.y), min(fragEdges.z, fragEdges.w));
+                color.a *= clamp(edge / fragBlur, 0.0, 1.0);
+            }
+            // A negative blur marks a disc inscribed in the quad, with a one pixel soft rim
+            else if (fragBlur < 0.0) {
+                vec2 offset = vec2(fragEdges.x - fragEdges.y, fragEdges.z - fragEdges.w) * 0.5;
+                float radius = (fragEdges.x + fragEdges.y) * 0.5;
+                color.a *= clamp(radius - length(offset) + 0.5, 0.0, 1.0);
+            }
         }
         '''
         
-        # Create shader program
-        self.program = self.ctx.program(
-            vertex_shader=vertex_shader,
-            fragment_shader=fragment_shader
-        )
+        # Create shader program, reusing one already linked on this context
+        self._program_key, self.program = self._acquire_program(vertex_shader, fragment_shader)
+        
+        # Look uniforms up by name once
+        self._u_projection = self.program['projection']
         
         # Set up projection matrix (orthographic)
         self.update_projection()
         
+    def _acquire_program(self, vertex_shader: str, fragment_shader: str) -> Tuple[tuple, 'moderngl.Program']:
+        """Get a (cache key, program) pair, linking the program only if this context has none yet"""
+        key = (id(self.ctx), vertex_shader, fragment_shader)
+        entry = Renderer._program_cache.get(key)
+        if entry is None:
+            entry = [self.ctx.program(
+                vertex_shader=vertex_shader,
+                fragment_shader=fragment_shader
+            ), 0]
+            Renderer._program_cache[key] = entry
+        entry[1] += 1
+        return key, entry[0]
+        
+    @staticmethod
+    def _release_program(key: tuple, program):
+        """Drop one renderer's use of a cached program, releasing it after the last"""
+        entry = Renderer._program_cache.get(key)
+        if entry is not None and entry[0] is program:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del Renderer._program_cache[key]
+                program.release()
+                
+    def create_pie_shader(self):
+        """Create the pie shader and its quad buffer on first use"""
+        # The quad is the pie's bounding box, with screen positions passed through
+        vertex_shader = '''
+        #version 330 core
+        layout(location = 0) in vec2 position;
+        out vec2 fragPosition;
+        uniform mat4 projection;
+        
+        void main() {
+            gl_Position = projection * vec4(position, 0.0, 1.0);
+            fragPosition = position;
+        }
+        '''
+        
+        # Each fragment finds its slice from its angle around the center
+        fragment_shader = '''
+        #version 330 core
+        #define MAX_SLICES %d
+        in vec2 fragPosition;
+        out vec4 color;
+        uniform vec2 center;
+        uniform float radius;
+        uniform float start;
+        uniform int count;
+        uniform float ends[MAX_SLICES];
+        uniform vec4 colors[MAX_SLICES];
+        
+        void main() {
+            vec2 offset = fragPosition - center;
+            float angle = atan(offset.y, offset.x);
+            if (angle < 0.0) {
+                angle += 6.28318530718;
+            }
+            if (angle < start) {
+                discard;
+            }
+            
+            // First slice whose end angle lies past this fragment
+            int slice = count;
+            for (int i = 0; i < MAX_SLICES; i++) {
+                if (i >= count || angle < ends[i]) {
+                    slice = i;
+                    break;
+                }
+            }
+            if (slice >= count) {
+                discard;
+            }
+            
+            // One pixel soft rim
+            color = colors[slice];
+            color.a *= clamp(radius - length(offset) + 0.5, 0.0, 1.0);
+        }
+        ''' % self.PIE_MAX_SLICES
+        
+        self._pie_program_key, self._pie_program = self._acquire_program(vertex_shader, fragment_shader)
+        self._pie_vbo = self.ctx.buffer(reserve=4 * 2 * 4, dynamic=True)
+        self._pie_vao = self.ctx.vertex_array(self._pie_program, [
+            (self._pie_vbo, '2f', 'position')
+        ])
+        self._pie_quad = np.empty((4, 2), dtype=np.float32)
+        self._pie_ends = np.zeros(self.PIE_MAX_SLICES, dtype=np.float32)
+        self._pie_colors = np.zeros((self.PIE_MAX_SLICES, 4), dtype=np.float32)
+        
     def create_buffers(self):
         """Create vertex buffers"""
-        # Create vertex buffer object
-        self.vbo = self.ctx.buffer(np.array([], dtype=np.float32))
+        # Pie shader objects, created by the first render_pie()
+        self._pie_vao = None
         
-        # Create vertex array object
+        # Create vertex buffer object for immediate-mode shapes
+        # Each shape is appended after the last one; the buffer is orphaned per frame
+        self.vbo = self.ctx.buffer(reserve=self.IMMEDIATE_VERTICES * self._IMMEDIATE_STRIDE, dynamic=True)
+        self._immediate_cursor = 0
+        self._rect_scratch = np.empty((4, 3), dtype=np.float32)
+        self._rect_colors = self._rect_scratch.view(np.uint32)[:, 2]
+        
+        # Circle fan scratch, sized for the default 32 segments and doubled on demand
+        self._circle_scratch = np.empty((34, 3), dtype=np.float32)
+        self._circle_colors = self._circle_scratch.view(np.uint32)[:, 2]
+        
+        # Create vertex array object; colors are normalized unsigned bytes
         self.vao = self.ctx.vertex_array(self.program, [
-            (self.vbo, '2f 4f', 'position', 'color')
+            (self.vbo, '2f 4f1', 'position', 'color')
         ])
         
+        # Pending quads, expanded to vertices when flushed. Geometry is kept as
+        # (x, y, width, height) float32 rows so a quad converts in one store
+        capacity = self.BATCH_CAPACITY
+        self._quad_rect = np.empty((capacity, 4), dtype=np.float32)
+        self._quad_color = np.empty(capacity, dtype=np.uint32)
+        self._quad_blur = np.empty(capacity, dtype=np.float32)
+        
+        # Vertex staging: 4 vertices per quad, drawn as indexed triangles. Each vertex is
+        # position, packed RGBA8 color, distances to the quad's left/right/top/bottom edges
+        # and blur radius (0 for solid quads, negative for discs), so all of them share one draw
+        self._batch_vertices = np.empty((capacity, 4, 8), dtype=np.float32)
+        self._batch_colors = self._batch_vertices.view(np.uint32)[:, :, 2]
+        self._batch_count = 0
+        self._batching = False
+        
+        # GL draw calls issued and batch buffer uploads so far, for frame replay
+        self._draw_calls = 0
+        self._batch_uploads = 0
+        
+        # Last draw list frame that can be redrawn straight from batch_vbo
+        self._replay_components = None
+        self._replay_fingerprints = None
+        self._replay_quads = 0
+        self._replay_upload = -1
+        
+        self.batch_vbo = self.ctx.buffer(reserve=self._batch_vertices.nbytes, dynamic=True)
+        self.batch_ibo = self.ctx.buffer(self._quad_indices(self.BATCH_CAPACITY).tobytes())
+        self.batch_vao = self.ctx.vertex_array(self.program, [
+            (self.batch_vbo, '2f 4f1 4f 1f', 'position', 'color', 'edges', 'blur')
+        ], index_buffer=self.batch_ibo, index_element_size=4)
+        
+    @staticmethod
+    def _quad_indices(count: int) -> np.ndarray:
+        """Build the static index pattern for 'count' quads (two triangles each)"""
+        base = np.arange(count, dtype=np.uint32)[:, None] * 4
+        return (base + np.array([0, 1, 2, 2, 1, 3], dtype=np.uint32)).ravel()
+        
     def update_projection(self):
         """Update the projection matrix"""
-        # Create orthographic projection matrix
-        projection = np.array([
-            [2.0/self.width, 0, 0, -1],
-            [0, -2.0/self.height, 0, 1],
-            [0, 0, -1, 0],
-            [0, 0, 0, 1]
-        ], dtype=np.float32)
+        # Orthographic projection; only the scale terms depend on the size
+        self._proj_buf[0, 0] = 2.0 / self.width
+        self._proj_buf[1, 1] = -2.0 / self.height
         
-        self.program['projection'].write(projection.tobytes())
+        self._u_projection.write(self._proj_buf)
         
     def resize(self, width: int, height: int):
         """Resize the renderer"""
+        if width == self.width and height == self.height:
+            return
         self.width = width
         self.height = height
         self.update_projection()
         
-    def render_component(self, component: Component):
-        """Render a component and its children"""
-        # Render the component
-        component.render(self)
+    def begin_frame(self):
+        """Start a frame; quads rendered until end_frame() are drawn together"""
+        # Fresh immediate-mode storage so this frame never waits on the last one's draws
+        self.vbo.orphan()
+        self._immediate_cursor = 0
+        self.begin_batch()
+        
+    def end_frame(self):
+        """Finish a frame and draw any quads still batched"""
+        self.end_batch()
+        
+    def begin_batch(self):
+        """Start collecting quads into a single batched draw"""
+        self._batch_count = 0
+        self._batching = True
+        
+    def end_batch(self):
+        """Draw all collected quads and stop batching"""
+        self.flush_batch()
+        self._batching = False
+        
+    def flush_batch(self):
+        """Draw the quads collected so far in one call"""
+        count = self._batch_count
+        if count == 0:
+            return
+            
+        # Expand every pending quad to its 4 vertices at once
+        rect = self._quad_rect[:count]
+        x = rect[:, 0:1]
+        y = rect[:, 1:2]
+        w = rect[:, 2:3]
+        h = rect[:, 3:4]
+        corner_x = self._CORNER_X
+        corner_y = self._CORNER_Y
+        
+        vertices = self._batch_vertices[:count]
+        vertices[:, :, 0] = x + corner_x * w
+        vertices[:, :, 1] = y + corner_y * h
+        self._batch_colors[:count] = self._quad_color[:count, None]
+        vertices[:, :, 3] = corner_x * w
+        vertices[:, :, 4] = (1 - corner_x) * w
+        vertices[:, :, 5] = corner_y * h
+        vertices[:, :, 6] = (1 - corner_y) * h
+        vertices[:, :, 7] = self._quad_blur[:count, None]
         
+        # Orphan first so a second flush in the same frame doesn't stall on the previous draw
+        self.batch_vbo.orphan()
+        self.batch_vbo.write(vertices)
+        self.batch_vao.render(mode=moderngl.TRIANGLES, vertices=count * 6)
+        self._batch_count = 0
+        self._draw_calls += 1
+        self._batch_uploads += 1
+        
+    def push_quad(self, x: float, y: float, width: float, height: float, color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0), blur: float = 0.0):
+        """Add a rectangle to the current batch, or draw it immediately if no batch is open
+        
+        A positive blur softens the quad's edges over that many pixels; a negative
+        one draws the disc inscribed in the quad instead.
+        """
+        if not self._batching:
+            self._draw_rectangle(x, y, width, height, color)
+            return
+            
+        if self._batch_count == self.BATCH_CAPACITY:
+            self.flush_batch()
+            
+        i = self._batch_count
+        self._quad_rect[i] = (x, y, width, height)
+        self._quad_color[i] = pack_color(color)
+        self._quad_blur[i] = blur
+        self._batch_count = i + 1
+        
+    def push_quads(self, rects: np.ndarray, color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0), blur: float = 0.0):
+        """Add an (N, 4) array of x, y, width, height rectangles sharing one color to the batch"""
+        rects = np.asarray(rects, dtype=np.float32).reshape(-1, 4)
+        if not self._batching:
+            for x, y, width, height in rects.tolist():
+                self._draw_rectangle(x, y, width, height, color)
+            return
+            
+        packed = pack_color(color)
+        start = 0
+        total = len(rects)
+        while start < total:
+            if self._batch_count == self.BATCH_CAPACITY:
+                self.flush_batch()
+                
+            # Copy as many rectangles as fit before the batch is full
+            i = self._batch_count
+            count = min(total - start, self.BATCH_CAPACITY - i)
+            self._quad_rect[i:i + count] = rects[start:start + count]
+            self._quad_color[i:i + count] = packed
+            self._quad_blur[i:i + count] = blur
+            self._batch_count = i + count
+            start += count
+            
+    def render_border(self, x: float, y: float, width: float, height: float, border_width: float, color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0)):
+        """Render a rectangle outline as its four edge quads in one batch write"""
+        x2 = x + width
+        y2 = y + height
+        bw = border_width
+        
+        if not self._batching:
+            self._draw_rectangle(x, y, width, bw, color)
+            self._draw_rectangle(x, y2 - bw, width, bw, color)
+            self._draw_rectangle(x, y, bw, height, color)
+            self._draw_rectangle(x2 - bw, y, bw, height, color)
+            return
+            
+        if self._batch_count + 4 > self.BATCH_CAPACITY:
+            self.flush_batch()
+            
+        # Top, bottom, left and right edges
+        i = self._batch_count
+        self._quad_rect[i:i + 4] = (
+            (x, y, width, bw),
+            (x, y2 - bw, width, bw),
+            (x, y, bw, height),
+            (x2 - bw, y, bw, height),
+        )
+        self._quad_color[i:i + 4] = pack_color(color)
+        self._quad_blur[i:i + 4] = 0.0
+        self._batch_count = i + 4
+        
+    def render_component(self, component: Component, viewport: Optional[tuple] = None):
+        """Render a component and its children, skipping anything outside the viewport"""
+        if viewport is None:
+            viewport = (0, 0, self.width, self.height)
+            
+        # Render the component
+        if component.is_visible(viewport):
+            component.render(self)
+            
         # Render children
-        for child in component.children:
-            self.render_component(child)
+        if component.children_visible(viewport):
+            for child in component.children:
+                self.render_component(child, viewport)
+                
+    def render_draw_list(self, components: List[Component], ends: List[int], viewport: Optional[tuple] = None,
+                         in_view: Optional[List[bool]] = None):
+        """Render a flattened component tree (see Component.flatten) without recursion
+        
+        'in_view' may give each entry's precomputed is_visible(viewport) result.
+        """
+        if viewport is None:
+            viewport = (0, 0, self.width, self.height)
+            
+        # Collect the visible components in draw order
+        visible = []
+        i = 0
+        count = len(components)
+        while i < count:
+            component = components[i]
+            if in_view[i] if in_view is not None else component.is_visible(viewport):
+                visible.append(component)
+            if component.children_visible(viewport):
+                i += 1
+            else:
+                # Skip the whole subtree
+                i = ends[i]
+                
+        # Redraw last frame's vertices if nothing visible changed and they are still uploaded
+        fingerprints = [component.fingerprint() for component in visible]
+        if (self._replay_upload == self._batch_uploads and self._batch_count == 0 and
+                visible == self._replay_components and fingerprints == self._replay_fingerprints):
+            if self._replay_quads:
+                self.batch_vao.render(mode=moderngl.TRIANGLES, vertices=self._replay_quads * 6)
+            return
+            
+        draw_calls = self._draw_calls
+        pending = self._batch_count
+        for component in visible:
+            component.render(self)
+        quads = self._batch_count
+        self.flush_batch()
+        
+        # Only frames drawn entirely by that last flush, with every fingerprint known, can be replayed
+        self._replay_upload = -1
+        if (pending == 0 and self._draw_calls - draw_calls == (1 if quads else 0) and
+                None not in fingerprints):
+            self._replay_components = visible
+            self._replay_fingerprints = fingerprints
+            self._replay_quads = quads
+            self._replay_upload = self._batch_uploads
             
     def render_rectangle(self, x: float, y: float, width: float, height: float, color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0)):
         """Render a rectangle"""
-        # Create vertices for rectangle
-        vertices = np.array([
-            # Position     Color
-            x, y,         color[0], color[1], color[2], color[3],          # Top-left
-            x + width, y, color[0], color[1], color[2], color[3],          # Top-right
-            x, y + height, color[0], color[1], color[2], color[3],         # Bottom-left
-            x + width, y + height, color[0], color[1], color[2], color[3]  # Bottom-right
-        ], dtype=np.float32)
+        self.push_quad(x, y, width, height, color)
+        
+    def _draw_rectangle(self, x: float, y: float, width: float, height: float, color: Tuple[float, float, float, float]):
+        """Draw a single rectangle immediately"""
+        # Fill the preallocated vertices (top-left, top-right, bottom-left, bottom-right)
+        vertices = self._rect_scratch
+        vertices[:, 0] = (x, x + width, x, x + width)
+        vertices[:, 1] = (y, y, y + height, y + height)
+        self._rect_colors[:] = pack_color(color)
         
         # Update buffer
-        self.vbo.write(vertices)
+        first = self._write_immediate(vertices)
         
         # Render
-        self.vao.render(mode=moderngl.TRIANGLE_STRIP)
+        self.vao.render(mode=moderngl.TRIANGLE_STRIP, vertices=4, first=first)
+        self._draw_calls += 1
+        
+    def _write_immediate(self, vertices: np.ndarray) -> int:
+        """Append immediate-mode vertices to the buffer and return the index of the first"""
+        nbytes = vertices.nbytes
+        if self._immediate_cursor + nbytes > self.vbo.size:
+            # Out of room: start over in new storage (growing it for oversized shapes)
+            # rather than overwriting vertices the GPU may still be reading
+            self.vbo.orphan(max(self.vbo.size, nbytes))
+            self._immediate_cursor = 0
+            
+        offset = self._immediate_cursor
+        self.vbo.write(vertices, offset=offset)
+        self._immediate_cursor = offset + nbytes
+        return offset // self._IMMEDIATE_STRIDE
+        
+    def _grow_circle_scratch(self, vertices: int):
+        """Make the circle scratch array hold at least 'vertices' vertices"""
+        capacity = len(self._circle_scratch)
+        while capacity < vertices:
+            capacity *= 2
+        self._circle_scratch = np.empty((capacity, 3), dtype=np.float32)
+        self._circle_colors = self._circle_scratch.view(np.uint32)[:, 2]
+        
+    def _circle_table(self, segments: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the (cos, sin) of each rim vertex angle for a circle with 'segments' segments"""
+        table = self._circle_tables.get(segments)
+        if table is None:
+            angles = np.linspace(0, 2 * np.pi, segments + 1)
+            table = (np.cos(angles).astype(np.float32), np.sin(angles).astype(np.float32))
+            self._circle_tables[segments] = table
+        return table
         
     def render_circle(self, x: float, y: float, radius: float, color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0), segments: int = 32):
         """Render a circle"""
-        vertices = []
+        # Keep painter's order with any quads batched before this shape
+        self.flush_batch()
         
-        # Center vertex
-        vertices.extend([x, y, color[0], color[1], color[2], color[3]])
+        circle_cos, circle_sin = self._circle_table(segments)
+        count = segments + 2
+        if count > len(self._circle_scratch):
+            self._grow_circle_scratch(count)
+        vertices_array = self._circle_scratch[:count]
         
-        # Circle vertices
-        for i in range(segments + 1):
-            angle = 2 * np.pi * i / segments
-            px = x + radius * np.cos(angle)
-            py = y + radius * np.sin(angle)
-            vertices.extend([px, py, color[0], color[1], color[2], color[3]])
+        # Center vertex followed by the rim vertices
+        fill_circle(vertices_array, self._circle_colors[:count], x, y, radius,
+                    pack_color(color), circle_cos, circle_sin)
+        
+        # Update buffer
+        first = self._write_immediate(vertices_array)
+        
+        # Render
+        self.vao.render(mode=moderngl.TRIANGLE_FAN, vertices=count, first=first)
+        self._draw_calls += 1
+        
+    def render_lines(self, points: np.ndarray, color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0), width: float = 1.0):
+        """Render an (N, 2) polyline 'width' pixels thick in a single draw"""
+        points = np.asarray(points, dtype=np.float32).reshape(-1, 2)
+        if len(points) < 2:
+            return
             
-        vertices_array = np.array(vertices, dtype=np.float32)
+        # Keep painter's order with any quads batched before this shape
+        self.flush_batch()
+        
+        # Each segment becomes a quad: its endpoints pushed out half the width either side
+        starts = points[:-1]
+        ends = points[1:]
+        deltas = ends - starts
+        lengths = np.hypot(deltas[:, 0], deltas[:, 1])
+        # Zero-length segments get a zero offset and so draw nothing
+        scale = np.divide(width * 0.5, lengths, out=np.zeros_like(lengths), where=lengths > 0)
+        offsets = np.column_stack((-deltas[:, 1], deltas[:, 0])) * scale[:, None]
+        
+        # Two triangles per segment: (start+, end+, start-) and (start-, end+, end-)
+        vertices = np.empty((len(starts), 6, 3), dtype=np.float32)
+        vertices[:, 0, :2] = starts + offsets
+        vertices[:, 1, :2] = ends + offsets
+        vertices[:, 2, :2] = starts - offsets
+        vertices[:, 3, :2] = starts - offsets
+        vertices[:, 4, :2] = ends + offsets
+        vertices[:, 5, :2] = ends - offsets
+        vertices.view(np.uint32)[..., 2] = pack_color(color)
         
         # Update buffer
-        self.vbo.write(vertices_array)
+        first = self._write_immediate(vertices)
         
         # Render
-        self.vao.render(mode=moderngl.TRIANGLE_FAN)
+        self.vao.render(mode=moderngl.TRIANGLES, vertices=len(starts) * 6, first=first)
+        self._draw_calls += 1
+        
+    def render_points(self, centers: np.ndarray, radius: float, color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0)):
+        """Render an (N, 2) array of round point markers as batched quads"""
+        centers = np.asarray(centers, dtype=np.float32).reshape(-1, 2)
+        if not self._batching:
+            self.render_circles(centers, radius, color)
+            return
+            
+        # Each marker is the disc inscribed in its bounding square
+        rects = np.empty((len(centers), 4), dtype=np.float32)
+        rects[:, :2] = centers - radius
+        rects[:, 2:] = 2 * radius
+        self.push_quads(rects, color, self._DISC)
+        
+    def render_circles(self, centers: np.ndarray, radius: float, color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0), segments: int = 32):
+        """Render an (N, 2) array of circle centers sharing one radius and color in a single draw"""
+        centers = np.asarray(centers, dtype=np.float32).reshape(-1, 2)
+        if not len(centers):
+            return
+            
+        # Keep painter's order with any quads batched before these shapes
+        self.flush_batch()
+        
+        # Every circle as 'segments' (center, rim i, rim i + 1) triangles
+        circle_cos, circle_sin = self._circle_table(segments)
+        rim_x = centers[:, 0, None] + radius * circle_cos
+        rim_y = centers[:, 1, None] + radius * circle_sin
+        vertices = np.empty((len(centers), segments, 3, 3), dtype=np.float32)
+        vertices[:, :, 0, :2] = centers[:, None]
+        vertices[:, :, 1, 0] = rim_x[:, :-1]
+        vertices[:, :, 1, 1] = rim_y[:, :-1]
+        vertices[:, :, 2, 0] = rim_x[:, 1:]
+        vertices[:, :, 2, 1] = rim_y[:, 1:]
+        vertices.view(np.uint32)[..., 2] = pack_color(color)
         
+        # Update buffer
+        first = self._write_immediate(vertices)
+        
+        # Render
+        self.vao.render(mode=moderngl.TRIANGLES, vertices=vertices.size // 3, first=first)
+        self._draw_calls += 1
+        
+    def render_pie(self, x: float, y: float, radius: float, ends: np.ndarray, colors: np.ndarray):
+        """Render a filled pie from its slices' cumulative end angles and RGBA colors
+        
+        Angles are radians in [0, 2 pi], measured like the screen's atan2(y, x).
+        Each group of up to PIE_MAX_SLICES slices is one quad shaded on the GPU.
+        """
+        ends = np.asarray(ends, dtype=np.float32).reshape(-1)
+        colors = np.asarray(colors, dtype=np.float32).reshape(-1, 4)
+        if radius <= 0 or not len(ends):
+            return
+            
+        # Keep painter's order with any quads batched before this shape
+        self.flush_batch()
+        
+        if self._pie_vao is None:
+            self.create_pie_shader()
+        program = self._pie_program
+        program['projection'].write(self._proj_buf)
+        program['center'].value = (x, y)
+        program['radius'].value = radius
+        
+        # Bounding box of the pie (top-left, top-right, bottom-left, bottom-right)
+        quad = self._pie_quad
+        quad[:, 0] = (x - radius, x + radius, x - radius, x + radius)
+        quad[:, 1] = (y - radius, y - radius, y + radius, y + radius)
+        self._pie_vbo.write(quad)
+        
+        start = 0.0
+        for first in range(0, len(ends), self.PIE_MAX_SLICES):
+            group = ends[first:first + self.PIE_MAX_SLICES]
+            count = len(group)
+            self._pie_ends[:count] = group
+            self._pie_colors[:count] = colors[first:first + count]
+            program['start'].value = start
+            program['count'].value = count
+            program['ends'].write(self._pie_ends)
+            program['colors'].write(self._pie_colors)
+            
+            # Render
+            self._pie_vao.render(mode=moderngl.TRIANGLE_STRIP, vertices=4)
+            self._draw_calls += 1
+            start = float(group[-1])
+            
     def render_text(self, text: str, x: float, y: float, color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0)):
         """Render text (basic implementation)"""
         # This is a basic text rendering implementation
@@ -141,9 +660,19 @@ class Renderer:
         
     def cleanup(self):
         """Clean up resources"""
+        if hasattr(self, 'batch_vao'):
+            self.batch_vao.release()
+            self.batch_vbo.release()
+            self.batch_ibo.release()
         if hasattr(self, 'vao'):
             self.vao.release()
         if hasattr(self, 'vbo'):
             self.vbo.release()
+        if getattr(self, '_pie_vao', None) is not None:
+            self._pie_vao.release()
+            self._pie_vbo.release()
+            self._release_program(self._pie_program_key, self._pie_program)
+            self._pie_vao = None
         if hasattr(self, 'program'):
-            self.program.release()
\ No newline at end of file
+            # Shared programs are released by the last renderer using them
+            self._release_program(self._program_key, self.program)
\ No newline at end of file
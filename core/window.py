@@ -3,7 +3,8 @@ Window - The main window class that manages the display and rendering
 """
 import pygame
 import moderngl
-from typing import Optional, Tuple
+import numpy as np
+from typing import List, Optional, Tuple
 from .component import Component
 from .renderer import Renderer
 from .context import Context
@@ -19,6 +20,19 @@ class Window:
         self.context = context
         self.root_component: Optional[Component] = None
         
+        # Depth-first draw order, rebuilt only when the tree structure changes
+        self._draw_list: List[Component] = []
+        self._draw_ends: List[int] = []
+        self._draw_list_version = -1
+        
+        # (x, y, x + width, y + height) of each draw list entry for hit testing
+        self._bounds = np.empty((0, 4), dtype=np.float64)
+        self._bounds_version = (-1, -1)
+        
+        # Which draw list entries intersect the window, for the bounds and size it was built from
+        self._in_view: List[bool] = []
+        self._in_view_key = None
+        
         # Create pygame window
         self.screen = pygame.display.set_mode((width, height), pygame.OPENGL)
         pygame.display.set_caption(title)
@@ -44,10 +58,13 @@ class Window:
         self.root_component = component
         component.set_parent(None)
         component.set_context(self.context)
+        self._draw_list_version = -1
+        self.context.mark_dirty()
         
     def set_background_color(self, r: float, g: float, b: float, a: float = 1.0):
         """Set the background color of the window"""
         self.background_color = (r, g, b, a)
+        self.context.mark_dirty()
         
     def resize(self, width: int, height: int):
         """Resize the window"""
@@ -56,21 +73,78 @@ class Window:
         self.screen = pygame.display.set_mode((width, height), pygame.OPENGL)
         self.gl_context.viewport = (0, 0, width, height)
         self.renderer.resize(width, height)
+        self.context.mark_dirty()
         
     def update(self):
         """Update the window and all components"""
         if self.root_component:
             self.root_component.update()
             
-    def render(self):
-        """Render the window and all components"""
+    def render(self) -> bool:
+        """Render the window and all components; returns False if nothing changed"""
+        # Keep the last frame when nothing visible changed
+        if not self.context.needs_redraw():
+            return False
+            
         # Clear the screen
         self.gl_context.clear(color=self.background_color)
         
-        # Render root component
+        # Render root component, batching its quads into one draw
         if self.root_component:
-            self.renderer.render_component(self.root_component)
+            self._sync_draw_list()
+            self.renderer.begin_frame()
+            self.renderer.render_draw_list(self._draw_list, self._draw_ends, in_view=self._cull())
+            self.renderer.end_frame()
+            
+        self.context.dirty = False
+        return True
+            
+    def _sync_draw_list(self):
+        """Rebuild the flattened draw list if the tree structure changed"""
+        if self._draw_list_version != self.context.tree_version:
+            self._draw_list, self._draw_ends = self.root_component.flatten()
+            self._draw_list_version = self.context.tree_version
             
+    def _sync_bounds(self):
+        """Refresh the bounds array only after the tree or any geometry changed"""
+        version = (self.context.tree_version, self.context.geometry_version)
+        if version != self._bounds_version:
+            draw_list = self._draw_list
+            bounds = np.array([(c.x, c.y, c.width, c.height) for c in draw_list], dtype=np.float64).reshape(-1, 4)
+            bounds[:, 2:] += bounds[:, :2]
+            self._bounds = bounds
+            self._bounds_version = version
+            
+    def _cull(self) -> List[bool]:
+        """Flag each draw list entry that intersects the window, all in one comparison"""
+        self._sync_bounds()
+        width = self.renderer.width
+        height = self.renderer.height
+        key = (self._bounds_version, width, height)
+        if key != self._in_view_key:
+            # Same test as Component.is_visible against (0, 0, width, height)
+            bounds = self._bounds
+            in_view = ((bounds[:, 2] >= 0) & (bounds[:, 0] <= width) &
+                       (bounds[:, 3] >= 0) & (bounds[:, 1] <= height))
+            self._in_view = in_view.tolist()
+            self._in_view_key = key
+        return self._in_view
+        
+    def hit_test(self, pos: Tuple[int, int]) -> Optional[Component]:
+        """Find the topmost component under 'pos', or None"""
+        if not self.root_component:
+            return None
+        self._sync_draw_list()
+        self._sync_bounds()
+        
+        x, y = pos
+        bounds = self._bounds
+        hits = (bounds[:, 0] <= x) & (x <= bounds[:, 2]) & (bounds[:, 1] <= y) & (y <= bounds[:, 3])
+        
+        # Later entries are drawn on top
+        hit_index = np.flatnonzero(hits)
+        return self._draw_list[hit_index[-1]] if hit_index.size else None
+        
     def cleanup(self):
         """Clean up resources"""
         if self.renderer:
@@ -1,13 +1,8 @@
 """
 PulseUIアニメーション機能のデモンストレーション
 """
-import sys
-import os
-import math
-import time
-
-# Add the pulse_ui package to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from math import cos, sin
+from time import perf_counter
 
 from pulse_ui.core.application import Application
 from pulse_ui.core.window import Window
@@ -17,25 +12,25 @@ from pulse_ui.components.basic import Container, Button, Text
 class AnimatedCircle(Container):
     """A simple animated circle component"""
     
+    __slots__ = ('start_time', 'radius', 'center_x', 'center_y', 'speed')
+    
     def __init__(self, **props):
         super().__init__(**props)
-        self.start_time = time.time()
+        self.start_time = perf_counter()
         self.radius = 50
         self.center_x = 400
         self.center_y = 300
         self.speed = 2.0
         
-    def update(self):
-        """Update animation"""
-        super().update()
-        
+    def on_tick(self, dt):
+        """Move the circle every frame"""
         # Calculate animated position
-        elapsed = time.time() - self.start_time
+        elapsed = perf_counter() - self.start_time
         angle = elapsed * self.speed
         
         # Circular motion
-        offset_x = math.cos(angle) * 100
-        offset_y = math.sin(angle) * 50
+        offset_x = cos(angle) * 100
+        offset_y = sin(angle) * 50
         
         self.set_position(
             int(self.center_x + offset_x - self.radius),
@@ -76,8 +71,7 @@ class AnimationExample:
             "アニメーション例",
             classes="text-white text-2xl font-bold mb-4"
         )
-        title.set_position(50, 50)
-        title.set_size(700, 40)
+        title.set_geometry(50, 50, 700, 40)
         
         # アニメーション円を作成
         animated_circle = AnimatedCircle()
@@ -89,16 +83,14 @@ class AnimationExample:
             classes="bg-green-500 hover:bg-green-700 text-white font-bold py-2 px-4 rounded mr-4",
             on_click=self.on_start_click
         )
-        start_button.set_position(50, 500)
-        start_button.set_size(120, 40)
+        start_button.set_geometry(50, 500, 120, 40)
         
         stop_button = Button(
             "アニメーション停止",
             classes="bg-red-500 hover:bg-red-700 text-white font-bold py-2 px-4 rounded",
             on_click=self.on_stop_click
         )
-        stop_button.set_position(180, 500)
-        stop_button.set_size(120, 40)
+        stop_button.set_geometry(180, 500, 120, 40)
         
         # Add components to container
         main_container.add_child(title)
@@ -1,12 +1,6 @@
 """
 Basic example demonstrating ModernGUI usage
 """
-import sys
-import os
-
-# Add the pulse_ui package to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-
 from pulse_ui.core.application import Application
 from pulse_ui.core.window import Window
 from pulse_ui.components.basic import Container, Button, Text
@@ -35,16 +29,14 @@ class BasicExample:
             "PulseUIへようこそ！",
             classes="text-white text-3xl font-bold mb-4"
         )
-        title.set_position(50, 50)
-        title.set_size(700, 50)
+        title.set_geometry(50, 50, 700, 50)
         
         # 説明文を作成
         description = Text(
             "Reactライクなコンポーネントを持つモダンなPython GUIライブラリ",
             classes="text-gray-300 text-lg mb-8"
         )
-        description.set_position(50, 120)
-        description.set_size(700, 30)
+        description.set_geometry(50, 120, 700, 30)
         
         # ボタンを作成
         primary_button = Button(
@@ -52,16 +44,14 @@ class BasicExample:
             classes="bg-blue-500 hover:bg-blue-700 text-white font-bold py-2 px-4 rounded mr-4",
             on_click=self.on_primary_click
         )
-        primary_button.set_position(200, 200)
-        primary_button.set_size(150, 40)
+        primary_button.set_geometry(200, 200, 150, 40)
         
         secondary_button = Button(
             "セカンダリボタン",
             classes="bg-gray-500 hover:bg-gray-700 text-white font-bold py-2 px-4 rounded",
             on_click=self.on_secondary_click
         )
-        secondary_button.set_position(370, 200)
-        secondary_button.set_size(150, 40)
+        secondary_button.set_geometry(370, 200, 150, 40)
         
         # コンテナにコンポーネントを追加
         main_container.add_child(title)
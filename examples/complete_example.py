@@ -1,36 +1,165 @@
 """
 Complete example demonstrating all ModernGUI features
 """
-import sys
-import os
 import math
-import random
 import time
-
-# Add the pulse_ui package to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from dataclasses import dataclass
+from typing import NamedTuple, Tuple
+import numpy as np
 
 from pulse_ui.core.application import Application
 from pulse_ui.core.window import Window
 from pulse_ui.components.basic import Container, Button, Text, Input
 from pulse_ui.components.layout import Row, Column, Grid
 from pulse_ui.components.display import Card, Badge, Progress, Divider, Icon
-from pulse_ui.visualization.charts import LineChart, BarChart
-from pulse_ui.visualization.plots import RealTimePlot
-from pulse_ui.animation.animator import Animator
-from pulse_ui.animation.transitions import Transition
+
+# Style classes for widgets built per item or shared between sections
+_CLS_MENU_ITEM_TEXT = "text-gray-300 hover:text-white"
+_CLS_CARD_LABEL = "text-gray-300 text-sm"
+_CLS_CARD_VALUE = "text-white text-2xl font-bold"
+_CLS_CARD_CHANGE = "text-sm font-medium"
+_CLS_SECTION_TITLE = "text-white text-lg font-bold"
+_CLS_STATUS_TEXT = "text-gray-400 text-xs"
+
+
+class MenuItem(NamedTuple):
+    name: str
+    icon: str
+
+
+class Metric(NamedTuple):
+    title: str
+    value: str
+    change: str
+    color: Tuple[float, float, float, float]
+
+
+class ProgressItem(NamedTuple):
+    label: str
+    value: int
+
+
+class Status(NamedTuple):
+    label: str
+    status: str
+    color: Tuple[float, float, float, float]
+
+
+@dataclass(frozen=True, slots=True)
+class ResponsiveLayout:
+    """Geometry of the page sections for a window size, as (x, y, width, height)"""
+    
+    window_width: int
+    window_height: int
+    header_height: int = 70
+    footer_height: int = 50
+    sidebar_width: int = 250
+    
+    @property
+    def body_height(self) -> int:
+        return self.window_height - self.header_height - self.footer_height
+        
+    @property
+    def header(self) -> Tuple[int, int, int, int]:
+        return (0, 0, self.window_width, self.header_height)
+        
+    @property
+    def sidebar(self) -> Tuple[int, int, int, int]:
+        return (0, self.header_height, self.sidebar_width, self.body_height)
+        
+    @property
+    def main(self) -> Tuple[int, int, int, int]:
+        return (self.sidebar_width, self.header_height,
+                self.window_width - self.sidebar_width, self.body_height)
+        
+    @property
+    def footer(self) -> Tuple[int, int, int, int]:
+        return (0, self.window_height - self.footer_height, self.window_width, self.footer_height)
+
+
+# Page layout for the demo's fixed window size
+_LAYOUT = ResponsiveLayout(1400, 900)
+
+
+# Fixed content of the sidebar, dashboard cards, progress section and footer
+_MENU_ITEMS = (
+    MenuItem("Dashboard", "home"),
+    MenuItem("Analytics", "chart"),
+    MenuItem("Data Tables", "table"),
+    MenuItem("Settings", "settings"),
+    MenuItem("Help", "info"),
+)
+_METRICS = (
+    Metric("Total Users", "12,345", "+12%", (0.23, 0.45, 1.0, 1.0)),
+    Metric("Revenue", "$98,765", "+8%", (0.23, 1.0, 0.24, 1.0)),
+    Metric("Orders", "1,234", "-2%", (1.0, 0.8, 0.2, 1.0)),
+    Metric("Performance", "94%", "+5%", (0.45, 0.24, 1.0, 1.0)),
+)
+_PROGRESS_ITEMS = (
+    ProgressItem("Data Processing", 75),
+    ProgressItem("File Upload", 100),
+    ProgressItem("Analysis", 45),
+)
+_STATUSES = (
+    Status("Server", "online", (0.23, 1.0, 0.24, 1.0)),
+    Status("Database", "online", (0.23, 1.0, 0.24, 1.0)),
+    Status("Cache", "warning", (1.0, 0.8, 0.2, 1.0)),
+)
+
+
+try:
+    from numba import njit
+except ImportError:  # Numba is an optional accelerator
+    njit = None
+
+
+def _sample_usage(t, cpu_noise, memory_noise):
+    """Simulated CPU and memory usage at time 't', clamped to 0-100"""
+    cpu_usage = 30.0 + 20.0 * math.sin(t * 0.5) + cpu_noise
+    memory_usage = 50.0 + 15.0 * math.cos(t * 0.3) + memory_noise
+    # Comparison chains rather than min()/max() calls; Numba compiles either form to the same code
+    cpu_usage = 0.0 if cpu_usage < 0.0 else 100.0 if cpu_usage > 100.0 else cpu_usage
+    memory_usage = 0.0 if memory_usage < 0.0 else 100.0 if memory_usage > 100.0 else memory_usage
+    return cpu_usage, memory_usage
+
+
+if njit is not None:
+    # Explicit signature compiles eagerly; cache=True reuses the build across runs
+    _sample_usage = njit('UniTuple(float64, 2)(float64, float64, float64)', cache=True, fastmath=True)(_sample_usage)
 
 
 class CompleteExample:
     """Complete example showcasing all ModernGUI features"""
     
+    # Length of the pre-generated noise ring; a power of two so the index wraps with a mask
+    NOISE_SIZE = 4096
+    
+    # Entrance animations are a placeholder; while off, no animator is created at all
+    ENABLE_ENTRANCE_ANIM = False
+    
     def __init__(self):
         self.app = Application("Complete ModernGUI Demo")
-        self.window = self.app.create_window("ModernGUI - Complete Demo", 1400, 900)
+        self.window = self.app.create_window("ModernGUI - Complete Demo", _LAYOUT.window_width, _LAYOUT.window_height)
+        
+        # Initialize animation system, only if something will animate
+        self.animator = None
+        self.transitions = None
+        if self.ENABLE_ENTRANCE_ANIM:
+            from pulse_ui.animation.animator import Animator
+            from pulse_ui.animation.transitions import Transition
+            self.animator = Animator()
+            self.transitions = Transition(self.animator)
+        
+        # Built once, then cloned for each menu entry and metric
+        self._menu_item_template = None
+        self._metric_card_template = None
         
-        # Initialize animation system
-        self.animator = Animator()
-        self.transitions = Transition(self.animator)
+        # Uniform noise in [-1, 1), generated once and read round-robin
+        self._noise = np.random.uniform(-1.0, 1.0, size=self.NOISE_SIZE)
+        self._noise_idx = 0
+        
+        # Real-time samples, overwritten in place by every get_realtime_data() call
+        self._realtime_data = {"CPU Usage": (0.0, 0.0), "Memory Usage": (0.0, 0.0)}
         
         # Data for visualizations
         self.setup_data()
@@ -41,30 +170,36 @@ class CompleteExample:
     def setup_data(self):
         """Setup sample data for charts and visualizations"""
         # Sample data for charts
-        self.sales_data = [
-            ("Jan", 65), ("Feb", 78), ("Mar", 92), ("Apr", 81),
-            ("May", 95), ("Jun", 88), ("Jul", 102), ("Aug", 96)
-        ]
+        self.sales_data = (
+            ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug"),
+            np.array([65, 78, 92, 81, 95, 88, 102, 96], dtype=np.float32)
+        )
         
-        self.performance_data = [(i, 50 + 30 * math.sin(i * 0.3) + random.uniform(-10, 10)) for i in range(30)]
+        # Generate the whole series at once; the chart takes the (N, 2) array as is
+        xs = np.arange(30)
+        ys = 50 + 30 * np.sin(xs * 0.3) + 10 * self._noise[:xs.size]
+        self._noise_idx = xs.size
+        self.performance_data = np.column_stack((xs, ys)).astype(np.float32)
         
     def create_ui(self):
         """Create the complete user interface"""
         # Main container
         main_container = Container(classes="bg-gray-900")
-        main_container.set_size(1400, 900)
-        
-        # Header section
-        self.create_header(main_container)
-        
-        # Navigation sidebar
-        self.create_sidebar(main_container)
+        main_container.set_size(_LAYOUT.window_width, _LAYOUT.window_height)
         
-        # Main content area
-        self.create_main_content(main_container)
-        
-        # Footer
-        self.create_footer(main_container)
+        # Build every section before laying any of them out
+        with main_container.batch_updates():
+            # Header section
+            self.create_header(main_container)
+            
+            # Navigation sidebar
+            self.create_sidebar(main_container)
+            
+            # Main content area
+            self.create_main_content(main_container)
+            
+            # Footer
+            self.create_footer(main_container)
         
         # Set container as root
         self.window.set_root_component(main_container)
@@ -72,13 +207,11 @@ class CompleteExample:
     def create_header(self, parent):
         """Create the application header"""
         header = Container(classes="bg-gray-800 border-b border-gray-700")
-        header.set_position(0, 0)
-        header.set_size(1400, 70)
+        header.set_geometry(*_LAYOUT.header)
         
         # Logo and title
         logo_container = Row(gap=12, align_items='center')
-        logo_container.set_position(20, 15)
-        logo_container.set_size(300, 40)
+        logo_container.set_geometry(20, 15, 300, 40)
         
         logo_icon = Icon("star", size=32, color=(0.23, 0.45, 1.0, 1.0))
         logo_icon.set_size(40, 40)
@@ -86,13 +219,11 @@ class CompleteExample:
         app_title = Text("ModernGUI Demo", classes="text-white text-xl font-bold")
         app_title.set_size(200, 30)
         
-        logo_container.add_child(logo_icon)
-        logo_container.add_child(app_title)
+        logo_container.add_children([logo_icon, app_title])
         
         # Header actions
         header_actions = Row(gap=10, align_items='center', justify_content='end')
-        header_actions.set_position(1200, 15)
-        header_actions.set_size(180, 40)
+        header_actions.set_geometry(1200, 15, 180, 40)
         
         # Search input
         search_input = Input(placeholder="Search...", classes="bg-gray-700 text-white border border-gray-600 rounded px-3 py-2")
@@ -102,67 +233,62 @@ class CompleteExample:
         user_btn = Button("User", classes="bg-blue-600 hover:bg-blue-700 text-white rounded px-3 py-2")
         user_btn.set_size(50, 30)
         
-        header_actions.add_child(search_input)
-        header_actions.add_child(user_btn)
+        header_actions.add_children([search_input, user_btn])
         
-        header.add_child(logo_container)
-        header.add_child(header_actions)
+        header.add_children([logo_container, header_actions])
         parent.add_child(header)
         
     def create_sidebar(self, parent):
         """Create the navigation sidebar"""
         sidebar = Container(classes="bg-gray-800 border-r border-gray-700")
-        sidebar.set_position(0, 70)
-        sidebar.set_size(250, 780)
+        sidebar.set_geometry(*_LAYOUT.sidebar)
         
         # Navigation menu
         nav_menu = Column(gap=5, align_items='start')
-        nav_menu.set_position(20, 30)
-        nav_menu.set_size(210, 600)
-        
-        menu_items = [
-            {"name": "Dashboard", "icon": "home"},
-            {"name": "Analytics", "icon": "chart"},
-            {"name": "Data Tables", "icon": "table"},
-            {"name": "Settings", "icon": "settings"},
-            {"name": "Help", "icon": "info"}
-        ]
-        
-        for item in menu_items:
-            menu_item = self.create_menu_item(item["name"], item["icon"])
-            nav_menu.add_child(menu_item)
-            
+        nav_menu.set_geometry(20, 30, 210, 600)
+        
+        nav_menu.add_children([self.create_menu_item(item.name, item.icon) for item in _MENU_ITEMS])
+        
         sidebar.add_child(nav_menu)
         parent.add_child(sidebar)
         
     def create_menu_item(self, name, icon_name):
-        """Create a navigation menu item"""
+        """Create a navigation menu item by cloning the shared template"""
+        if self._menu_item_template is None:
+            self._menu_item_template = self._build_menu_item_template()
+            
+        item_container = self._menu_item_template.clone()
+        icon, text = item_container.children
+        icon.patch(name=icon_name)
+        text.patch(text=name)
+        
+        return item_container
+        
+    def _build_menu_item_template(self):
+        """Build the navigation menu item subtree that create_menu_item clones"""
         item_container = Row(gap=10, align_items='center')
         item_container.set_size(210, 40)
         
         # Icon
-        icon = Icon(icon_name, size=20, color=(0.7, 0.7, 0.7, 1.0))
+        icon = Icon("", size=20, color=(0.7, 0.7, 0.7, 1.0))
         icon.set_size(30, 30)
         
         # Text
-        text = Text(name, classes="text-gray-300 hover:text-white")
+        text = Text("", classes=_CLS_MENU_ITEM_TEXT)
         text.set_size(170, 25)
         
-        item_container.add_child(icon)
-        item_container.add_child(text)
+        item_container.add_children([icon, text])
         
         return item_container
         
     def create_main_content(self, parent):
         """Create the main content area"""
         main_content = Container(classes="bg-gray-900 p-6")
-        main_content.set_position(250, 70)
-        main_content.set_size(1150, 780)
+        main_content.set_geometry(*_LAYOUT.main)
         
         # Content grid
         content_grid = Grid(columns=2, gap=20)
-        content_grid.set_position(0, 0)
-        content_grid.set_size(1150, 780)
+        content_grid.set_geometry(0, 0, 1150, 780)
         
         # Dashboard cards
         self.create_dashboard_cards(content_grid)
@@ -181,74 +307,69 @@ class CompleteExample:
         
     def create_dashboard_cards(self, parent):
         """Create dashboard overview cards"""
-        cards_container = Container()
-        cards_container.set_size(550, 200)
-        
+        # The grid goes straight into the parent; a wrapper would add a node and draw nothing
         card_grid = Grid(columns=2, gap=15)
         card_grid.set_size(550, 200)
         
         # Metrics cards
-        metrics = [
-            {"title": "Total Users", "value": "12,345", "change": "+12%", "color": (0.23, 0.45, 1.0, 1.0)},
-            {"title": "Revenue", "value": "$98,765", "change": "+8%", "color": (0.23, 1.0, 0.24, 1.0)},
-            {"title": "Orders", "value": "1,234", "change": "-2%", "color": (1.0, 0.8, 0.2, 1.0)},
-            {"title": "Performance", "value": "94%", "change": "+5%", "color": (0.45, 0.24, 1.0, 1.0)}
-        ]
-        
-        for metric in metrics:
-            card = self.create_metric_card(metric)
-            card_grid.add_child(card)
-            
-        cards_container.add_child(card_grid)
-        parent.add_child(cards_container)
+        card_grid.add_children([self.create_metric_card(metric) for metric in _METRICS])
+        
+        parent.add_child(card_grid)
         
     def create_metric_card(self, metric):
-        """Create a single metric card"""
+        """Create a single metric card by cloning the shared template"""
+        if self._metric_card_template is None:
+            self._metric_card_template = self._build_metric_card_template()
+            
+        card = self._metric_card_template.clone()
+        accent_bar, title, value, change_text = card.children
+        title.patch(text=metric.title)
+        value.patch(text=metric.value)
+        change_text.patch(text=metric.change)
+        
+        return card
+        
+    def _build_metric_card_template(self):
+        """Build the metric card subtree that create_metric_card clones"""
         card = Card(border_radius=8, padding=16)
         card.set_size(260, 90)
         
         # Title
-        title = Text(metric["title"], classes="text-gray-300 text-sm")
-        title.set_size(200, 20)
-        title.set_position(16, 16)
+        title = Text("", classes=_CLS_CARD_LABEL)
+        title.set_geometry(16, 16, 200, 20)
         
         # Value
-        value = Text(metric["value"], classes="text-white text-2xl font-bold")
-        value.set_size(200, 30)
-        value.set_position(16, 40)
+        value = Text("", classes=_CLS_CARD_VALUE)
+        value.set_geometry(16, 40, 200, 30)
         
         # Change indicator
-        change_text = Text(metric["change"], classes="text-sm font-medium")
-        change_text.set_size(60, 20)
-        change_text.set_position(180, 16)
+        change_text = Text("", classes=_CLS_CARD_CHANGE)
+        change_text.set_geometry(180, 16, 60, 20)
         
         # Accent color bar
         accent_bar = Container()
-        accent_bar.set_position(0, 0)
-        accent_bar.set_size(4, 90)
+        accent_bar.set_geometry(0, 0, 4, 90)
         # Set accent bar color based on metric color
         
-        card.add_child(accent_bar)
-        card.add_child(title)
-        card.add_child(value)
-        card.add_child(change_text)
+        card.add_children([accent_bar, title, value, change_text])
         
         return card
         
     def create_charts_section(self, parent):
         """Create charts visualization section"""
+        # Visualization modules load only once a chart is actually built
+        from pulse_ui.visualization.charts import LineChart, BarChart
+        
         charts_container = Card(border_radius=8, padding=20)
         charts_container.set_size(550, 360)
         
         # Section title
         section_title = Text("Analytics Overview", classes="text-white text-lg font-bold mb-4")
-        section_title.set_size(500, 30)
-        section_title.set_position(20, 20)
+        section_title.set_geometry(20, 20, 500, 30)
         
         # Charts grid
         charts_grid = Grid(columns=1, gap=20)
-        charts_grid.set_position(20, 60)
-        charts_grid.set_size(510, 280)
+        charts_grid.set_geometry(20, 60, 510, 280)
         
         # Sales chart
         sales_chart = BarChart(
@@ -266,23 +387,22 @@ class CompleteExample:
         )
         performance_chart.set_size(510, 130)
         
-        charts_grid.add_child(sales_chart)
-        charts_grid.add_child(performance_chart)
+        charts_grid.add_children([sales_chart, performance_chart])
         
-        charts_container.add_child(section_title)
-        charts_container.add_child(charts_grid)
+        charts_container.add_children([section_title, charts_grid])
         
         parent.add_child(charts_container)
         
     def create_realtime_section(self, parent):
         """Create real-time monitoring section"""
+        from pulse_ui.visualization.plots import RealTimePlot
+        
         realtime_container = Card(border_radius=8, padding=20)
         realtime_container.set_size(550, 200)
         
         # Section title
-        section_title = Text("Real-time Monitoring", classes="text-white text-lg font-bold")
-        section_title.set_size(400, 30)
-        section_title.set_position(20, 20)
+        section_title = Text("Real-time Monitoring", classes=_CLS_SECTION_TITLE)
+        section_title.set_geometry(20, 20, 400, 30)
         
         # Real-time plot
         realtime_plot = RealTimePlot(
@@ -292,11 +412,9 @@ class CompleteExample:
         )
         realtime_plot.add_real_time_series("CPU Usage", (1.0, 0.24, 0.24, 1.0))
         realtime_plot.add_real_time_series("Memory Usage", (0.23, 0.45, 1.0, 1.0))
-        realtime_plot.set_position(20, 60)
-        realtime_plot.set_size(510, 120)
+        realtime_plot.set_geometry(20, 60, 510, 120)
         
-        realtime_container.add_child(section_title)
-        realtime_container.add_child(realtime_plot)
+        realtime_container.add_children([section_title, realtime_plot])
         
         parent.add_child(realtime_container)
         
@@ -307,10 +425,9 @@ class CompleteExample:
         
         # Section title with actions
         header_row = Row(gap=10, justify_content='space-between', align_items='center')
-        header_row.set_position(20, 20)
-        header_row.set_size(510, 40)
+        header_row.set_geometry(20, 20, 510, 40)
         
-        section_title = Text("Data Management", classes="text-white text-lg font-bold")
+        section_title = Text("Data Management", classes=_CLS_SECTION_TITLE)
         section_title.set_size(300, 30)
         
         # Action buttons
@@ -323,52 +440,41 @@ class CompleteExample:
         export_btn = Button("Export", classes="bg-green-600 hover:bg-green-700 text-white text-sm rounded px-3 py-1")
         export_btn.set_size(60, 25)
         
-        actions_row.add_child(refresh_btn)
-        actions_row.add_child(export_btn)
+        actions_row.add_children([refresh_btn, export_btn])
         
-        header_row.add_child(section_title)
-        header_row.add_child(actions_row)
+        header_row.add_children([section_title, actions_row])
         
         # Progress indicators
         progress_section = Column(gap=10, align_items='start')
-        progress_section.set_position(20, 80)
-        progress_section.set_size(510, 100)
+        progress_section.set_geometry(20, 80, 510, 100)
         
         # Different progress items
-        progress_items = [
-            {"label": "Data Processing", "value": 75},
-            {"label": "File Upload", "value": 100},
-            {"label": "Analysis", "value": 45}
-        ]
-        
-        for item in progress_items:
+        progress_rows = []
+        for item in _PROGRESS_ITEMS:
             progress_row = Row(gap=10, align_items='center')
             progress_row.set_size(510, 25)
             
-            label = Text(item["label"], classes="text-gray-300 text-sm")
+            label = Text(item.label, classes=_CLS_CARD_LABEL)
             label.set_size(120, 20)
             
-            progress = Progress(value=item["value"], show_text=True)
+            progress = Progress(value=item.value, show_text=True)
             progress.set_size(300, 15)
             
-            progress_row.add_child(label)
-            progress_row.add_child(progress)
-            progress_section.add_child(progress_row)
+            progress_row.add_children([label, progress])
+            progress_rows.append(progress_row)
+        progress_section.add_children(progress_rows)
             
-        data_container.add_child(header_row)
-        data_container.add_child(progress_section)
+        data_container.add_children([header_row, progress_section])
         
         parent.add_child(data_container)
         
     def create_footer(self, parent):
         """Create the application footer"""
         footer = Container(classes="bg-gray-800 border-t border-gray-700")
-        footer.set_position(0, 850)
-        footer.set_size(1400, 50)
+        footer.set_geometry(*_LAYOUT.footer)
         
         footer_content = Row(gap=20, justify_content='space-between', align_items='center')
-        footer_content.set_position(20, 10)
-        footer_content.set_size(1360, 30)
+        footer_content.set_geometry(20, 10, 1360, 30)
         
         # Left side - version info
         version_info = Text("ModernGUI v0.1.0 - Python GUI Framework", classes="text-gray-400 text-sm")
@@ -379,13 +485,8 @@ class CompleteExample:
         status_row.set_size(300, 20)
         
         # Status indicators
-        statuses = [
-            {"label": "Server", "status": "online", "color": (0.23, 1.0, 0.24, 1.0)},
-            {"label": "Database", "status": "online", "color": (0.23, 1.0, 0.24, 1.0)},
-            {"label": "Cache", "status": "warning", "color": (1.0, 0.8, 0.2, 1.0)}
-        ]
-        
-        for status in statuses:
+        status_items = []
+        for status in _STATUSES:
             status_item = Row(gap=5, align_items='center')
             status_item.set_size(80, 20)
             
@@ -393,36 +494,44 @@ class CompleteExample:
             indicator.set_size(8, 8)
             # Set indicator color based on status
             
-            status_text = Text(status["label"], classes="text-gray-400 text-xs")
+            status_text = Text(status.label, classes=_CLS_STATUS_TEXT)
             status_text.set_size(60, 15)
             
-            status_item.add_child(indicator)
-            status_item.add_child(status_text)
-            status_row.add_child(status_item)
+            status_item.add_children([indicator, status_text])
+            status_items.append(status_item)
+        status_row.add_children(status_items)
             
-        footer_content.add_child(version_info)
-        footer_content.add_child(status_row)
+        footer_content.add_children([version_info, status_row])
         
         footer.add_child(footer_content)
         parent.add_child(footer)
         
+    def _next_noise(self, scale: float) -> float:
+        """Take the next noise sample from the ring, scaled to [-scale, scale)"""
+        value = self._noise[self._noise_idx]
+        self._noise_idx = (self._noise_idx + 1) & (self.NOISE_SIZE - 1)
+        return value * scale
+        
     def get_realtime_data(self):
-        """Generate real-time data for monitoring"""
+        """Generate real-time data for monitoring
+        
+        The same dict is returned every time, so read it before the next call.
+        """
         current_time = time.time()
         
         # Simulate CPU and memory usage
-        cpu_usage = 30 + 20 * math.sin(current_time * 0.5) + random.uniform(-5, 5)
-        memory_usage = 50 + 15 * math.cos(current_time * 0.3) + random.uniform(-3, 3)
+        cpu_usage, memory_usage = _sample_usage(current_time, self._next_noise(5.0), self._next_noise(3.0))
         
-        return {
-            "CPU Usage": (current_time, max(0, min(100, cpu_usage))),
-            "Memory Usage": (current_time, max(0, min(100, memory_usage)))
-        }
+        realtime_data = self._realtime_data
+        realtime_data["CPU Usage"] = (current_time, cpu_usage)
+        realtime_data["Memory Usage"] = (current_time, memory_usage)
+        return realtime_data
         
     def run(self):
         """Run the application"""
         # Start with entrance animations
-        self.animate_entrance()
+        if self.ENABLE_ENTRANCE_ANIM:
+            self.animate_entrance()
         
         # Run the application loop
         self.app.run()
@@ -1,11 +1,7 @@
 """
 Layout example demonstrating different layout components
 """
-import sys
-import os
-
-# Add the pulse_ui package to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from typing import NamedTuple
 
 from pulse_ui.core.application import Application
 from pulse_ui.core.window import Window
@@ -13,6 +9,35 @@ from pulse_ui.components.basic import Container, Button, Text
 from pulse_ui.components.layout import Row, Column, Grid, Stack
 from pulse_ui.components.display import Card, Badge, Progress, Divider
 
+# Row example button styles and grid example cell colors, computed once at import
+_BUTTON_CLASSES = (
+    "bg-blue-500 text-white font-bold py-2 px-4 rounded",
+    "bg-blue-600 text-white font-bold py-2 px-4 rounded",
+    "bg-blue-700 text-white font-bold py-2 px-4 rounded",
+)
+_GRID_COLORS = tuple((0.1 + i*0.05, 0.2 + i*0.02, 0.3 + i*0.01, 1.0) for i in range(9))
+
+# Progress bar values and their fill colors
+_PROGRESS_VALUES = (25, 50, 75, 100)
+_PROGRESS_COLORS = (
+    (1.0, 0.2, 0.2, 1.0),  # Red
+    (1.0, 0.8, 0.2, 1.0),  # Yellow
+    (0.2, 0.6, 1.0, 1.0),  # Blue
+    (0.2, 1.0, 0.2, 1.0)   # Green
+)
+
+
+class FeatureCard(NamedTuple):
+    title: str
+    desc: str
+
+
+_FEATURE_CARDS = (
+    FeatureCard("Fast Performance", "GPU-accelerated rendering"),
+    FeatureCard("Easy to Use", "React-like components"),
+    FeatureCard("Customizable", "TailwindCSS styling"),
+)
+
 
 class LayoutExample:
     """Layout example application"""
@@ -37,65 +62,62 @@ class LayoutExample:
             "Layout Components Demo",
             classes="text-white text-2xl font-bold mb-4"
         )
-        title.set_position(20, 20)
-        title.set_size(960, 40)
+        title.set_geometry(20, 20, 960, 40)
         
         # Create row layout example
         row_title = Text("Row Layout (Horizontal)", classes="text-white text-lg font-bold")
-        row_title.set_position(20, 80)
-        row_title.set_size(300, 30)
+        row_title.set_geometry(20, 80, 300, 30)
         
         row_container = Row(gap=10, justify_content='start', align_items='center')
-        row_container.set_position(20, 120)
-        row_container.set_size(460, 60)
+        row_container.set_geometry(20, 120, 460, 60)
         
         # Add buttons to row
-        for i in range(3):
-            btn = Button(f"Button {i+1}", classes=f"bg-blue-{500+i*100} text-white font-bold py-2 px-4 rounded")
+        buttons = []
+        for i, button_classes in enumerate(_BUTTON_CLASSES):
+            btn = Button(f"Button {i+1}", classes=button_classes)
             btn.set_size(140, 40)
-            row_container.add_child(btn)
+            buttons.append(btn)
+        row_container.add_children(buttons)
             
         # Create column layout example
         col_title = Text("Column Layout (Vertical)", classes="text-white text-lg font-bold")
-        col_title.set_position(500, 80)
-        col_title.set_size(300, 30)
+        col_title.set_geometry(500, 80, 300, 30)
         
         col_container = Column(gap=10, justify_content='start', align_items='start')
-        col_container.set_position(500, 120)
-        col_container.set_size(200, 200)
+        col_container.set_geometry(500, 120, 200, 200)
         
         # Add items to column
-        col_items = ["Item 1", "Item 2", "Item 3"]
+        col_items = ("Item 1", "Item 2", "Item 3")
+        items = []
         for i, item_text in enumerate(col_items):
             item = Text(item_text, classes="text-gray-300 bg-gray-700 p-2 rounded")
             item.set_size(180, 30)
-            col_container.add_child(item)
+            items.append(item)
+        col_container.add_children(items)
             
         # Create grid layout example
         grid_title = Text("Grid Layout", classes="text-white text-lg font-bold")
-        grid_title.set_position(20, 200)
-        grid_title.set_size(300, 30)
+        grid_title.set_geometry(20, 200, 300, 30)
         
         grid_container = Grid(columns=3, gap=8)
-        grid_container.set_position(20, 240)
-        grid_container.set_size(460, 180)
+        grid_container.set_geometry(20, 240, 460, 180)
         
         # Add items to grid
-        for i in range(9):
-            grid_item = Card(background_color=(0.1 + i*0.05, 0.2 + i*0.02, 0.3 + i*0.01, 1.0))
+        grid_items = []
+        for i, grid_color in enumerate(_GRID_COLORS):
+            grid_item = Card(background_color=grid_color)
             grid_item_text = Text(f"Grid {i+1}", classes="text-white text-center")
             grid_item_text.set_size(140, 50)
             grid_item.add_child(grid_item_text)
-            grid_container.add_child(grid_item)
+            grid_items.append(grid_item)
+        grid_container.add_children(grid_items)
             
         # Create stack layout example
         stack_title = Text("Stack Layout (Overlapping)", classes="text-white text-lg font-bold")
-        stack_title.set_position(500, 200)
-        stack_title.set_size(300, 30)
+        stack_title.set_geometry(500, 200, 300, 30)
         
         stack_container = Stack(align_items='center')
-        stack_container.set_position(500, 240)
-        stack_container.set_size(200, 120)
+        stack_container.set_geometry(500, 240, 200, 120)
         
         # Add items to stack
         base_card = Card(background_color=(0.2, 0.2, 0.2, 1.0))
@@ -105,85 +127,65 @@ class LayoutExample:
         overlay_text.set_size(160, 30)
         
         badge = Badge("NEW", background_color=(1.0, 0.2, 0.2, 1.0))
-        badge.set_size(40, 20)
-        badge.set_position(520, 250)  # Top-right corner
+        badge.set_geometry(520, 250, 40, 20)  # Top-right corner
         
-        stack_container.add_child(base_card)
-        stack_container.add_child(overlay_text)
-        stack_container.add_child(badge)
+        stack_container.add_children([base_card, overlay_text, badge])
         
         # Create progress bars example
         progress_title = Text("Progress Bars", classes="text-white text-lg font-bold")
-        progress_title.set_position(20, 450)
-        progress_title.set_size(300, 30)
+        progress_title.set_geometry(20, 450, 300, 30)
         
         # Different progress values
-        progress_values = [25, 50, 75, 100]
-        progress_colors = [
-            (1.0, 0.2, 0.2, 1.0),  # Red
-            (1.0, 0.8, 0.2, 1.0),  # Yellow
-            (0.2, 0.6, 1.0, 1.0),  # Blue
-            (0.2, 1.0, 0.2, 1.0)   # Green
-        ]
-        
-        for i, (value, color) in enumerate(zip(progress_values, progress_colors)):
+        progress_bars = []
+        for i, (value, color) in enumerate(zip(_PROGRESS_VALUES, _PROGRESS_COLORS)):
             progress = Progress(value=value, fill_color=color, show_text=True)
-            progress.set_position(20, 490 + i * 40)
-            progress.set_size(300, 20)
-            main_container.add_child(progress)
+            progress.set_geometry(20, 490 + i * 40, 300, 20)
+            progress_bars.append(progress)
+        main_container.add_children(progress_bars)
             
         # Create dividers
         divider1 = Divider(orientation='horizontal', thickness=2)
-        divider1.set_position(20, 430)
-        divider1.set_size(960, 10)
+        divider1.set_geometry(20, 430, 960, 10)
         
         divider2 = Divider(orientation='vertical', thickness=2)
-        divider2.set_position(480, 80)
-        divider2.set_size(10, 340)
+        divider2.set_geometry(480, 80, 10, 340)
         
         # Create cards with content
         card_title = Text("Card Components", classes="text-white text-lg font-bold")
-        card_title.set_position(520, 450)
-        card_title.set_size(300, 30)
+        card_title.set_geometry(520, 450, 300, 30)
         
         # Feature cards
-        feature_cards_data = [
-            {"title": "Fast Performance", "desc": "GPU-accelerated rendering"},
-            {"title": "Easy to Use", "desc": "React-like components"},
-            {"title": "Customizable", "desc": "TailwindCSS styling"}
-        ]
-        
-        for i, card_data in enumerate(feature_cards_data):
+        feature_cards = []
+        for i, card_data in enumerate(_FEATURE_CARDS):
             card = Card(border_radius=8, padding=12)
-            card.set_position(520 + i * 150, 490)
-            card.set_size(140, 80)
+            card.set_geometry(520 + i * 150, 490, 140, 80)
             
-            card_title_text = Text(card_data["title"], classes="text-white text-sm font-bold")
-            card_title_text.set_size(116, 20)
-            card_title_text.set_position(532, 500)
+            card_title_text = Text(card_data.title, classes="text-white text-sm font-bold")
+            card_title_text.set_geometry(532, 500, 116, 20)
             
-            card_desc = Text(card_data["desc"], classes="text-gray-300 text-xs")
-            card_desc.set_size(116, 30)
-            card_desc.set_position(532, 525)
+            card_desc = Text(card_data.desc, classes="text-gray-300 text-xs")
+            card_desc.set_geometry(532, 525, 116, 30)
             
-            card.add_child(card_title_text)
-            card.add_child(card_desc)
-            main_container.add_child(card)
+            card.add_children([card_title_text, card_desc])
+            feature_cards.append(card)
+        main_container.add_children(feature_cards)
             
         # Add all components to main container
-        main_container.add_child(title)
-        main_container.add_child(row_title)
-        main_container.add_child(row_container)
-        main_container.add_child(col_title)
-        main_container.add_child(col_container)
-        main_container.add_child(grid_title)
-        main_container.add_child(grid_container)
-        main_container.add_child(stack_title)
-        main_container.add_child(stack_container)
-        main_container.add_child(progress_title)
-        main_container.add_child(divider1)
-        main_container.add_child(divider2)
-        main_container.add_child(card_title)
+        main_container.add_children([
+            title,
+            row_title,
+            row_container,
+            col_title,
+            col_container,
+            grid_title,
+            grid_container,
+            stack_title,
+            stack_container,
+            progress_title,
+            divider1,
+            divider2,
+            card_title,
+        ])
         
         # Set container as root
         self.window.set_root_component(main_container)
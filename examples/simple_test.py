@@ -1,12 +1,6 @@
 """
 PulseUIの基本機能を確認するためのシンプルなテスト
 """
-import sys
-import os
-
-# Add the pulse_ui package to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-
 try:
     from pulse_ui.core.application import Application
     from pulse_ui.core.window import Window
@@ -30,18 +24,15 @@ try:
             """シンプルなUIを作成"""
             # メインコンテナ
             container = Container()
-            container.set_size(600, 400)
-            container.set_position(0, 0)
+            container.set_geometry(0, 0, 600, 400)
             
             # ウェルカムテキスト
             welcome_text = Text("PulseUIへようこそ！")
-            welcome_text.set_position(200, 150)
-            welcome_text.set_size(200, 30)
+            welcome_text.set_geometry(200, 150, 200, 30)
             
             # テストボタン
             test_button = Button("クリックしてください！", on_click=self.on_button_click)
-            test_button.set_position(250, 200)
-            test_button.set_size(100, 40)
+            test_button.set_geometry(250, 200, 100, 40)
             
             # コンテナに追加
             container.add_child(welcome_text)
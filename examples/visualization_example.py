@@ -1,14 +1,10 @@
 """
 Visualization example demonstrating charts and plots
 """
-import sys
-import os
 import math
-import random
 import time
 
-# Add the pulse_ui package to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import numpy as np
 
 from pulse_ui.core.application import Application
 from pulse_ui.core.window import Window
@@ -16,6 +12,7 @@ from pulse_ui.components.basic import Container, Button, Text
 from pulse_ui.visualization.charts import LineChart, BarChart, PieChart
 from pulse_ui.visualization.plots import RealTimePlot
 from pulse_ui.visualization.data_table import DataTable
+from pulse_ui.visualization import fill_sin_wave
 
 
 class VisualizationExample:
@@ -33,18 +30,17 @@ class VisualizationExample:
         
     def generate_sample_data(self):
         """Generate sample data for charts"""
-        # Line chart data
-        self.line_data = [(i, math.sin(i * 0.5) * 50 + 100) for i in range(20)]
-        
-        # Bar chart data
-        self.bar_data = [
-            ("Jan", 50),
-            ("Feb", 75),
-            ("Mar", 100),
-            ("Apr", 85),
-            ("May", 110),
-            ("Jun", 95)
-        ]
+        # Line chart data as an (N, 2) x/y array
+        xs = np.arange(20, dtype=np.float32)
+        ys = np.empty_like(xs)
+        fill_sin_wave(ys, 0.0, 0.5, 50.0, offset=100.0)
+        self.line_data = np.column_stack((xs, ys))
+        
+        # Bar chart data as (labels, values)
+        self.bar_data = (
+            ("Jan", "Feb", "Mar", "Apr", "May", "Jun"),
+            np.array([50, 75, 100, 85, 110, 95], dtype=np.float32)
+        )
         
         # Pie chart data
         self.pie_data = [
@@ -53,14 +49,13 @@ class VisualizationExample:
             ("Tablet", 20)
         ]
         
-        # Table data
-        self.table_data = [
-            {"Name": "Alice", "Age": 25, "City": "New York", "Salary": 50000},
-            {"Name": "Bob", "Age": 30, "City": "San Francisco", "Salary": 75000},
-            {"Name": "Charlie", "Age": 35, "City": "Chicago", "Salary": 60000},
-            {"Name": "Diana", "Age": 28, "City": "Boston", "Salary": 55000},
-            {"Name": "Eve", "Age": 32, "City": "Seattle", "Salary": 70000}
-        ]
+        # Table data, one array per column
+        self.table_data = {
+            "Name": np.array(["Alice", "Bob", "Charlie", "Diana", "Eve"], dtype=object),
+            "Age": np.array([25, 30, 35, 28, 32], dtype=np.int32),
+            "City": np.array(["New York", "San Francisco", "Chicago", "Boston", "Seattle"], dtype=object),
+            "Salary": np.array([50000, 75000, 60000, 55000, 70000], dtype=np.int64)
+        }
         
     def create_ui(self):
         """Create the user interface"""
@@ -75,8 +70,7 @@ class VisualizationExample:
             "Data Visualization Examples",
             classes="text-white text-2xl font-bold mb-4"
         )
-        title.set_position(20, 20)
-        title.set_size(1160, 40)
+        title.set_geometry(20, 20, 1160, 40)
         
         # Create line chart
         line_chart = LineChart(
@@ -84,8 +78,7 @@ class VisualizationExample:
             title="Sample Line Chart",
             line_color=(0.23, 0.45, 1.0, 1.0)
         )
-        line_chart.set_position(20, 80)
-        line_chart.set_size(380, 250)
+        line_chart.set_geometry(20, 80, 380, 250)
         
         # Create bar chart
         bar_chart = BarChart(
@@ -93,16 +86,14 @@ class VisualizationExample:
             title="Sample Bar Chart",
             bar_color=(0.23, 1.0, 0.24, 1.0)
         )
-        bar_chart.set_position(420, 80)
-        bar_chart.set_size(380, 250)
+        bar_chart.set_geometry(420, 80, 380, 250)
         
         # Create pie chart
         pie_chart = PieChart(
             data=self.pie_data,
             title="Sample Pie Chart"
         )
-        pie_chart.set_position(820, 80)
-        pie_chart.set_size(360, 250)
+        pie_chart.set_geometry(820, 80, 360, 250)
         
         # Create real-time plot
         real_time_plot = RealTimePlot(
@@ -112,19 +103,18 @@ class VisualizationExample:
         )
         real_time_plot.add_real_time_series("Sine Wave", (1.0, 0.24, 0.24, 1.0))
         real_time_plot.add_real_time_series("Cosine Wave", (0.23, 0.45, 1.0, 1.0))
-        real_time_plot.set_position(20, 350)
-        real_time_plot.set_size(580, 200)
+        real_time_plot.set_geometry(20, 350, 580, 200)
         
         # Create data table
         data_table = DataTable(
-            data=self.table_data,
+            columns_data=self.table_data,
             columns=["Name", "Age", "City", "Salary"],
             headers=["Name", "Age", "City", "Salary ($)"],
+            formatters={"Salary": "{:,}".format},
             row_height=25,
             on_row_select=self.on_table_row_select
         )
-        data_table.set_position(620, 350)
-        data_table.set_size(560, 200)
+        data_table.set_geometry(620, 350, 560, 200)
         
         # Create control buttons
         refresh_button = Button(
@@ -132,31 +122,33 @@ class VisualizationExample:
             classes="bg-blue-500 hover:bg-blue-700 text-white font-bold py-2 px-4 rounded mr-4",
             on_click=self.refresh_data
         )
-        refresh_button.set_position(20, 570)
-        refresh_button.set_size(120, 40)
+        refresh_button.set_geometry(20, 570, 120, 40)
         
         export_button = Button(
             "Export Data",
             classes="bg-green-500 hover:bg-green-700 text-white font-bold py-2 px-4 rounded",
             on_click=self.export_data
         )
-        export_button.set_position(160, 570)
-        export_button.set_size(120, 40)
+        export_button.set_geometry(160, 570, 120, 40)
         
         # Add components to container
-        main_container.add_child(title)
-        main_container.add_child(line_chart)
-        main_container.add_child(bar_chart)
-        main_container.add_child(pie_chart)
-        main_container.add_child(real_time_plot)
-        main_container.add_child(data_table)
-        main_container.add_child(refresh_button)
-        main_container.add_child(export_button)
+        main_container.add_children([
+            title,
+            line_chart,
+            bar_chart,
+            pie_chart,
+            real_time_plot,
+            data_table,
+            refresh_button,
+            export_button,
+        ])
         
         # Set container as root
         self.window.set_root_component(main_container)
         
         # Store references for updates
+        self.line_chart = line_chart
+        self.bar_chart = bar_chart
         self.real_time_plot = real_time_plot
         self.data_table = data_table
         
@@ -173,11 +165,15 @@ class VisualizationExample:
         """Refresh all data"""
         print("Refreshing data...")
         
-        # Generate new random data
-        self.line_data = [(i, random.uniform(50, 150)) for i in range(20)]
-        self.bar_data = [(month, random.randint(40, 120)) for month, _ in self.bar_data]
+        # Generate new random data, keeping the x values and labels
+        ys = np.random.uniform(50, 150, len(self.line_data)).astype(np.float32)
+        self.line_data = np.column_stack((self.line_data[:, 0], ys))
+        labels, values = self.bar_data
+        self.bar_data = (labels, np.random.randint(40, 121, len(values)).astype(np.float32))
         
-        # Update charts would go here in a full implementation
+        # Hand the new arrays to the charts
+        self.line_chart.data = self.line_data
+        self.bar_chart.data = self.bar_data
         
     def export_data(self, button):
         """Export data"""
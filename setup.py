@@ -15,7 +15,9 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/tikipiya/PulseUI",
-    packages=find_packages(),
+    # The repository root is the pulse_ui package itself
+    package_dir={"pulse_ui": "."},
+    packages=["pulse_ui"] + ["pulse_ui." + package for package in find_packages()],
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -29,16 +31,12 @@ setup(
         "Topic :: Software Development :: User Interfaces",
     ],
     python_requires=">=3.10",
+    # Only what the toolkit imports: pygame for windows and input, moderngl for
+    # rendering and numpy for buffers. Everything else is opt-in
     install_requires=[
-        "PyOpenGL>=3.1.0",
-        "PyOpenGL-accelerate>=3.1.0",
         "pygame>=2.1.0",
-        "numpy>=1.21.0",
-        "Pillow>=9.0.0",
         "moderngl>=5.6.0",
-        "pyrr>=0.10.0",
-        "glfw>=2.5.0",
-        "freetype-py>=2.3.0",
+        "numpy>=1.21.0",
     ],
     extras_require={
         "dev": [
@@ -51,6 +49,23 @@ setup(
             "sphinx>=4.0",
             "sphinx-rtd-theme>=1.0",
         ],
+        "fast": [
+            "numba>=0.58",
+        ],
+        "pyopengl": [
+            "PyOpenGL>=3.1.0",
+            "PyOpenGL-accelerate>=3.1.0",
+        ],
+        "imaging": [
+            "Pillow>=9.0.0",
+        ],
+        "text": [
+            "freetype-py>=2.3.0",
+        ],
+        "extras": [
+            "pyrr>=0.10.0",
+            "glfw>=2.5.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -2,12 +2,13 @@
 Styling system for ModernGUI - TailwindCSS-like utility classes
 """
 
-from .parser import StyleParser
+from .parser import StyleParser, DEFAULT_PARSER
 from .styles import Style, Theme
 from .utilities import UtilityClasses
 
 __all__ = [
     "StyleParser",
+    "DEFAULT_PARSER",
     "Style",
     "Theme", 
     "UtilityClasses"
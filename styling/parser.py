@@ -2,144 +2,189 @@
 StyleParser - Parses TailwindCSS-like utility classes
 """
 import re
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Tuple
 from .utilities import UtilityClasses
 
 
+# Parsed class strings shared by every parser, keyed by (parser type, class string).
+# Entries are read-only views so they can be handed out without copying
+_STYLE_CACHE: Dict[Tuple[type, str], Mapping[str, Any]] = {}
+_STYLE_CACHE_SIZE = 3000
+
+# Parsed single classes keyed by (parser type, class name), so class strings that
+# share tokens parse each token once
+_CLASS_CACHE: Dict[Tuple[type, str], Dict[str, Any]] = {}
+_CLASS_CACHE_SIZE = 4096
+
+_EMPTY_STYLES: Mapping[str, Any] = MappingProxyType({})
+
+# Color names accepted bare (text-white) and as a shade base (text-gray-400)
+_NAMED_COLORS = frozenset(('red', 'blue', 'green', 'yellow', 'purple', 'pink', 'gray', 'black', 'white'))
+_SHADED_COLORS = frozenset(('red', 'blue', 'green', 'yellow', 'purple', 'pink', 'gray'))
+
+# Style property set by each color class prefix
+_COLOR_PROPERTIES = MappingProxyType({
+    'bg': 'background_color', 'text': 'text_color', 'border': 'border_color',
+})
+
+# Classes that set the display mode as they are
+_DISPLAY_CLASSES = frozenset(('flex', 'block', 'inline', 'inline-block'))
+
+# Value tables for sized classes; padding and margin share one scale
+_FONT_SIZES = MappingProxyType({
+    'xs': 12, 'sm': 14, 'base': 16, 'lg': 18, 'xl': 20,
+    '2xl': 24, '3xl': 30, '4xl': 36, '5xl': 48, '6xl': 64,
+})
+_BORDER_WIDTHS = MappingProxyType({'0': 0, '1': 1, '2': 2, '4': 4, '8': 8})
+_SPACING = MappingProxyType({
+    '0': 0, '1': 4, '2': 8, '3': 12, '4': 16, '5': 20,
+    '6': 24, '8': 32, '10': 40, '12': 48, '16': 64,
+})
+_BORDER_RADII = MappingProxyType({
+    'rounded': 4, 'rounded-sm': 2, 'rounded-md': 6,
+    'rounded-lg': 8, 'rounded-xl': 12, 'rounded-full': 9999,
+})
+
+
 class StyleParser:
     """Parses TailwindCSS-like utility classes into style properties"""
     
     def __init__(self):
         self.utilities = UtilityClasses()
         
+        # Class prefix before the first '-' -> handler, so dispatch is one lookup
+        self._dispatch = {
+            'bg': self.parse_background_class,
+            'text': self.parse_text_class,
+            'border': self.parse_border_class,
+            'p': self.parse_padding_class,
+            'padding': self.parse_padding_class,
+            'm': self.parse_margin_class,
+            'margin': self.parse_margin_class,
+            'w': self.parse_width_class,
+            'width': self.parse_width_class,
+            'h': self.parse_height_class,
+            'height': self.parse_height_class,
+            'flex': self.parse_flex_class,
+            'rounded': self.parse_border_radius_class,
+        }
+        
     def parse_classes(self, classes: str) -> Dict[str, Any]:
         """Parse a string of CSS classes into style properties"""
+        return dict(self.resolve_classes(classes))
+        
+    def resolve_classes(self, classes: str) -> Mapping[str, Any]:
+        """Parse a string of CSS classes into a shared, read-only mapping
+        
+        Like parse_classes() without the copy, for callers that only read the result.
+        """
         if not classes:
-            return {}
+            return _EMPTY_STYLES
+            
+        # Parsing is a pure function of the class string, so reuse earlier results
+        key = (type(self), classes)
+        styles = _STYLE_CACHE.get(key)
+        if styles is None:
+            styles = MappingProxyType(self._parse_uncached(classes))
+            if len(_STYLE_CACHE) >= _STYLE_CACHE_SIZE:
+                # Evict the oldest entry
+                del _STYLE_CACHE[next(iter(_STYLE_CACHE))]
+            _STYLE_CACHE[key] = styles
             
-        # Split classes by whitespace
-        class_list = classes.split()
+        return styles
+        
+    def _parse_uncached(self, classes: str) -> Dict[str, Any]:
+        """Parse a class string without consulting the string cache"""
+        parser_type = type(self)
         
-        # Parse each class
+        # Parse each whitespace-separated class, reusing tokens seen in other strings
         styles = {}
-        for class_name in class_list:
-            class_styles = self.parse_single_class(class_name)
-            styles.update(class_styles)
+        for class_name in classes.split():
+            key = (parser_type, class_name)
+            class_styles = _CLASS_CACHE.get(key)
+            if class_styles is None:
+                class_styles = self.parse_single_class(class_name)
+                if len(_CLASS_CACHE) < _CLASS_CACHE_SIZE:
+                    _CLASS_CACHE[key] = class_styles
+            # Unknown classes share the empty sentinel; skip the call for them
+            if class_styles:
+                styles.update(class_styles)
             
         return styles
         
-    def parse_single_class(self, class_name: str) -> Dict[str, Any]:
+    def parse_single_class(self, class_name: str) -> Mapping[str, Any]:
         """Parse a single CSS class"""
-        # Color classes
-        if class_name.startswith('bg-'):
-            return self.parse_background_class(class_name)
-        elif class_name.startswith('text-'):
-            return self.parse_text_class(class_name)
-        elif class_name.startswith('border-'):
-            return self.parse_border_class(class_name)
-        
-        # Spacing classes
-        elif class_name.startswith('p-') or class_name.startswith('padding-'):
-            return self.parse_padding_class(class_name)
-        elif class_name.startswith('m-') or class_name.startswith('margin-'):
-            return self.parse_margin_class(class_name)
-            
-        # Size classes
-        elif class_name.startswith('w-') or class_name.startswith('width-'):
-            return self.parse_width_class(class_name)
-        elif class_name.startswith('h-') or class_name.startswith('height-'):
-            return self.parse_height_class(class_name)
+        # Prefixed classes (bg-, text-, p-, rounded-, ...) dispatch on the prefix
+        prefix, dash, _ = class_name.partition('-')
+        if dash:
+            handler = self._dispatch.get(prefix)
+            if handler is not None:
+                return handler(class_name)
+                
+        # State variants (hover:bg-blue-700) keep their base class's styles under 'state:' keys
+        state, colon, base_class = class_name.partition(':')
+        if colon:
+            base_styles = self.parse_single_class(base_class)
+            if not base_styles:
+                return _EMPTY_STYLES
+            return {f'{state}:{key}': value for key, value in base_styles.items()}
             
         # Layout classes
-        elif class_name in ['flex', 'block', 'inline', 'inline-block']:
+        if class_name in _DISPLAY_CLASSES:
             return self.parse_display_class(class_name)
-        elif class_name.startswith('flex-'):
-            return self.parse_flex_class(class_name)
             
-        # Border radius classes
-        elif class_name.startswith('rounded'):
+        # Border radius without a size suffix
+        if class_name == 'rounded':
             return self.parse_border_radius_class(class_name)
             
-        return {}
+        return _EMPTY_STYLES
         
-    def parse_background_class(self, class_name: str) -> Dict[str, Any]:
-        """Parse background color classes"""
-        # Remove 'bg-' prefix
-        color_name = class_name[3:]
+    def parse_color_class(self, class_name: str) -> Mapping[str, Any]:
+        """Parse bg-, text- and border- color classes, or return empty if not a color"""
+        prefix, _, color_name = class_name.partition('-')
+        color_base, dash, intensity = color_name.partition('-')
         
-        # Handle variants like 'bg-blue-500'
-        if '-' in color_name:
-            color_base, intensity = color_name.split('-', 1)
-            color = self.utilities.get_color(color_base, intensity)
-        else:
-            color = self.utilities.get_color(color_name)
+        # text- and border- also take sizes and widths, so only known colors count there
+        if prefix != 'bg' and not (color_base in _SHADED_COLORS if dash else color_name in _NAMED_COLORS):
+            return _EMPTY_STYLES
             
-        return {'background_color': color}
+        # Handle variants like 'bg-blue-500'
+        return {_COLOR_PROPERTIES[prefix]: self.utilities.get_color(color_base, intensity or None)}
         
-    def parse_text_class(self, class_name: str) -> Dict[str, Any]:
-        """Parse text classes"""
-        # Remove 'text-' prefix
-        text_property = class_name[5:]
+    def parse_background_class(self, class_name: str) -> Mapping[str, Any]:
+        """Parse background color classes"""
+        return self.parse_color_class(class_name)
         
+    def parse_text_class(self, class_name: str) -> Mapping[str, Any]:
+        """Parse text classes"""
         # Handle color classes
-        if text_property in ['red', 'blue', 'green', 'yellow', 'purple', 'pink', 'gray', 'black', 'white']:
-            color = self.utilities.get_color(text_property)
-            return {'text_color': color}
-        elif '-' in text_property:
-            color_base, intensity = text_property.split('-', 1)
-            if color_base in ['red', 'blue', 'green', 'yellow', 'purple', 'pink', 'gray']:
-                color = self.utilities.get_color(color_base, intensity)
-                return {'text_color': color}
-                
+        styles = self.parse_color_class(class_name)
+        if styles:
+            return styles
+            
         # Handle size classes
-        size_map = {
-            'xs': 12,
-            'sm': 14,
-            'base': 16,
-            'lg': 18,
-            'xl': 20,
-            '2xl': 24,
-            '3xl': 30,
-            '4xl': 36,
-            '5xl': 48,
-            '6xl': 64
-        }
-        
-        if text_property in size_map:
-            return {'font_size': size_map[text_property]}
+        font_size = _FONT_SIZES.get(class_name[5:])
+        if font_size is not None:
+            return {'font_size': font_size}
             
-        return {}
+        return _EMPTY_STYLES
         
-    def parse_border_class(self, class_name: str) -> Dict[str, Any]:
+    def parse_border_class(self, class_name: str) -> Mapping[str, Any]:
         """Parse border classes"""
-        # Remove 'border-' prefix
-        border_property = class_name[7:]
-        
         # Handle color classes
-        if border_property in ['red', 'blue', 'green', 'yellow', 'purple', 'pink', 'gray', 'black', 'white']:
-            color = self.utilities.get_color(border_property)
-            return {'border_color': color}
-        elif '-' in border_property:
-            color_base, intensity = border_property.split('-', 1)
-            if color_base in ['red', 'blue', 'green', 'yellow', 'purple', 'pink', 'gray']:
-                color = self.utilities.get_color(color_base, intensity)
-                return {'border_color': color}
-                
+        styles = self.parse_color_class(class_name)
+        if styles:
+            return styles
+            
         # Handle width classes
-        width_map = {
-            '0': 0,
-            '1': 1,
-            '2': 2,
-            '4': 4,
-            '8': 8
-        }
-        
-        if border_property in width_map:
-            return {'border_width': width_map[border_property]}
+        border_width = _BORDER_WIDTHS.get(class_name[7:])
+        if border_width is not None:
+            return {'border_width': border_width}
             
-        return {}
+        return _EMPTY_STYLES
         
-    def parse_padding_class(self, class_name: str) -> Dict[str, Any]:
+    def parse_padding_class(self, class_name: str) -> Mapping[str, Any]:
         """Parse padding classes"""
         # Handle different padding formats
         if class_name.startswith('p-'):
@@ -147,26 +192,13 @@ class StyleParser:
         else:
             value = class_name[8:]  # padding-
             
-        padding_map = {
-            '0': 0,
-            '1': 4,
-            '2': 8,
-            '3': 12,
-            '4': 16,
-            '5': 20,
-            '6': 24,
-            '8': 32,
-            '10': 40,
-            '12': 48,
-            '16': 64
-        }
-        
-        if value in padding_map:
-            return {'padding': padding_map[value]}
+        padding = _SPACING.get(value)
+        if padding is not None:
+            return {'padding': padding}
             
-        return {}
+        return _EMPTY_STYLES
         
-    def parse_margin_class(self, class_name: str) -> Dict[str, Any]:
+    def parse_margin_class(self, class_name: str) -> Mapping[str, Any]:
         """Parse margin classes"""
         # Handle different margin formats
         if class_name.startswith('m-'):
@@ -174,56 +206,39 @@ class StyleParser:
         else:
             value = class_name[7:]  # margin-
             
-        margin_map = {
-            '0': 0,
-            '1': 4,
-            '2': 8,
-            '3': 12,
-            '4': 16,
-            '5': 20,
-            '6': 24,
-            '8': 32,
-            '10': 40,
-            '12': 48,
-            '16': 64
-        }
-        
-        if value in margin_map:
-            return {'margin': margin_map[value]}
+        margin = _SPACING.get(value)
+        if margin is not None:
+            return {'margin': margin}
             
-        return {}
+        return _EMPTY_STYLES
         
-    def parse_width_class(self, class_name: str) -> Dict[str, Any]:
+    def parse_width_class(self, class_name: str) -> Mapping[str, Any]:
         """Parse width classes"""
         # Implementation for width classes
-        return {}
+        return _EMPTY_STYLES
         
-    def parse_height_class(self, class_name: str) -> Dict[str, Any]:
+    def parse_height_class(self, class_name: str) -> Mapping[str, Any]:
         """Parse height classes"""
         # Implementation for height classes
-        return {}
+        return _EMPTY_STYLES
         
-    def parse_display_class(self, class_name: str) -> Dict[str, Any]:
+    def parse_display_class(self, class_name: str) -> Mapping[str, Any]:
         """Parse display classes"""
         return {'display': class_name}
         
-    def parse_flex_class(self, class_name: str) -> Dict[str, Any]:
+    def parse_flex_class(self, class_name: str) -> Mapping[str, Any]:
         """Parse flex classes"""
         # Implementation for flex classes
-        return {}
+        return _EMPTY_STYLES
         
-    def parse_border_radius_class(self, class_name: str) -> Dict[str, Any]:
+    def parse_border_radius_class(self, class_name: str) -> Mapping[str, Any]:
         """Parse border radius classes"""
-        radius_map = {
-            'rounded': 4,
-            'rounded-sm': 2,
-            'rounded-md': 6,
-            'rounded-lg': 8,
-            'rounded-xl': 12,
-            'rounded-full': 9999
-        }
-        
-        if class_name in radius_map:
-            return {'border_radius': radius_map[class_name]}
+        border_radius = _BORDER_RADII.get(class_name)
+        if border_radius is not None:
+            return {'border_radius': border_radius}
             
-        return {}
\ No newline at end of file
+        return _EMPTY_STYLES
+
+
+# One parser shared by every component; it holds no per-component state
+DEFAULT_PARSER = StyleParser()
@@ -4,11 +4,89 @@ Style and Theme classes for ModernGUI
 from typing import Dict, Any, Optional, Tuple
 
 
+# Default colors
+_DEFAULT_COLORS = {
+    'primary': (0.23, 0.45, 1.0, 1.0),
+    'secondary': (0.51, 0.51, 0.51, 1.0),
+    'success': (0.23, 1.0, 0.24, 1.0),
+    'warning': (1.0, 1.0, 0.23, 1.0),
+    'error': (1.0, 0.24, 0.24, 1.0),
+    'info': (0.23, 0.45, 1.0, 1.0),
+    'background': (0.1, 0.1, 0.1, 1.0),
+    'surface': (0.2, 0.2, 0.2, 1.0),
+    'text': (1.0, 1.0, 1.0, 1.0),
+    'text_secondary': (0.7, 0.7, 0.7, 1.0)
+}
+
+# Default spacing
+_DEFAULT_SPACING = {
+    'xs': 4,
+    'sm': 8,
+    'md': 16,
+    'lg': 24,
+    'xl': 32,
+    '2xl': 48,
+    '3xl': 64
+}
+
+# Default typography
+_DEFAULT_TYPOGRAPHY = {
+    'xs': {'size': 12, 'weight': 'normal'},
+    'sm': {'size': 14, 'weight': 'normal'},
+    'base': {'size': 16, 'weight': 'normal'},
+    'lg': {'size': 18, 'weight': 'normal'},
+    'xl': {'size': 20, 'weight': 'normal'},
+    '2xl': {'size': 24, 'weight': 'normal'},
+    '3xl': {'size': 30, 'weight': 'normal'},
+    '4xl': {'size': 36, 'weight': 'normal'},
+    '5xl': {'size': 48, 'weight': 'normal'},
+    '6xl': {'size': 64, 'weight': 'normal'}
+}
+
+# Default border radius
+_DEFAULT_BORDER_RADIUS = {
+    'none': 0,
+    'sm': 2,
+    'md': 4,
+    'lg': 8,
+    'xl': 12,
+    '2xl': 16,
+    '3xl': 24,
+    'full': 9999
+}
+
+# Default shadows
+_DEFAULT_SHADOWS = {
+    'sm': {'blur': 2, 'color': (0, 0, 0, 0.1)},
+    'md': {'blur': 4, 'color': (0, 0, 0, 0.15)},
+    'lg': {'blur': 8, 'color': (0, 0, 0, 0.2)},
+    'xl': {'blur': 16, 'color': (0, 0, 0, 0.25)}
+}
+
+# Color overrides applied by the predefined themes
+_DARK_THEME_COLORS = {
+    'background': (0.1, 0.1, 0.1, 1.0),
+    'surface': (0.2, 0.2, 0.2, 1.0),
+    'text': (1.0, 1.0, 1.0, 1.0),
+    'text_secondary': (0.7, 0.7, 0.7, 1.0)
+}
+
+_LIGHT_THEME_COLORS = {
+    'background': (1.0, 1.0, 1.0, 1.0),
+    'surface': (0.95, 0.95, 0.95, 1.0),
+    'text': (0.1, 0.1, 0.1, 1.0),
+    'text_secondary': (0.4, 0.4, 0.4, 1.0)
+}
+
+
 class Style:
     """Represents a collection of style properties"""
     
-    def __init__(self, **properties):
-        self.properties = properties
+    __slots__ = ('properties',)
+    
+    def __init__(self, properties: Optional[Dict[str, Any]] = None, **kwargs):
+        # Copy a given dict so later set() calls don't write through to the caller's
+        self.properties = dict(properties) if properties is not None else kwargs
         
     def get(self, key: str, default: Any = None) -> Any:
         """Get a style property"""
@@ -24,9 +102,15 @@ class Style:
         
     def merge(self, other_style: 'Style') -> 'Style':
         """Create a new style by merging with another style"""
-        new_properties = self.properties.copy()
-        new_properties.update(other_style.properties)
-        return Style(**new_properties)
+        merged = Style.__new__(Style)
+        merged.properties = self.properties | other_style.properties
+        return merged
+        
+    def get_state(self, state: str) -> 'Style':
+        """Get the properties set for a state such as 'hover' or 'focus', without the prefix"""
+        prefix = state + ':'
+        return Style({key[len(prefix):]: value for key, value in self.properties.items()
+                      if key.startswith(prefix)})
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert style to dictionary"""
@@ -53,64 +137,13 @@ class Theme:
         
     def _set_defaults(self):
         """Set default theme values"""
-        # Default colors
-        self.colors = {
-            'primary': (0.23, 0.45, 1.0, 1.0),
-            'secondary': (0.51, 0.51, 0.51, 1.0),
-            'success': (0.23, 1.0, 0.24, 1.0),
-            'warning': (1.0, 1.0, 0.23, 1.0),
-            'error': (1.0, 0.24, 0.24, 1.0),
-            'info': (0.23, 0.45, 1.0, 1.0),
-            'background': (0.1, 0.1, 0.1, 1.0),
-            'surface': (0.2, 0.2, 0.2, 1.0),
-            'text': (1.0, 1.0, 1.0, 1.0),
-            'text_secondary': (0.7, 0.7, 0.7, 1.0)
-        }
-        
-        # Default spacing
-        self.spacing = {
-            'xs': 4,
-            'sm': 8,
-            'md': 16,
-            'lg': 24,
-            'xl': 32,
-            '2xl': 48,
-            '3xl': 64
-        }
-        
-        # Default typography
-        self.typography = {
-            'xs': {'size': 12, 'weight': 'normal'},
-            'sm': {'size': 14, 'weight': 'normal'},
-            'base': {'size': 16, 'weight': 'normal'},
-            'lg': {'size': 18, 'weight': 'normal'},
-            'xl': {'size': 20, 'weight': 'normal'},
-            '2xl': {'size': 24, 'weight': 'normal'},
-            '3xl': {'size': 30, 'weight': 'normal'},
-            '4xl': {'size': 36, 'weight': 'normal'},
-            '5xl': {'size': 48, 'weight': 'normal'},
-            '6xl': {'size': 64, 'weight': 'normal'}
-        }
-        
-        # Default border radius
-        self.border_radius = {
-            'none': 0,
-            'sm': 2,
-            'md': 4,
-            'lg': 8,
-            'xl': 12,
-            '2xl': 16,
-            '3xl': 24,
-            'full': 9999
-        }
-        
-        # Default shadows
-        self.shadows = {
-            'sm': {'blur': 2, 'color': (0, 0, 0, 0.1)},
-            'md': {'blur': 4, 'color': (0, 0, 0, 0.15)},
-            'lg': {'blur': 8, 'color': (0, 0, 0, 0.2)},
-            'xl': {'blur': 16, 'color': (0, 0, 0, 0.25)}
-        }
+        # Copies of the module defaults; nested settings dicts are copied too
+        # so themes never share mutable state
+        self.colors = _DEFAULT_COLORS.copy()
+        self.spacing = _DEFAULT_SPACING.copy()
+        self.typography = {name: settings.copy() for name, settings in _DEFAULT_TYPOGRAPHY.items()}
+        self.border_radius = _DEFAULT_BORDER_RADIUS.copy()
+        self.shadows = {name: settings.copy() for name, settings in _DEFAULT_SHADOWS.items()}
         
     def get_color(self, color_name: str) -> Tuple[float, float, float, float]:
         """Get a color from the theme"""
@@ -172,22 +205,12 @@ class Theme:
 def create_dark_theme() -> Theme:
     """Create a dark theme"""
     theme = Theme('dark')
-    theme.colors.update({
-        'background': (0.1, 0.1, 0.1, 1.0),
-        'surface': (0.2, 0.2, 0.2, 1.0),
-        'text': (1.0, 1.0, 1.0, 1.0),
-        'text_secondary': (0.7, 0.7, 0.7, 1.0)
-    })
+    theme.colors.update(_DARK_THEME_COLORS)
     return theme
 
 
 def create_light_theme() -> Theme:
     """Create a light theme"""
     theme = Theme('light')
-    theme.colors.update({
-        'background': (1.0, 1.0, 1.0, 1.0),
-        'surface': (0.95, 0.95, 0.95, 1.0),
-        'text': (0.1, 0.1, 0.1, 1.0),
-        'text_secondary': (0.4, 0.4, 0.4, 1.0)
-    })
+    theme.colors.update(_LIGHT_THEME_COLORS)
     return theme
\ No newline at end of file
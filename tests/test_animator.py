@@ -0,0 +1,66 @@
+"""
+Tests for the Animator
+"""
+from pulse_ui.animation.animator import Animator
+from pulse_ui.core.component import Component
+from pulse_ui.core.context import Context
+
+
+class Box(Component):
+    """Component that draws nothing"""
+    
+    def render(self, renderer):
+        pass
+
+
+def make_box():
+    box = Box()
+    box.set_context(Context())
+    box.context.dirty = False
+    return box
+
+
+def test_animation_keeps_the_frame_redrawing_until_it_completes():
+    box = make_box()
+    animator = Animator(fps=0)
+    animator.animate(box, 'x', 100, duration=60.0)
+    assert box.context.needs_redraw()
+    
+    animator.stop_all()
+    box.context.dirty = False
+    assert not box.context.needs_redraw()
+
+
+def test_animated_writes_mark_the_context_dirty():
+    box = make_box()
+    animator = Animator(fps=0)
+    animator.animate(box, 'x', 100, duration=0.0)
+    animator.update()
+    assert box.x == 100
+    assert box.context.dirty
+    assert not animator.animations
+    
+    box.context.dirty = False
+    assert not box.context.needs_redraw()
+
+
+class WatchedBox(Box):
+    """Box that records attribute writes made by name"""
+    
+    __slots__ = ('named_writes',)
+    
+    def __setattr__(self, name, value):
+        if name != 'named_writes' and hasattr(self, 'named_writes'):
+            self.named_writes.append(name)
+        super().__setattr__(name, value)
+
+
+def test_update_writes_through_the_bound_setters():
+    box = WatchedBox()
+    box.named_writes = []
+    animator = Animator(fps=0)
+    animator.animate(box, 'x', 100, duration=0.0)
+    animator.animate_multiple(box, {'y': 50, 'width': 20}, duration=0.0)
+    animator.update()
+    assert (box.x, box.y, box.width) == (100, 50, 20)
+    assert box.named_writes == []
@@ -0,0 +1,67 @@
+"""
+Tests for the basic components
+"""
+from pulse_ui.animation.animator import Animator
+from pulse_ui.components.basic import Container
+from pulse_ui.core.colors import pack_color
+
+
+class RecordingRenderer:
+    """Collects the quads and borders a component pushes"""
+    
+    def __init__(self):
+        self.quads = []
+        self.borders = []
+        
+    def push_quad(self, x, y, width, height, color, blur=0.0):
+        self.quads.append((x, y, width, height, color))
+        
+    def render_border(self, x, y, width, height, border_width, color):
+        self.borders.append((x, y, width, height, border_width, color))
+
+
+def make_container():
+    container = Container()
+    container.set_geometry(10, 20, 100, 50)
+    container.background_color = (1.0, 0.0, 0.0, 1.0)
+    return container
+
+
+def test_container_draws_animated_background_color():
+    container = make_container()
+    start = container.background_color
+    end = (0.0, 0.0, 1.0, 1.0)
+    
+    # Step the color the way a transition does, with a plain attribute write per frame
+    for step in range(5):
+        k = step / 4
+        color = tuple(a + (b - a) * k for a, b in zip(start, end))
+        container.background_color = color
+        renderer = RecordingRenderer()
+        container.render(renderer)
+        assert renderer.quads == [(10, 20, 100, 50, pack_color(color))]
+
+
+def test_container_follows_direct_style_writes():
+    container = make_container()
+    container.render(RecordingRenderer())
+    
+    container.margin = 5
+    container.border_width = 2
+    container.border_color = (1.0, 1.0, 1.0, 1.0)
+    renderer = RecordingRenderer()
+    container.render(renderer)
+    assert renderer.quads == [(15, 25, 90, 40, pack_color((1.0, 0.0, 0.0, 1.0)))]
+    assert renderer.borders == [(15, 25, 90, 40, 2, pack_color((1.0, 1.0, 1.0, 1.0)))]
+
+
+def test_container_follows_animated_position():
+    container = make_container()
+    container.render(RecordingRenderer())
+    
+    animator = Animator(fps=0)
+    animator.animate(container, 'x', 60, duration=0.0)
+    animator.update()
+    renderer = RecordingRenderer()
+    container.render(renderer)
+    assert renderer.quads[0][0] == 60
@@ -0,0 +1,29 @@
+"""
+Tests for the chart components
+"""
+import numpy as np
+from pulse_ui.visualization.charts import BarChart, LineChart
+
+
+def test_invalidate_picks_up_in_place_edits():
+    chart = LineChart(data=[(0, 0), (1, 1)])
+    version = chart.fingerprint()
+    chart.data.append((2, 4))
+    chart.invalidate()
+    assert chart._points.tolist() == [[0, 0], [1, 1], [2, 4]]
+    assert chart.fingerprint() != version
+
+
+def test_assigning_data_reconverts_it():
+    chart = BarChart(data=[("a", 1), ("b", 2)])
+    chart.data = [("a", 3)]
+    assert chart._labels == ["a"]
+    assert chart._values.tolist() == [3.0]
+
+
+def test_epoch_second_x_values_keep_their_spacing():
+    chart = LineChart(data=[(1.7e9 + second, second) for second in range(4)])
+    chart.chart_width, chart.chart_height = 300, 100
+    screen = chart._to_screen(chart._points)
+    assert screen.dtype == np.float32
+    assert screen[:, 0].tolist() == [50.0, 150.0, 250.0, 350.0]
@@ -0,0 +1,98 @@
+"""
+Tests for the Component base class
+"""
+from pulse_ui.components.layout import Row
+from pulse_ui.core.component import Component
+from pulse_ui.core.context import Context
+
+
+class Box(Component):
+    """Component that draws nothing"""
+    
+    def render(self, renderer):
+        pass
+
+
+class Ticking(Box):
+    """Component that counts its lifecycle calls and ticks"""
+    
+    def __init__(self, **props):
+        super().__init__(**props)
+        self.mounts = 0
+        self.unmounts = 0
+        self.ticks = 0
+        
+    def component_did_mount(self):
+        self.mounts += 1
+        
+    def component_will_unmount(self):
+        self.unmounts += 1
+        
+    def on_tick(self, dt):
+        self.ticks += 1
+
+
+def make_root():
+    root = Box()
+    root.set_context(Context())
+    return root
+
+
+def test_removed_component_ticks_again_when_added_back():
+    root = make_root()
+    child = Ticking()
+    root.add_child(child)
+    root.update()
+    assert root.context._tickers == [child]
+    
+    root.remove_child(child)
+    assert root.context._tickers == []
+    assert (child.mounted, child.unmounts) == (False, 1)
+    
+    root.add_child(child)
+    root.update()
+    assert root.context._tickers == [child]
+    assert child.mounts == 2
+    
+    root.context.tick(0.016)
+    assert child.ticks == 1
+
+
+def test_removing_a_subtree_unmounts_every_descendant():
+    root = make_root()
+    parent = Box()
+    grandchild = Ticking()
+    parent.add_child(grandchild)
+    root.add_child(parent)
+    root.update()
+    
+    root.remove_child(parent)
+    assert not parent.mounted
+    assert grandchild.unmounts == 1
+    assert root.context._tickers == []
+
+
+def test_batch_updates_only_defers_layout_in_its_own_tree():
+    batched = Row()
+    other = Row()
+    other.add_child(Box())
+    with batched.batch_updates():
+        batched.add_child(Box())
+        other.update()
+        assert not other._layout_dirty
+        
+        batched.update()
+        assert batched._layout_dirty
+    assert not batched._layout_dirty
+
+
+def test_nested_batch_lays_out_when_the_outer_block_exits():
+    root = Row()
+    inner = Row()
+    root.add_child(inner)
+    root.update()
+    with root.batch_updates():
+        with inner.batch_updates():
+            inner.add_child(Box())
+        assert inner._layout_dirty
+    assert not inner._layout_dirty
@@ -0,0 +1,38 @@
+"""
+Tests for DataTable
+"""
+from pulse_ui.visualization.data_table import DataTable
+
+
+def test_mixed_column_keeps_each_cell_as_given():
+    table = DataTable(data=[{'v': 1}, {'v': 2.5}, {'v': True}])
+    assert [table.get_cell_text(i, 'v') for i in range(3)] == ['1', '2.5', 'True']
+    assert [type(table.get_cell(i, 'v')) for i in range(3)] == [int, float, bool]
+
+
+def test_single_type_columns_return_python_values():
+    table = DataTable(data=[{'n': 3, 'f': 0.5, 'b': False}, {'n': 1, 'f': 2.0, 'b': True}],
+                      columns=['n', 'f', 'b'])
+    assert table.get_row(0) == {'n': 3, 'f': 0.5, 'b': False}
+    assert type(table.get_cell(0, 'n')) is int
+    assert table.get_cell_text(1, 'b') == 'True'
+    
+    table.sort_by_column(0)
+    assert [table.get_cell(i, 'n') for i in range(2)] == [1, 3]
+
+
+def test_sequence_valued_column():
+    rows = [{'tags': ['a', 'b']}, {'tags': ['c']}, {'tags': ('d', 'e', 'f')}]
+    table = DataTable(data=rows, columns=['tags'])
+    assert table.get_cell(0, 'tags') == ['a', 'b']
+    assert table.get_cell_text(2, 'tags') == "('d', 'e', 'f')"
+    
+    # Lists and tuples don't compare with each other, so sorting falls back to text
+    table.sort_by_column(0)
+    assert [table.get_cell_text(i, 'tags') for i in range(3)] == ["('d', 'e', 'f')", "['a', 'b']", "['c']"]
+
+
+def test_integers_beyond_int64_are_kept():
+    table = DataTable(data=[{'n': 2 ** 70}, {'n': 1}])
+    assert table.get_cell(0, 'n') == 2 ** 70
+    assert table.get_cell_text(0, 'n') == str(2 ** 70)
@@ -0,0 +1,73 @@
+"""
+Tests for the plot components
+"""
+import numpy as np
+from pulse_ui.visualization.plots import DataPlot, PointRing
+
+
+class LineRecorder:
+    """Records render_lines() calls and ignores every other draw"""
+    
+    def __init__(self):
+        self.lines = []
+        
+    def render_lines(self, points, color, width):
+        self.lines.append(np.array(points))
+        
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def make_plot():
+    plot = DataPlot()
+    plot.set_geometry(0, 0, 300, 200)
+    plot.component_did_mount()
+    return plot
+
+
+def render_lines(plot):
+    renderer = LineRecorder()
+    plot.render(renderer)
+    return renderer.lines
+
+
+def test_list_series_edited_in_place_is_redrawn():
+    plot = make_plot()
+    data = [(0.0, 0.0), (1.0, 1.0), (2.0, 0.0)]
+    plot.add_series('window', data)
+    before = render_lines(plot)
+    
+    # A sliding window keeps the length but changes every point
+    data.pop(0)
+    data.append((3.0, 1.0))
+    after = render_lines(plot)
+    
+    fresh = make_plot()
+    fresh.add_series('window', list(data))
+    assert not np.allclose(before[0], after[0])
+    assert np.allclose(after[0], render_lines(fresh)[0])
+
+
+def test_read_only_array_series_follows_the_view():
+    plot = make_plot()
+    data = np.array([(0.0, 0.0), (1.0, 1.0), (2.0, 0.0)])
+    data.flags.writeable = False
+    plot.add_series('static', data)
+    first = render_lines(plot)
+    assert np.allclose(first[0], render_lines(plot)[0])
+    
+    plot.pan_x += 0.5
+    assert not np.allclose(first[0], render_lines(plot)[0])
+
+
+def test_point_ring_extremes_stay_bounded_without_reading_extent():
+    ring = PointRing(100)
+    for i in range(10000):
+        ring.append(float(i), float(-i))
+        
+    # Rising x and falling y keep every point monotonic, so only eviction bounds them
+    for extremes in ring._low + ring._high:
+        assert len(extremes) <= 100
+    low, high = ring.extent()
+    assert low.tolist() == [9900.0, -9999.0]
+    assert high.tolist() == [9999.0, -9900.0]
@@ -0,0 +1,67 @@
+"""
+Tests for the pre-defined transitions
+"""
+import pytest
+from pulse_ui.animation.animator import Animator
+from pulse_ui.animation.transitions import Transition
+from pulse_ui.components.basic import Container
+
+
+class Target:
+    """Plain object with the properties transitions animate"""
+    
+    def __init__(self):
+        self.x = 50.0
+        self.scale_x = 1.0
+        self.scale_y = 1.0
+
+
+def value_at(animation, target, name, seconds):
+    """Apply the animation at 'seconds' into its run and read the property back"""
+    animation.apply(min(seconds / animation.duration, 1.0))
+    return getattr(target, name)
+
+
+def test_shake_moves_every_tenth_of_a_second():
+    target = Target()
+    animation = Transition(Animator()).shake(target, intensity=10.0)
+    assert animation.duration == pytest.approx(0.4)
+    
+    # Right, hold, left, then back to center
+    expected = [(0.1, 60.0), (0.2, 60.0), (0.3, 40.0), (0.4, 50.0)]
+    for seconds, x in expected:
+        assert value_at(animation, target, 'x', seconds) == pytest.approx(x)
+
+
+def test_rubber_band_spans_seven_tenths_of_the_duration():
+    target = Target()
+    scale_x, scale_y = Transition(Animator()).rubber_band(target, duration=1.0)
+    assert scale_x.duration == pytest.approx(0.7)
+    
+    # Stage ends at 0.3, 0.5, 0.6 and 0.7 of the duration
+    expected = [(0.3, 1.25, 0.75), (0.5, 0.95, 1.05), (0.6, 1.05, 0.95), (0.7, 1.0, 1.0)]
+    for seconds, x, y in expected:
+        assert value_at(scale_x, target, 'scale_x', seconds) == pytest.approx(x)
+        assert value_at(scale_y, target, 'scale_y', seconds) == pytest.approx(y)
+
+
+@pytest.mark.parametrize('method, finals', [
+    ('fade_in', {'opacity': 1.0}),
+    ('scale_in', {'scale_x': 1.0, 'scale_y': 1.0}),
+    ('pop_in', {'scale_x': 1.0, 'scale_y': 1.0}),
+    ('rotate_in', {'rotation': 0.0}),
+    ('flip_in_x', {'rotation_x': 0.0}),
+    ('flip_in_y', {'rotation_y': 0.0}),
+])
+def test_transitions_run_on_components(method, finals):
+    container = Container()
+    animations = getattr(Transition(Animator()), method)(container)
+    if not isinstance(animations, list):
+        animations = [animations]
+        
+    # Each property starts away from its final value and lands on it
+    for animation in animations:
+        assert animation._setter is not None
+        animation.update(animation.start_time + animation.duration)
+    for name, value in finals.items():
+        assert getattr(container, name) == pytest.approx(value)
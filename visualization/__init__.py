@@ -3,8 +3,9 @@ Visualization components for ModernGUI - Charts, graphs, and data visualization
 """
 
 from .charts import Chart, LineChart, BarChart, PieChart, ScatterChart
-from .plots import Plot, DataPlot, RealTimePlot
+from .plots import Plot, DataPlot, RealTimePlot, PointRing
 from .data_table import DataTable
+from ._kernels import fill_sin_wave
 
 __all__ = [
     "Chart",
@@ -15,5 +16,7 @@ __all__ = [
     "Plot",
     "DataPlot",
     "RealTimePlot",
-    "DataTable"
+    "PointRing",
+    "DataTable",
+    "fill_sin_wave"
 ]
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+Numeric kernels for chart data, compiled with Numba when it is installed
+"""
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is an optional accelerator
+    njit = None
+
+
+def fill_sin_wave(out, t0, dt, amplitude, phase=0.0, offset=0.0):
+    """Fill 'out' with offset + amplitude * sin(t0 + i * dt + phase) for each index i"""
+    out[:] = offset + amplitude * np.sin(t0 + np.arange(out.shape[0]) * dt + phase)
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def fill_sin_wave(out, t0, dt, amplitude, phase=0.0, offset=0.0):
+        for i in range(out.shape[0]):
+            out[i] = offset + amplitude * math.sin(t0 + i * dt + phase)
+
+
+def lttb_indices(points, n_out):
+    """Pick 'n_out' of an (N, 2) polyline's points with Largest-Triangle-Three-Buckets
+    
+    Returns the kept indices in order; the first and last points are always kept.
+    """
+    n = points.shape[0]
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[n_out - 1] = n - 1
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        # Average of the next bucket is the triangle's third corner
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x, avg_y = points[avg_start:avg_end].mean(axis=0)
+        
+        # Keep the point in this bucket that makes the largest triangle
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        ax, ay = points[a]
+        bucket = points[start:end]
+        areas = np.abs((ax - avg_x) * (bucket[:, 1] - ay) - (ax - bucket[:, 0]) * (avg_y - ay))
+        a = start + int(np.argmax(areas))
+        out[i + 1] = a
+    return out
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def lttb_indices(points, n_out):
+        n = points.shape[0]
+        if n_out >= n or n_out < 3:
+            return np.arange(n)
+        out = np.empty(n_out, dtype=np.int64)
+        out[0] = 0
+        out[n_out - 1] = n - 1
+        every = (n - 2) / (n_out - 2)
+        a = 0
+        for i in range(n_out - 2):
+            avg_start = int((i + 1) * every) + 1
+            avg_end = min(int((i + 2) * every) + 1, n)
+            avg_x = 0.0
+            avg_y = 0.0
+            for j in range(avg_start, avg_end):
+                avg_x += points[j, 0]
+                avg_y += points[j, 1]
+            avg_x /= avg_end - avg_start
+            avg_y /= avg_end - avg_start
+            
+            start = int(i * every) + 1
+            end = int((i + 1) * every) + 1
+            ax = points[a, 0]
+            ay = points[a, 1]
+            best = start
+            max_area = -1.0
+            for j in range(start, end):
+                area = abs((ax - avg_x) * (points[j, 1] - ay) - (ax - points[j, 0]) * (avg_y - ay))
+                if area > max_area:
+                    max_area = area
+                    best = j
+            a = best
+            out[i + 1] = a
+        return out
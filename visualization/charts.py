@@ -2,16 +2,47 @@
 Chart components for data visualization
 """
 import numpy as np
-from typing import List, Tuple, Dict, Any, Optional
+from typing import Tuple, Optional
 from ..core.component import Component
-from ..styling.parser import StyleParser
+from ._kernels import lttb_indices
+
+
+def _as_points(data) -> np.ndarray:
+    """Convert (x, y) pairs or an (N, 2) array to an (N, 2) float64 array
+    
+    Kept in float64 so large coordinates such as epoch seconds stay exact;
+    only the screen coordinates are narrowed to float32.
+    """
+    return np.asarray(data, dtype=np.float64).reshape(-1, 2)
+
+
+def _as_bars(data) -> Tuple[list, np.ndarray]:
+    """Convert bar data to (labels, float32 values)
+    
+    Accepts a (labels, values) pair, (label, value) tuples or bare values.
+    """
+    if isinstance(data, tuple) and len(data) == 2 and isinstance(data[1], np.ndarray):
+        labels, values = data
+        return list(labels), np.asarray(values, dtype=np.float32)
+    if len(data) and isinstance(data[0], tuple):
+        return [item[0] for item in data], np.array([item[1] for item in data], dtype=np.float32)
+    values = np.asarray(data, dtype=np.float32).reshape(-1)
+    return [str(i) for i in range(len(values))], values
 
 
 class Chart(Component):
     """Base chart component"""
     
+    __slots__ = (
+        'title', 'x_label', 'y_label', '_data', 'background_color', 'border_color',
+        'grid_color', 'text_color', 'chart_margin', 'chart_width', 'chart_height', '_grid',
+        '_data_version'
+    )
+    
     def __init__(self, **props):
         super().__init__(**props)
+        # Bumped on every data assignment so fingerprints can tell new data apart cheaply
+        self._data_version = 0
         self.data = props.get('data', [])
         self.title = props.get('title', '')
         self.x_label = props.get('x_label', '')
@@ -28,37 +59,99 @@ class Chart(Component):
         self.chart_width = 0
         self.chart_height = 0
         
+        # Gridline rects with the geometry they were laid out for
+        self._grid = None
+        
+    @property
+    def data(self):
+        """The chart's data as it was given
+        
+        It is converted to arrays when assigned, so assign new data, or call
+        invalidate() after editing it in place, for the chart to show the change.
+        """
+        return self._data
+        
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self.invalidate()
+        
+    def invalidate(self):
+        """Reconvert the current data, e.g. after it was edited in place"""
+        self._data_version += 1
+        self._prepare_data(self._data)
+        self.needs_update = True
+        if self.context:
+            self.context.dirty = True
+            
+    def _prepare_data(self, data):
+        """Convert new data to the arrays render() uses - override in subclasses"""
+        pass
+        
+    def _to_screen(self, points: np.ndarray, extent: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> np.ndarray:
+        """Scale (N, 2) data points to screen coordinates inside the chart area
+        
+        The data range defaults to that of 'points'; pass 'extent' as (low, high)
+        to scale a subset of the data the same way as the whole.
+        """
+        low, high = extent if extent is not None else (points.min(axis=0), points.max(axis=0))
+        # Avoid division by zero
+        span = np.maximum(high - low, 1)
+        
+        # Fold the range, chart size and Y flip into one scale and offset per axis,
+        # so the whole transform is a multiply and an add
+        scale = np.array((self.chart_width, -self.chart_height)) / span
+        offset = np.array((self.x + self.chart_margin,
+                           self.y + self.chart_margin + self.chart_height)) - low * scale
+        screen = points * scale
+        screen += offset
+        return screen.astype(np.float32)
+        
     def component_did_mount(self):
         """Calculate chart dimensions when mounted"""
         self.chart_width = self.width - 2 * self.chart_margin
         self.chart_height = self.height - 2 * self.chart_margin
         
+    def fingerprint(self) -> Optional[tuple]:
+        """Summarize what render() draws"""
+        return (self.x, self.y, self.width, self.height, self.chart_margin, self.chart_width,
+                self.chart_height, self.background_color, self.border_color, self.grid_color,
+                self.text_color, self.title, self._data_version)
+        
     def render_background(self, renderer):
         """Render chart background"""
         # Render background
         renderer.render_rectangle(self.x, self.y, self.width, self.height, self.background_color)
         
         # Render border
-        renderer.render_rectangle(self.x, self.y, self.width, 2, self.border_color)
-        renderer.render_rectangle(self.x, self.y + self.height - 2, self.width, 2, self.border_color)
-        renderer.render_rectangle(self.x, self.y, 2, self.height, self.border_color)
-        renderer.render_rectangle(self.x + self.width - 2, self.y, 2, self.height, self.border_color)
+        renderer.render_border(self.x, self.y, self.width, self.height, 2, self.border_color)
         
     def render_grid(self, renderer, x_divisions: int = 10, y_divisions: int = 10):
         """Render chart grid"""
+        # The gridlines only move when the chart does, so lay them out once per geometry
+        key = (self.x, self.y, self.chart_margin, self.chart_width, self.chart_height, x_divisions, y_divisions)
+        if self._grid is None or self._grid[0] != key:
+            self._grid = (key, self._grid_rects(x_divisions, y_divisions))
+        renderer.push_quads(self._grid[1], self.grid_color)
+        
+    def _grid_rects(self, x_divisions: int, y_divisions: int) -> np.ndarray:
+        """Lay out the vertical, then horizontal, gridlines as one (N, 4) rect array"""
         chart_x = self.x + self.chart_margin
         chart_y = self.y + self.chart_margin
         
-        # Vertical grid lines
-        for i in range(x_divisions + 1):
-            x_pos = chart_x + (self.chart_width * i / x_divisions)
-            renderer.render_rectangle(x_pos, chart_y, 1, self.chart_height, self.grid_color)
-            
-        # Horizontal grid lines
-        for i in range(y_divisions + 1):
-            y_pos = chart_y + (self.chart_height * i / y_divisions)
-            renderer.render_rectangle(chart_x, y_pos, self.chart_width, 1, self.grid_color)
-            
+        rects = np.empty((x_divisions + y_divisions + 2, 4), dtype=np.float32)
+        vertical = rects[:x_divisions + 1]
+        vertical[:, 0] = chart_x + self.chart_width * np.arange(x_divisions + 1) / x_divisions
+        vertical[:, 1] = chart_y
+        vertical[:, 2] = 1
+        vertical[:, 3] = self.chart_height
+        horizontal = rects[x_divisions + 1:]
+        horizontal[:, 0] = chart_x
+        horizontal[:, 1] = chart_y + self.chart_height * np.arange(y_divisions + 1) / y_divisions
+        horizontal[:, 2] = self.chart_width
+        horizontal[:, 3] = 1
+        return rects
+        
     def render_title(self, renderer):
         """Render chart title"""
         if self.title:
@@ -76,6 +169,8 @@ class Chart(Component):
 class LineChart(Chart):
     """Line chart component"""
     
+    __slots__ = ('line_color', 'line_width', 'show_points', 'point_radius', '_points', '_decimated')
+    
     def __init__(self, **props):
         super().__init__(**props)
         self.line_color = props.get('line_color', (0.23, 0.45, 1.0, 1.0))
@@ -83,110 +178,97 @@ class LineChart(Chart):
         self.point_radius = props.get('point_radius', 3)
         self.show_points = props.get('show_points', True)
         
+    def fingerprint(self) -> Optional[tuple]:
+        """Summarize what render() draws"""
+        return super().fingerprint() + (self.line_color, self.line_width, self.show_points, self.point_radius)
+        
     def render(self, renderer):
         """Render line chart"""
         super().render(renderer)
         
-        if not self.data or len(self.data) < 2:
+        if len(self._points) < 2:
             return
             
-        chart_x = self.x + self.chart_margin
-        chart_y = self.y + self.chart_margin
-        
-        # Find data range
-        x_values = [point[0] for point in self.data]
-        y_values = [point[1] for point in self.data]
-        
-        x_min, x_max = min(x_values), max(x_values)
-        y_min, y_max = min(y_values), max(y_values)
-        
-        # Avoid division by zero
-        x_range = max(x_max - x_min, 1)
-        y_range = max(y_max - y_min, 1)
-        
         # Convert data points to screen coordinates
-        screen_points = []
-        for x, y in self.data:
-            screen_x = chart_x + ((x - x_min) / x_range) * self.chart_width
-            screen_y = chart_y + self.chart_height - ((y - y_min) / y_range) * self.chart_height
-            screen_points.append((screen_x, screen_y))
-            
+        points = self._points
+        screen_points = self._to_screen(self._visible_points(), (points.min(axis=0), points.max(axis=0)))
+        
         # Render lines between points
-        for i in range(len(screen_points) - 1):
-            x1, y1 = screen_points[i]
-            x2, y2 = screen_points[i + 1]
-            
-            # Simple line rendering (in a full implementation, use proper line rendering)
-            dx = x2 - x1
-            dy = y2 - y1
-            steps = max(abs(dx), abs(dy))
-            
-            if steps > 0:
-                for j in range(int(steps)):
-                    t = j / steps
-                    x = x1 + t * dx
-                    y = y1 + t * dy
-                    renderer.render_rectangle(x, y, self.line_width, self.line_width, self.line_color)
-                    
+        renderer.render_lines(screen_points, self.line_color, self.line_width)
+        
         # Render points
         if self.show_points:
-            for x, y in screen_points:
-                renderer.render_circle(x, y, self.point_radius, self.line_color)
+            renderer.render_points(screen_points, self.point_radius, self.line_color)
+                
+    def _visible_points(self) -> np.ndarray:
+        """Get the points to draw, thinned with LTTB to about one per horizontal pixel"""
+        width = int(self.chart_width)
+        if len(self._points) <= width or width < 3:
+            return self._points
+        # Reuse the last decimation until the data or the chart width changes
+        if self._decimated is None or self._decimated[0] != width:
+            self._decimated = (width, self._points[lttb_indices(self._points, width)])
+        return self._decimated[1]
+        
+    def _prepare_data(self, data):
+        """Keep the points as a float64 array"""
+        self._points = _as_points(data)
+        self._decimated = None
 
 
 class BarChart(Chart):
     """Bar chart component"""
     
+    __slots__ = ('bar_color', 'bar_spacing', '_labels', '_values')
+    
     def __init__(self, **props):
         super().__init__(**props)
         self.bar_color = props.get('bar_color', (0.23, 0.45, 1.0, 1.0))
         self.bar_spacing = props.get('bar_spacing', 5)
         
+    def fingerprint(self) -> Optional[tuple]:
+        """Summarize what render() draws"""
+        return super().fingerprint() + (self.bar_color, self.bar_spacing)
+        
     def render(self, renderer):
         """Render bar chart"""
         super().render(renderer)
         
-        if not self.data:
+        values = self._values
+        if not len(values):
             return
             
         chart_x = self.x + self.chart_margin
         chart_y = self.y + self.chart_margin
         
         # Calculate bar dimensions
-        bar_count = len(self.data)
+        bar_count = len(values)
         available_width = self.chart_width - (bar_count - 1) * self.bar_spacing
         bar_width = available_width / bar_count
         
         # Find data range
-        if isinstance(self.data[0], tuple):
-            values = [point[1] for point in self.data]
-        else:
-            values = self.data
-            
-        max_value = max(values) if values else 1
-        min_value = min(values) if values else 0
-        value_range = max(max_value - min_value, 1)
-        
-        # Render bars
-        for i, item in enumerate(self.data):
-            if isinstance(item, tuple):
-                label, value = item
-            else:
-                value = item
-                label = str(i)
-                
-            # Calculate bar position and height
-            bar_x = chart_x + i * (bar_width + self.bar_spacing)
-            bar_height = ((value - min_value) / value_range) * self.chart_height
-            bar_y = chart_y + self.chart_height - bar_height
-            
-            # Render bar
-            renderer.render_rectangle(bar_x, bar_y, bar_width, bar_height, self.bar_color)
+        min_value = values.min()
+        value_range = max(values.max() - min_value, 1)
+        
+        # Lay out every bar at once and render them as one batch
+        bar_heights = ((values - min_value) / value_range) * self.chart_height
+        rects = np.empty((bar_count, 4), dtype=np.float32)
+        rects[:, 0] = chart_x + np.arange(bar_count) * (bar_width + self.bar_spacing)
+        rects[:, 1] = chart_y + self.chart_height - bar_heights
+        rects[:, 2] = bar_width
+        rects[:, 3] = bar_heights
+        renderer.push_quads(rects, self.bar_color)
+        
+    def _prepare_data(self, data):
+        """Split the data into labels and a float32 value array"""
+        self._labels, self._values = _as_bars(data)
 
 
 class PieChart(Chart):
     """Pie chart component"""
     
+    __slots__ = ('colors', '_labels', '_slice_ends', '_slice_colors')
+    
     def __init__(self, **props):
         super().__init__(**props)
         self.colors = props.get('colors', [
@@ -198,11 +280,15 @@ class PieChart(Chart):
             (1.0, 0.24, 0.45, 1.0)   # Pink
         ])
         
+    def fingerprint(self) -> Optional[tuple]:
+        """Summarize what render() draws"""
+        return super().fingerprint() + (self.colors,)
+        
     def render(self, renderer):
         """Render pie chart"""
         super().render(renderer)
         
-        if not self.data:
+        if self._slice_ends is None:
             return
             
         # Calculate center and radius
@@ -210,73 +296,59 @@ class PieChart(Chart):
         center_y = self.y + self.height // 2
         radius = min(self.chart_width, self.chart_height) // 2 - 20
         
-        # Calculate total value
-        if isinstance(self.data[0], tuple):
-            values = [item[1] for item in self.data]
-        else:
-            values = self.data
-            
-        total_value = sum(values)
+        # Every slice is shaded on the GPU from its end angle
+        renderer.render_pie(center_x, center_y, radius, self._slice_ends, self._colors_for_slices())
         
-        if total_value == 0:
+    def _colors_for_slices(self) -> np.ndarray:
+        """Get the (N, 4) float32 color of each slice, cycling through 'colors'
+        
+        Kept until the data or the colors list is replaced; assign a new list
+        rather than editing it in place to recolor the chart.
+        """
+        count = len(self._slice_ends)
+        cached = self._slice_colors
+        if cached is None or cached[0] is not self.colors or len(cached[1]) != count:
+            palette = np.asarray(self.colors, dtype=np.float32).reshape(-1, 4)
+            cached = self._slice_colors = (self.colors, palette[np.arange(count) % len(palette)])
+        return cached[1]
+        
+    def _prepare_data(self, data):
+        """Precompute the cumulative end angle of each slice"""
+        self._slice_colors = None
+        self._labels, values = _as_bars(data)
+        total_value = values.sum(dtype=np.float64)
+        if not len(values) or total_value == 0:
+            self._slice_ends = None
             return
             
-        # Render pie slices
-        current_angle = 0
-        for i, item in enumerate(self.data):
-            if isinstance(item, tuple):
-                label, value = item
-            else:
-                value = item
-                label = str(i)
-                
-            # Calculate slice angle
-            slice_angle = (value / total_value) * 360
-            
-            # Get color
-            color = self.colors[i % len(self.colors)]
-            
-            # Render slice (simplified - in full implementation use proper arc rendering)
-            # For now, just render a rectangle to indicate the slice
-            slice_x = center_x + radius * np.cos(np.radians(current_angle))
-            slice_y = center_y + radius * np.sin(np.radians(current_angle))
-            renderer.render_rectangle(slice_x - 10, slice_y - 10, 20, 20, color)
-            
-            current_angle += slice_angle
+        # Each slice ends where its share of the full turn, added to the previous ones, ends
+        self._slice_ends = (np.cumsum(values, dtype=np.float64) / total_value * (2 * np.pi)).astype(np.float32)
 
 
 class ScatterChart(Chart):
     """Scatter plot chart component"""
     
+    __slots__ = ('point_color', 'point_radius', '_points')
+    
     def __init__(self, **props):
         super().__init__(**props)
         self.point_color = props.get('point_color', (0.23, 0.45, 1.0, 1.0))
         self.point_radius = props.get('point_radius', 4)
         
+    def fingerprint(self) -> Optional[tuple]:
+        """Summarize what render() draws"""
+        return super().fingerprint() + (self.point_color, self.point_radius)
+        
     def render(self, renderer):
         """Render scatter chart"""
         super().render(renderer)
         
-        if not self.data:
+        if not len(self._points):
             return
             
-        chart_x = self.x + self.chart_margin
-        chart_y = self.y + self.chart_margin
-        
-        # Find data range
-        x_values = [point[0] for point in self.data]
-        y_values = [point[1] for point in self.data]
-        
-        x_min, x_max = min(x_values), max(x_values)
-        y_min, y_max = min(y_values), max(y_values)
-        
-        # Avoid division by zero
-        x_range = max(x_max - x_min, 1)
-        y_range = max(y_max - y_min, 1)
-        
         # Render points
-        for x, y in self.data:
-            screen_x = chart_x + ((x - x_min) / x_range) * self.chart_width
-            screen_y = chart_y + self.chart_height - ((y - y_min) / y_range) * self.chart_height
+        renderer.render_points(self._to_screen(self._points), self.point_radius, self.point_color)
             
-            renderer.render_circle(screen_x, screen_y, self.point_radius, self.point_color)
\ No newline at end of file
+    def _prepare_data(self, data):
+        """Keep the points as a float64 array"""
+        self._points = _as_points(data)
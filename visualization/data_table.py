@@ -1,18 +1,74 @@
 """
 Data table component for displaying tabular data
 """
-from typing import List, Dict, Any, Optional, Callable
+import numpy as np
+from itertools import accumulate
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from ..core.component import Component
-from ..styling.parser import StyleParser
+
+
+# Python scalar types stored as numeric arrays; bool stays separate from int
+_NUMERIC_DTYPES = {bool: np.bool_, int: np.int64, float: np.float64}
+
+
+def _column_array(values: list) -> np.ndarray:
+    """Store a column that holds only one Python numeric type as a numeric array
+    
+    Anything else (mixed types, strings, sequences) becomes an object array of the
+    values as they are, so cells keep their own type and formatting.
+    """
+    types = set(map(type, values))
+    dtype = _NUMERIC_DTYPES.get(types.pop()) if len(types) == 1 else None
+    if dtype is not None:
+        try:
+            return np.array(values, dtype=dtype)
+        except OverflowError:
+            pass  # Integers beyond int64 stay Python ints
+            
+    # Fill element by element so sequence values aren't broadcast into extra dimensions
+    array = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        array[i] = value
+    return array
+
+
+def _cell_value(values: np.ndarray, index: int) -> Any:
+    """Get one stored cell as a Python value"""
+    value = values[index]
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _rows_to_columns(rows: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Turn row dicts into one array per column, filling missing cells with ''"""
+    keys = dict.fromkeys(key for row in rows for key in row)
+    return {key: _column_array([row.get(key, '') for row in rows]) for key in keys}
 
 
 class DataTable(Component):
     """Data table component for displaying tabular data"""
     
+    __slots__ = (
+        'columns', 'headers', 'formatters', '_data', '_source_rows', '_table', '_display',
+        '_row_count', '_order', '_sort_cache', '_column_layout', '_data_version',
+        'row_height', 'header_height', 'cell_padding',
+        'header_background', 'row_background', 'alternate_row_background',
+        'selected_row_background', 'border_color', 'text_color', 'selectable',
+        'sortable', 'selected_row', 'sort_column', 'sort_ascending', 'scroll_y',
+        'on_row_select', 'on_sort'
+    )
+    
     def __init__(self, **props):
         super().__init__(**props)
-        self.data = props.get('data', [])
         self.columns = props.get('columns', [])
+        # Column name -> callable turning a cell value into its display string
+        self.formatters: Dict[str, Callable[[Any], str]] = props.get('formatters', {})
+        # Bumped on every data load so fingerprints can tell new data apart cheaply
+        self._data_version = 0
+        columns_data = props.get('columns_data')
+        if columns_data is not None:
+            self.set_columns_data(columns_data, props.get('columns'))
+        else:
+            self.data = props.get('data', [])
         self.headers = props.get('headers', [])
         
         # Table styling
@@ -30,6 +86,9 @@ class DataTable(Component):
         self.sortable = props.get('sortable', True)
         self.selectable = props.get('selectable', True)
         
+        # (table width, column count) and the column widths and left edge offsets for it
+        self._column_layout = None
+        
         # State
         self.selected_row = -1
         self.sort_column = -1
@@ -40,6 +99,19 @@ class DataTable(Component):
         self.on_row_select: Optional[Callable] = props.get('on_row_select')
         self.on_sort: Optional[Callable] = props.get('on_sort')
         
+    @property
+    def data(self) -> List[Dict[str, Any]]:
+        """The table's rows as dicts, in display order"""
+        if self._data is None:
+            self._data = [self.get_row(i) for i in range(self._row_count)]
+        return self._data
+        
+    @data.setter
+    def data(self, data: List[Dict[str, Any]]):
+        self._data = data
+        self._source_rows = list(data)
+        self._load_columns(_rows_to_columns(data), len(data))
+        
     def set_data(self, data: List[Dict[str, Any]], columns: Optional[List[str]] = None):
         """Set table data"""
         self.data = data
@@ -48,6 +120,49 @@ class DataTable(Component):
         elif data and isinstance(data[0], dict):
             self.columns = list(data[0].keys())
             
+    def set_columns_data(self, columns_data: Dict[str, Any], columns: Optional[List[str]] = None):
+        """Set table data as one equal-length sequence or array per column"""
+        table = {key: values if isinstance(values, np.ndarray) else _column_array(list(values))
+                 for key, values in columns_data.items()}
+        # Row dicts are only built if something asks for them
+        self._data = None
+        self._source_rows = None
+        self._load_columns(table, len(next(iter(table.values()))) if table else 0)
+        self.columns = columns or list(table.keys())
+        
+    def _load_columns(self, table: Dict[str, np.ndarray], row_count: int):
+        """Store new column arrays and format every cell for display once"""
+        self._table = table
+        self._data_version += 1
+        self._row_count = row_count
+        self._order = None
+        self._sort_cache = {}
+        self._display = {}
+        for key, values in table.items():
+            formatter = self.formatters.get(key, str)
+            self._display[key] = [formatter(value) for value in values.tolist()]
+            
+    def _source_index(self, row_index: int) -> int:
+        """Map a displayed row to its position in the loaded data"""
+        return row_index if self._order is None else self._order[row_index]
+        
+    def get_row(self, row_index: int) -> Dict[str, Any]:
+        """Get one row as a dict"""
+        if self._data is not None:
+            return self._data[row_index]
+        source = self._source_index(row_index)
+        return {key: _cell_value(values, source) for key, values in self._table.items()}
+        
+    def get_cell(self, row_index: int, column: str) -> Any:
+        """Get one cell value, or '' if the column has no data"""
+        values = self._table.get(column)
+        return '' if values is None else _cell_value(values, self._source_index(row_index))
+        
+    def get_cell_text(self, row_index: int, column: str) -> str:
+        """Get one cell's preformatted display string"""
+        texts = self._display.get(column)
+        return '' if texts is None else texts[self._source_index(row_index)]
+        
     def set_headers(self, headers: List[str]):
         """Set column headers"""
         self.headers = headers
@@ -62,16 +177,28 @@ class DataTable(Component):
         column_count = len(self.columns)
         return available_width // column_count if column_count > 0 else 100
         
+    def column_layout(self) -> Tuple[List[int], List[int]]:
+        """Get each column's width and left edge offset from the table's left edge
+        
+        Recomputed only when the table width or the number of columns changes.
+        """
+        key = (self.width, len(self.columns))
+        if self._column_layout is None or self._column_layout[0] != key:
+            widths = [self.get_column_width(i) for i in range(len(self.columns))]
+            offsets = list(accumulate(widths[:-1], initial=0))
+            self._column_layout = (key, widths, offsets)
+        return self._column_layout[1], self._column_layout[2]
+        
     def get_visible_rows(self) -> range:
         """Get the range of visible rows based on scroll position"""
-        if not self.data:
+        if not self._row_count:
             return range(0, 0)
             
         table_height = self.height - self.header_height
         visible_row_count = table_height // self.row_height
         
         start_row = max(0, self.scroll_y // self.row_height)
-        end_row = min(len(self.data), start_row + visible_row_count + 1)
+        end_row = min(self._row_count, start_row + visible_row_count + 1)
         
         return range(start_row, end_row)
         
@@ -91,20 +218,20 @@ class DataTable(Component):
                 relative_y = mouse_y - self.y - self.header_height + self.scroll_y
                 clicked_row = int(relative_y // self.row_height)
                 
-                if 0 <= clicked_row < len(self.data):
+                if 0 <= clicked_row < self._row_count:
                     self.selected_row = clicked_row
                     if self.on_row_select:
-                        self.on_row_select(clicked_row, self.data[clicked_row])
+                        self.on_row_select(clicked_row, self.get_row(clicked_row))
                         
         elif event_type == 'mouse_wheel':
             # Scroll table
             scroll_amount = -event_data.y * self.row_height
-            max_scroll = max(0, len(self.data) * self.row_height - (self.height - self.header_height))
+            max_scroll = max(0, self._row_count * self.row_height - (self.height - self.header_height))
             self.scroll_y = max(0, min(max_scroll, self.scroll_y + scroll_amount))
             
     def sort_by_column(self, column_index: int):
         """Sort table by column"""
-        if not self.sortable or not self.data or column_index >= len(self.columns):
+        if not self.sortable or not self._row_count or column_index >= len(self.columns):
             return
             
         column_key = self.columns[column_index]
@@ -117,22 +244,44 @@ class DataTable(Component):
             
         self.sort_column = column_index
         
-        # Sort data
-        try:
-            self.data.sort(
-                key=lambda row: row.get(column_key, ''),
-                reverse=not self.sort_ascending
-            )
-        except TypeError:
-            # Handle mixed types by converting to string
-            self.data.sort(
-                key=lambda row: str(row.get(column_key, '')),
-                reverse=not self.sort_ascending
-            )
+        # Sort data, reusing the permutation if this column and direction were sorted before
+        order = self._sort_cache.get((column_key, self.sort_ascending))
+        if order is None:
+            keys = self._table.get(column_key)
+            if keys is None:
+                keys = np.full(self._row_count, '', dtype=object)
+            try:
+                order = self._sort_order(keys)
+            except TypeError:
+                # Handle mixed types by converting to string
+                order = self._sort_order(np.array([str(key) for key in keys], dtype=str))
+            self._sort_cache[(column_key, self.sort_ascending)] = order
+        self._order = order
+        
+        # Reorder the row dicts in place if there are any
+        if self._source_rows is not None:
+            self._data[:] = [self._source_rows[i] for i in order.tolist()]
+        else:
+            self._data = None
             
         if self.on_sort:
             self.on_sort(column_index, self.sort_ascending)
             
+    def _sort_order(self, keys: np.ndarray) -> np.ndarray:
+        """Get the stable sort permutation of 'keys' for the current direction"""
+        if self.sort_ascending:
+            return np.argsort(keys, kind='stable')
+        # Descending while keeping equal keys in their loaded order
+        return len(keys) - 1 - np.argsort(keys[::-1], kind='stable')[::-1]
+        
+    def fingerprint(self) -> Optional[tuple]:
+        """Summarize what render() draws"""
+        return (self.x, self.y, self.width, self.height, self._data_version, tuple(self.columns),
+                tuple(self.headers), self.sort_column, self.sort_ascending, self.scroll_y,
+                self.selected_row, self.row_height, self.header_height, self.cell_padding,
+                self.header_background, self.row_background, self.alternate_row_background,
+                self.selected_row_background, self.border_color, self.text_color)
+        
     def render(self, renderer):
         """Render the data table"""
         # Render table background
@@ -157,9 +306,10 @@ class DataTable(Component):
         # Render column headers
         current_x = self.x
         headers = self.headers if self.headers else self.columns
+        widths, _ = self.column_layout()
         
         for i, header in enumerate(headers):
-            column_width = self.get_column_width(i)
+            column_width = widths[i] if i < len(widths) else self.get_column_width(i)
             
             # Render header text
             text_x = current_x + self.cell_padding
@@ -177,55 +327,56 @@ class DataTable(Component):
     def render_rows(self, renderer):
         """Render table rows"""
         visible_rows = self.get_visible_rows()
-        
-        for row_index in visible_rows:
-            row_data = self.data[row_index]
-            row_y = self.y + self.header_height + (row_index * self.row_height) - self.scroll_y
-            
-            # Skip rows that are not visible
-            if row_y + self.row_height < self.y or row_y > self.y + self.height:
-                continue
-                
-            # Determine row background color
-            if row_index == self.selected_row:
-                bg_color = self.selected_row_background
-            elif row_index % 2 == 0:
-                bg_color = self.row_background
-            else:
-                bg_color = self.alternate_row_background
-                
-            # Render row background
-            renderer.render_rectangle(self.x, row_y, self.width, self.row_height, bg_color)
+        if not visible_rows:
+            return
             
-            # Render cells
-            current_x = self.x
-            for i, column in enumerate(self.columns):
-                column_width = self.get_column_width(i)
-                
-                # Get cell value
-                cell_value = row_data.get(column, '')
+        # Lay out every visible row at once; get_visible_rows() already clips to the table
+        row_indices = np.arange(visible_rows.start, visible_rows.stop)
+        row_ys = self.y + self.header_height + row_indices * self.row_height - self.scroll_y
+        
+        # Render row backgrounds, one batch write per background color. Partly scrolled
+        # rows are cut to the table body here, which keeps them in the shared batch
+        # where a scissor rect would need draws of their own
+        body_top = self.y + self.header_height
+        tops = np.maximum(row_ys, body_top)
+        bottoms = np.minimum(row_ys + self.row_height, self.y + self.height)
+        rects = np.empty((len(row_ys), 4), dtype=np.float32)
+        rects[:, 0] = self.x
+        rects[:, 1] = tops
+        rects[:, 2] = self.width
+        rects[:, 3] = np.maximum(bottoms - tops, 0)
+        selected = row_indices == self.selected_row
+        even = (row_indices % 2 == 0) & ~selected
+        renderer.push_quads(rects[even], self.row_background)
+        renderer.push_quads(rects[~even & ~selected], self.alternate_row_background)
+        renderer.push_quads(rects[selected], self.selected_row_background)
+        
+        # Resolve each column's text list and x position once, outside the cell loop
+        _, offsets = self.column_layout()
+        cell_columns = tuple((self.x + offset + self.cell_padding, self._display.get(column))
+                             for column, offset in zip(self.columns, offsets))
+        sources = row_indices if self._order is None else self._order[row_indices]
+        
+        # Render cells
+        for source, row_y in zip(sources.tolist(), row_ys.tolist()):
+            text_y = row_y + self.cell_padding
+            for text_x, texts in cell_columns:
+                # Get the preformatted cell text
+                cell_text = '' if texts is None else texts[source]
                 
                 # Render cell text
-                text_x = current_x + self.cell_padding
-                text_y = row_y + self.cell_padding
-                # renderer.render_text(str(cell_value), text_x, text_y, self.text_color)
-                
-                current_x += column_width
+                # renderer.render_text(cell_text, text_x, text_y, self.text_color)
                 
     def render_borders(self, renderer):
         """Render table borders"""
         # Outer border
-        renderer.render_rectangle(self.x, self.y, self.width, 1, self.border_color)
-        renderer.render_rectangle(self.x, self.y + self.height - 1, self.width, 1, self.border_color)
-        renderer.render_rectangle(self.x, self.y, 1, self.height, self.border_color)
-        renderer.render_rectangle(self.x + self.width - 1, self.y, 1, self.height, self.border_color)
+        renderer.render_border(self.x, self.y, self.width, self.height, 1, self.border_color)
         
-        # Header separator
-        renderer.render_rectangle(self.x, self.y + self.header_height, self.width, 1, self.border_color)
-        
-        # Column separators
-        current_x = self.x
-        for i in range(len(self.columns)):
-            current_x += self.get_column_width(i)
+        # Header separator, then the column separators inside the table
+        widths, offsets = self.column_layout()
+        separators = [(self.x, self.y + self.header_height, self.width, 1)]
+        for width, offset in zip(widths, offsets):
+            current_x = self.x + offset + width
             if current_x < self.x + self.width:
-                renderer.render_rectangle(current_x, self.y, 1, self.height, self.border_color)
\ No newline at end of file
+                separators.append((current_x, self.y, 1, self.height))
+        renderer.push_quads(separators, self.border_color)
\ No newline at end of file
@@ -2,15 +2,106 @@
 Advanced plotting components for real-time and interactive data visualization
 """
 import time
+from collections import deque
 import numpy as np
 from typing import List, Tuple, Dict, Any, Optional, Callable
-from ..core.component import Component
 from .charts import Chart
 
 
+def _push_extremes(low: deque, high: deque, number: int, value: float, oldest: int):
+    """Add a value to a window's monotonic minimum and maximum deques"""
+    # Values the new one beats can never be the window's extreme again
+    while low and low[-1][1] >= value:
+        low.pop()
+    low.append((number, value))
+    while high and high[-1][1] <= value:
+        high.pop()
+    high.append((number, value))
+    
+    # Drop extremes that belong to points the ring has since overwritten
+    while low[0][0] < oldest:
+        low.popleft()
+    while high[0][0] < oldest:
+        high.popleft()
+
+
+class PointRing:
+    """Fixed-capacity (x, y) buffer that overwrites its oldest point once full
+    
+    Points live in one preallocated (capacity, 2) float64 array, so appending
+    never allocates or shifts memory. The window's extent is tracked as points
+    arrive, so reading it doesn't rescan the buffer.
+    """
+    
+    __slots__ = ('_points', '_cursor', '_count', '_appended', '_low', '_high')
+    
+    def __init__(self, capacity: int):
+        self._points = np.zeros((max(capacity, 1), 2), dtype=np.float64)
+        self._cursor = 0
+        self._count = 0
+        
+        # Per axis, (append number, value) pairs in monotonic order: the front of
+        # each deque is the minimum or maximum of the points still stored
+        self._appended = 0
+        self._low = (deque(), deque())
+        self._high = (deque(), deque())
+        
+    def append(self, x: float, y: float):
+        """Add a point, replacing the oldest one if the buffer is full"""
+        cursor = self._cursor
+        self._points[cursor] = (x, y)
+        cursor += 1
+        self._cursor = 0 if cursor == len(self._points) else cursor
+        if self._count < len(self._points):
+            self._count += 1
+            
+        number = self._appended
+        self._appended = number + 1
+        oldest = self._appended - self._count
+        _push_extremes(self._low[0], self._high[0], number, float(x), oldest)
+        _push_extremes(self._low[1], self._high[1], number, float(y), oldest)
+        
+    def points(self) -> np.ndarray:
+        """Get the points oldest first as an (N, 2) array"""
+        if self._count < len(self._points):
+            return self._points[:self._count]
+        cursor = self._cursor
+        return np.concatenate((self._points[cursor:], self._points[:cursor]))
+        
+    def views(self) -> Tuple[np.ndarray, ...]:
+        """Get the stored points as one or two array views, oldest first, without copying"""
+        if self._count < len(self._points) or not self._cursor:
+            return (self._points[:self._count],)
+        cursor = self._cursor
+        return (self._points[cursor:], self._points[:cursor])
+        
+    @property
+    def appended(self) -> int:
+        """Total number of points ever appended, which changes whenever the contents do"""
+        return self._appended
+        
+    def extent(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the per-axis (minimum, maximum) of the stored points"""
+        low_x, low_y = self._low
+        high_x, high_y = self._high
+        return (np.array((low_x[0][1], low_y[0][1])),
+                np.array((high_x[0][1], high_y[0][1])))
+        
+    def __len__(self) -> int:
+        return self._count
+        
+    def __iter__(self):
+        return iter(map(tuple, self.points().tolist()))
+
+
 class Plot(Chart):
     """Advanced plotting component with zooming and panning"""
     
+    __slots__ = (
+        'zoom_x', 'zoom_y', 'pan_x', 'pan_y', 'is_dragging', 'last_mouse_pos',
+        'axis_color', 'tick_color', '_transform'
+    )
+    
     def __init__(self, **props):
         super().__init__(**props)
         self.zoom_x = 1.0
@@ -24,6 +115,13 @@ class Plot(Chart):
         self.axis_color = (0.7, 0.7, 0.7, 1.0)
         self.tick_color = (0.5, 0.5, 0.5, 1.0)
         
+        # Data-to-screen scale and offset with the view they were built for
+        self._transform = None
+        
+    def fingerprint(self) -> Optional[tuple]:
+        """Plots can't be summarized: pan, zoom and series data change in place"""
+        return None
+        
     def handle_mouse_event(self, event_type: str, event_data):
         """Handle mouse events for interaction"""
         if event_type == 'mouse_down':
@@ -89,11 +187,30 @@ class Plot(Chart):
         screen_y = chart_y + (1.0 - norm_y) * self.chart_height  # Flip Y
         
         return screen_x, screen_y
+        
+    def screen_transform(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the data-to-screen transform as per-axis (scale, offset) arrays
+        
+        Equivalent to data_to_screen_coords() folded into one multiply-add, so
+        (N, 2) points convert as 'points * scale + offset'.
+        """
+        key = (self.x, self.y, self.chart_margin, self.chart_width, self.chart_height,
+               self.zoom_x, self.zoom_y, self.pan_x, self.pan_y)
+        if self._transform is None or self._transform[0] != key:
+            # Rebuilt only when the view or geometry changes
+            scale_x = self.zoom_x * self.chart_width
+            scale_y = -self.zoom_y * self.chart_height  # Flip Y
+            offset_x = self.x + self.chart_margin + (0.5 - self.pan_x * self.zoom_x) * self.chart_width
+            offset_y = self.y + self.chart_margin + (0.5 + self.pan_y * self.zoom_y) * self.chart_height
+            self._transform = (key, np.array((scale_x, scale_y)), np.array((offset_x, offset_y)))
+        return self._transform[1], self._transform[2]
 
 
 class DataPlot(Plot):
     """Data plotting component with multiple series support"""
     
+    __slots__ = ('series', 'series_colors')
+    
     def __init__(self, **props):
         super().__init__(**props)
         self.series = props.get('series', [])  # List of data series
@@ -135,108 +252,167 @@ class DataPlot(Plot):
         if len(data) < 2:
             return
             
-        # Convert data points to screen coordinates
-        screen_points = []
-        for x, y in data:
-            screen_x, screen_y = self.data_to_screen_coords(x, y)
-            screen_points.append((screen_x, screen_y))
+        # Reuse the screen points from the last frame while neither the view nor the data moved.
+        # Only rings (which count their appends) and read-only arrays can tell; lists and
+        # writable arrays may be edited in place, so they are converted every frame
+        scale, offset = self.screen_transform()
+        if isinstance(data, PointRing):
+            version = data.appended
+        elif isinstance(data, np.ndarray) and not data.flags.writeable:
+            version = 0
+        else:
+            version = None
             
+        cached = series.get('_screen') if version is not None else None
+        if cached is not None and cached[0] is self._transform and cached[1] is data and cached[2] == version:
+            runs = cached[3]
+        else:
+            runs = self._screen_runs(data, scale, offset)
+            if version is not None:
+                series['_screen'] = (self._transform, data, version, runs)
+                
         # Render lines between points
-        for i in range(len(screen_points) - 1):
-            x1, y1 = screen_points[i]
-            x2, y2 = screen_points[i + 1]
+        for screen_points in runs:
+            renderer.render_lines(screen_points, color, 2)
             
-            # Simple line rendering
-            dx = x2 - x1
-            dy = y2 - y1
-            steps = max(abs(dx), abs(dy))
+    def _screen_runs(self, data, scale: np.ndarray, offset: np.ndarray) -> List[np.ndarray]:
+        """Convert series data to the screen-space polylines render_series() draws"""
+        # Rings are drawn straight from their storage, as two runs once they wrap
+        if isinstance(data, PointRing):
+            runs = data.views()
+        else:
+            runs = (np.asarray(data, dtype=np.float64).reshape(-1, 2),)
             
-            if steps > 0:
-                for j in range(int(steps)):
-                    t = j / steps
-                    x = x1 + t * dx
-                    y = y1 + t * dy
-                    renderer.render_rectangle(x, y, 2, 2, color)
+        screen_runs = []
+        for points in runs:
+            # Convert every data point to screen coordinates with one multiply-add
+            screen_points = points * scale
+            screen_points += offset
+            if screen_runs:
+                # Join the end of the older run to the start of the newer one
+                screen_points = np.concatenate((screen_runs[-1][-1:], screen_points))
+            screen_runs.append(screen_points)
+        return screen_runs
 
 
 class RealTimePlot(DataPlot):
     """Real-time plotting component for streaming data"""
     
+    __slots__ = (
+        'max_points', 'update_interval', 'last_update', 'data_callback', 'real_time_data',
+        'auto_scale', '_latest', '_rescale'
+    )
+    
     def __init__(self, **props):
         super().__init__(**props)
         self.max_points = props.get('max_points', 1000)
         self.update_interval = props.get('update_interval', 0.1)  # seconds
-        self.last_update = time.time()
+        self.last_update = time.perf_counter()
         self.data_callback: Optional[Callable] = props.get('data_callback')
         self.auto_scale = props.get('auto_scale', True)
         
-        # Real-time data storage
-        self.real_time_data: Dict[str, List[Tuple[float, float]]] = {}
+        # Real-time data storage, holding the latest max_points points per series
+        self.real_time_data: Dict[str, PointRing] = {}
+        
+        # Newest pushed (x, y) per series, waiting for the next tick
+        self._latest: Dict[str, Tuple[float, float]] = {}
         
-    def add_real_time_series(self, name: str, color: Optional[Tuple[float, float, float, float]] = None):
-        """Add a real-time data series"""
-        self.real_time_data[name] = []
+        # Set when points arrived since the scale was last fitted
+        self._rescale = False
+        
+    def add_real_time_series(self, name: str, color: Optional[Tuple[float, float, float, float]] = None) -> Callable[[float, float], None]:
+        """Add a real-time data series
+        
+        Returns push(x, y), which appends to this series like add_data_point()
+        but skips the lookup by name - for high-rate feeds.
+        """
+        ring = PointRing(self.max_points)
+        self.real_time_data[name] = ring
         series_data = {
             'name': name,
-            'data': self.real_time_data[name],
+            'data': ring,
             'color': color or self.series_colors[len(self.series) % len(self.series_colors)]
         }
         self.series.append(series_data)
         
+        append = ring.append
+        
+        def push(x: float, y: float):
+            append(x, y)
+            if self.auto_scale:
+                self._rescale = True
+                
+        return push
+        
     def add_data_point(self, series_name: str, x: float, y: float):
         """Add a data point to a real-time series"""
-        if series_name in self.real_time_data:
-            data_list = self.real_time_data[series_name]
-            data_list.append((x, y))
+        ring = self.real_time_data.get(series_name)
+        if ring is not None:
+            # The ring drops the oldest point itself once it holds max_points
+            ring.append(x, y)
             
-            # Limit the number of points
-            if len(data_list) > self.max_points:
-                data_list.pop(0)
-                
-            # Auto-scale if enabled
+            # Auto-scale if enabled, once per rendered frame however many points arrive
             if self.auto_scale:
-                self.update_scale()
+                self._rescale = True
                 
+    def push_data_point(self, series_name: str, x: float, y: float):
+        """Offer a point from any thread; only the newest point per series is kept until the next tick"""
+        self._latest[series_name] = (x, y)
+        
     def update_scale(self):
         """Update the plot scale to fit all data"""
-        all_x = []
-        all_y = []
-        
-        for data_list in self.real_time_data.values():
-            if data_list:
-                x_vals = [point[0] for point in data_list]
-                y_vals = [point[1] for point in data_list]
-                all_x.extend(x_vals)
-                all_y.extend(y_vals)
-                
-        if all_x and all_y:
-            x_range = max(all_x) - min(all_x)
-            y_range = max(all_y) - min(all_y)
+        extents = [ring.extent() for ring in self.real_time_data.values() if len(ring)]
+        
+        if extents:
+            x_min, y_min = np.min([low for low, _ in extents], axis=0).tolist()
+            x_max, y_max = np.max([high for _, high in extents], axis=0).tolist()
+            x_range = x_max - x_min
+            y_range = y_max - y_min
             
             if x_range > 0:
                 self.zoom_x = 0.8 / x_range
-                self.pan_x = (max(all_x) + min(all_x)) / 2
+                self.pan_x = (x_max + x_min) / 2
                 
             if y_range > 0:
                 self.zoom_y = 0.8 / y_range
-                self.pan_y = (max(all_y) + min(all_y)) / 2
+                self.pan_y = (y_max + y_min) / 2
                 
-    def update(self):
-        """Update the real-time plot"""
-        super().update()
+    def render(self, renderer):
+        """Fit the scale to any new points, then render the plot"""
+        if self._rescale:
+            self._rescale = False
+            self.update_scale()
+        super().render(renderer)
         
-        current_time = time.time()
+    def on_tick(self, dt: float):
+        """Poll the data callback once per update interval"""
+        current_time = time.perf_counter()
         if current_time - self.last_update >= self.update_interval:
+            # Take pushed points, dropping any that were superseded since the last tick
+            pending, self._latest = self._latest, {}
+            
             # Call data callback if provided
             if self.data_callback:
                 new_data = self.data_callback()
                 if new_data:
-                    for series_name, points in new_data.items():
-                        if isinstance(points, list):
-                            for x, y in points:
-                                self.add_data_point(series_name, x, y)
-                        else:
-                            x, y = points
-                            self.add_data_point(series_name, x, y)
-                            
-            self.last_update = current_time
\ No newline at end of file
+                    pending.update(new_data)
+                    
+            added = False
+            for series_name, points in pending.items():
+                ring = self.real_time_data.get(series_name)
+                if ring is None:
+                    continue
+                if isinstance(points, list):
+                    # Points older than the ring's capacity would be overwritten anyway
+                    for x, y in points[-self.max_points:]:
+                        ring.append(x, y)
+                else:
+                    x, y = points
+                    ring.append(x, y)
+                added = True
+                
+            # Rescale once for the whole tick rather than per point
+            if added and self.auto_scale:
+                self._rescale = True
+                
+            self.last_update = current_time